@@ -0,0 +1,7 @@
+"""
+End-to-end benchmarks
+Times the dashboard pages, the promo model training and the customer
+segmentation on local DuckDB builds of synthetic data at several scales
+(pipeline.synthetic + pipeline.local_engine), and keeps a JSON history to
+catch regressions. See `python -m benchmarks --help`.
+"""
@@ -0,0 +1,85 @@
+"""
+Benchmark CLI
+
+Usage:
+    python -m benchmarks                              # all suites at scales 1 and 10
+    python -m benchmarks --scales 1 10 50 --repeat 5
+    python -m benchmarks --suites pages --pages pages/2_Sales.py
+    python -m benchmarks --label "before rollups"     # tag the run in the history
+    python -m benchmarks --no-record                  # compare only, keep the history as is
+
+Exits with status 1 when a phase regressed against the recent history.
+"""
+
+import argparse
+import sys
+import time
+
+from benchmarks import history
+from benchmarks.datasets import ensure_dataset
+
+
+def print_results(results: dict):
+    phases = ["query", "transform", "render", "train", "total", "warm"]
+    print(f"\n   {'benchmark':<44}" + "".join(f"{p:>10}" for p in phases))
+    for key, values in results.items():
+        if "error" in values:
+            print(f"   {key:<44}  ✗ {values['error']}")
+            continue
+        cells = "".join(f"{values[p]:>9.3f}s" if p in values else f"{'-':>10}" for p in phases)
+        print(f"   {key:<44}{cells}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="AnyCompany end-to-end benchmarks")
+    parser.add_argument("--scales", nargs="+", type=float, default=[1.0, 10.0], help="synthetic data scales")
+    parser.add_argument("--suites", nargs="+", choices=("pages", "ml"), default=["pages", "ml"])
+    parser.add_argument("--pages", nargs="+", help="page scripts relative to streamlit/ (default all)")
+    parser.add_argument("--ml", nargs="+", choices=("promo_training", "segmentation"), help="ML benchmarks")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark, the median is kept")
+    parser.add_argument("--data-root", default=None, help="where the synthetic builds are cached")
+    parser.add_argument("--history", default=None, help="JSON history file")
+    parser.add_argument("--threshold", type=float, help="relative slowdown that counts as a regression")
+    parser.add_argument("--label", help="free text stored with the run")
+    parser.add_argument("--no-record", action="store_true", help="do not append this run to the history")
+    args = parser.parse_args(argv)
+
+    print("=" * 70)
+    print(f"BENCHMARKS – scales {', '.join(f'{s:g}' for s in args.scales)}, {args.repeat} run(s) each")
+    print("=" * 70)
+    start = time.perf_counter()
+    results = {}
+    for scale in args.scales:
+        database = ensure_dataset(scale, root=args.data_root)
+        if "pages" in args.suites:
+            from benchmarks.pages import bench_pages
+
+            for page, values in bench_pages(database, args.pages, args.repeat).items():
+                results[f"pages:{page}@{scale:g}"] = values
+        if "ml" in args.suites:
+            from benchmarks.ml import bench_ml
+
+            for name, values in bench_ml(database, args.ml, args.repeat).items():
+                results[f"ml:{name}@{scale:g}"] = values
+
+    print_results(results)
+    print(f"\n   Done in {time.perf_counter() - start:.1f}s")
+
+    regressions = history.compare(results, history.load(args.history), threshold=args.threshold)
+    if not args.no_record:
+        history.append(history.new_run(results, args.label), args.history)
+        print(f"   ✓ Recorded in {args.history or history.DEFAULT_HISTORY}")
+
+    print("\n" + "=" * 70)
+    print("REGRESSIONS")
+    print("=" * 70)
+    for r in regressions:
+        print(f"   ✗ {r['key']} {r['phase']}: {r['baseline']:.3f}s → {r['current']:.3f}s (+{r['change']:.0%})")
+    if not regressions:
+        print("   ✓ none")
+    failed = any("error" in values for values in results.values())
+    return 1 if regressions or failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
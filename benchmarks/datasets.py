@@ -0,0 +1,38 @@
+"""
+Synthetic datasets for the benchmarks: one local DuckDB build per scale,
+generated once and reused by later runs.
+"""
+
+import json
+import os
+import time
+
+from pipeline import local_engine, synthetic
+
+DEFAULT_ROOT = os.getenv(
+    "ANYCOMPANY_BENCH_DIR", os.path.join(os.path.expanduser("~"), ".cache", "anycompany", "benchmarks")
+)
+
+
+def ensure_dataset(scale: float, root=None, seed=42, log=print) -> str:
+    """Path of the DuckDB build for this scale, generating and building it if needed."""
+    folder = os.path.join(root or DEFAULT_ROOT, f"scale_{scale:g}")
+    database = os.path.join(folder, "anycompany_lab.duckdb")
+    marker = os.path.join(folder, "_built.json")
+    wanted = {"scale": scale, "seed": seed}
+
+    if os.path.exists(database) and os.path.exists(marker):
+        with open(marker) as f:
+            if json.load(f).get("dataset") == wanted:
+                return database
+
+    log(f"   Building the scale {scale:g} dataset in {folder} ...")
+    start = time.perf_counter()
+    synthetic.generate(folder, scale=scale, formats=("parquet",), seed=seed, log=lambda message: None)
+    if os.path.exists(database):
+        os.remove(database)
+    timings = local_engine.build(folder, database, log=lambda message: None)
+    with open(marker, "w") as f:
+        json.dump({"dataset": wanted, "build_seconds": sum(timings.values())}, f, indent=2)
+    log(f"   ✓ scale {scale:g} ready in {time.perf_counter() - start:.1f}s")
+    return database
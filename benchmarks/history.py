@@ -0,0 +1,90 @@
+"""
+Benchmark history (JSON) and regression checks
+Each run appends {timestamp, commit, label, machine, results} where results
+maps "suite:name@scale" to {phase: seconds}. A phase regresses when it is
+slower than the median of the last few runs on the same machine by more
+than the threshold (relative) and MIN_DELTA (absolute, to ignore noise).
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+from datetime import datetime, timezone
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_HISTORY = os.getenv("ANYCOMPANY_BENCH_HISTORY", os.path.join(REPO_ROOT, "benchmarks", "history.json"))
+
+DEFAULT_THRESHOLD = 0.20
+MIN_DELTA = 0.05
+# Phases noisier than the rest get more slack
+PHASE_THRESHOLDS = {"warm": 0.50, "render": 0.30}
+BASELINE_RUNS = 5
+
+
+def machine() -> dict:
+    return {
+        "host": platform.node(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load(path=None) -> list:
+    path = path or DEFAULT_HISTORY
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return json.load(f).get("runs", [])
+
+
+def append(run: dict, path=None):
+    path = path or DEFAULT_HISTORY
+    runs = load(path) + [run]
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({"runs": runs}, f, indent=1)
+    os.replace(tmp, path)
+
+
+def new_run(results: dict, label=None) -> dict:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "label": label,
+        "machine": machine(),
+        "results": results,
+    }
+
+
+def compare(results: dict, runs: list, threshold=None, window=BASELINE_RUNS) -> list:
+    """Regressions of `results` against the recent history of this machine."""
+    host = machine()["host"]
+    previous = [r for r in runs if r.get("machine", {}).get("host") == host]
+    regressions = []
+    for key, phases in results.items():
+        for phase, seconds in phases.items():
+            if not isinstance(seconds, (int, float)):
+                continue
+            past = [r["results"][key][phase] for r in previous if isinstance(r["results"].get(key, {}).get(phase), (int, float))]
+            if not past:
+                continue
+            baseline = statistics.median(past[-window:])
+            limit = threshold if threshold is not None else PHASE_THRESHOLDS.get(phase, DEFAULT_THRESHOLD)
+            if seconds - baseline > MIN_DELTA and seconds > baseline * (1 + limit):
+                regressions.append(
+                    {"key": key, "phase": phase, "baseline": baseline, "current": seconds, "change": seconds / baseline - 1}
+                )
+    return regressions
@@ -0,0 +1,131 @@
+"""
+ML benchmarks
+    promo_training    streamlit/ml_models/promo_optimizer.py without saving the models:
+                      query (load_training_data), transform (prepare_features), train (both models)
+    segmentation      the computation of ml/customer_segmentation.ipynb (plots excluded):
+                      query (batches), transform (per-batch RFM aggregates + scaling), train (K-Means k=2..7 + silhouette, PCA)
+"""
+
+import io
+import os
+import sys
+from contextlib import redirect_stdout
+
+from benchmarks.timing import PhaseTimer, summarize
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Same query as the notebook (streamed in batches, aggregated per customer)
+SEGMENTATION_SQL = """
+SELECT
+    ENTITY AS CUSTOMER_ID,
+    TRANSACTION_DATE,
+    AMOUNT
+FROM SILVER.FINANCIAL_TRANSACTIONS_CLEAN
+WHERE TRANSACTION_TYPE = 'Sale'
+AND ENTITY IS NOT NULL
+AND AMOUNT > 0
+"""
+BATCH_ROWS = 50_000
+
+
+def _promo_training(timer):
+    models_dir = os.path.join(REPO_ROOT, "streamlit", "ml_models")
+    if models_dir not in sys.path:
+        sys.path.insert(0, models_dir)
+    import promo_optimizer
+
+    with redirect_stdout(io.StringIO()):
+        with timer.phase("query"):
+            df = promo_optimizer.load_training_data()
+        with timer.phase("transform"):
+            X, y_clf, y_reg, _ = promo_optimizer.prepare_features(df)
+        with timer.phase("train"):
+            promo_optimizer.train_classification_model(X, y_clf)
+            promo_optimizer.train_regression_model(X, y_reg)
+
+
+def _segmentation(timer):
+    import numpy as np
+    import pandas as pd
+    from sklearn.cluster import KMeans
+    from sklearn.decomposition import PCA
+    from sklearn.metrics import silhouette_score
+    from sklearn.preprocessing import StandardScaler
+
+    from pipeline.local_engine import LocalEngine
+
+    folds = {"LastPurchase": "max", "FirstPurchase": "min", "Frequency": "sum", "Monetary": "sum"}
+    partials = []
+    engine = LocalEngine()
+    try:
+        batches = engine.stream_arrow(SEGMENTATION_SQL, BATCH_ROWS)
+        while True:
+            with timer.phase("query"):
+                batch = next(batches, None)
+            if batch is None:
+                break
+            with timer.phase("transform"):
+                df = batch.to_pandas()
+                df["TRANSACTION_DATE"] = pd.to_datetime(df["TRANSACTION_DATE"])
+                df["AMOUNT"] = df["AMOUNT"].astype(float)
+                partials.append(
+                    df.groupby("CUSTOMER_ID").agg(
+                        LastPurchase=("TRANSACTION_DATE", "max"),
+                        FirstPurchase=("TRANSACTION_DATE", "min"),
+                        Frequency=("AMOUNT", "size"),
+                        Monetary=("AMOUNT", "sum"),
+                    )
+                )
+    finally:
+        engine.close()
+
+    with timer.phase("transform"):
+        customers = pd.concat(partials).groupby(level=0).agg(folds)
+        reference_date = customers["LastPurchase"].max() + pd.Timedelta(days=1)
+        rfm = pd.DataFrame(
+            {
+                "Recency": (reference_date - customers["LastPurchase"]).dt.days,
+                "Frequency": customers["Frequency"],
+                "Monetary": customers["Monetary"],
+            }
+        )
+        rfm["AvgPurchaseValue"] = rfm["Monetary"] / rfm["Frequency"]
+        rfm["DaysSinceFirstPurchase"] = (reference_date - customers["FirstPurchase"]).dt.days
+        rfm_scaled = StandardScaler().fit_transform(rfm)
+
+    with timer.phase("train"):
+        # The notebook segments entities; there are only a handful, so cap k below their count
+        k_range = range(2, max(3, min(8, len(rfm))))
+        scores = []
+        for k in k_range:
+            labels = KMeans(n_clusters=k, random_state=42, n_init=10).fit_predict(rfm_scaled)
+            scores.append(silhouette_score(rfm_scaled, labels) if len(set(labels)) > 1 else -1.0)
+        best_k = k_range[int(np.argmax(scores))]
+        KMeans(n_clusters=best_k, random_state=42, n_init=10).fit_predict(rfm_scaled)
+        PCA(n_components=2).fit_transform(rfm_scaled)
+
+
+BENCHMARKS = {"promo_training": _promo_training, "segmentation": _segmentation}
+
+
+def bench_ml(database, names=None, repeat=3):
+    """{benchmark: {phase: median seconds}}; a failing benchmark gets {"error": message}."""
+    os.environ["ANYCOMPANY_BACKEND"] = "duckdb"
+    os.environ["ANYCOMPANY_DUCKDB_PATH"] = database
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+
+    results = {}
+    for name in names or BENCHMARKS:
+        samples = []
+        try:
+            for _ in range(repeat):
+                timer = PhaseTimer()
+                BENCHMARKS[name](timer)
+                samples.append(dict(timer.seconds, total=sum(timer.seconds.values())))
+        except (Exception, SystemExit) as exc:
+            results[name] = {"error": f"{type(exc).__name__}: {exc}".splitlines()[0]}
+            continue
+        results[name] = summarize(samples)
+    return results
@@ -0,0 +1,97 @@
+"""
+Dashboard page benchmarks
+Each streamlit/pages/*.py script runs headlessly (streamlit.testing AppTest)
+on the DuckDB backend. Per run:
+    query      time inside _utils.run_queries / run_query (backend + Arrow → pandas)
+    render     time inside st.* element calls (charts, tables, metrics...)
+    transform  the rest of the script run (pandas work and Streamlit overhead)
+    total      the whole cold run (caches cleared first)
+    warm       an immediate rerun, served from st.cache_data
+"""
+
+import glob
+import logging
+import os
+import sys
+import time
+
+from benchmarks.timing import PhaseTimer, patched, summarize
+
+STREAMLIT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "streamlit")
+PAGES = sorted(os.path.relpath(p, STREAMLIT_DIR) for p in glob.glob(os.path.join(STREAMLIT_DIR, "pages", "*.py")))
+
+RENDER_COMMANDS = (
+    "title", "header", "subheader", "caption", "markdown", "write", "text", "divider", "info", "warning",
+    "error", "success", "metric", "dataframe", "table", "json", "line_chart", "bar_chart", "area_chart",
+    "scatter_chart", "altair_chart", "plotly_chart", "vega_lite_chart", "pyplot", "columns", "tabs",
+    "expander", "download_button", "selectbox", "multiselect", "slider", "date_input", "radio", "checkbox",
+)
+
+
+def _setup(database):
+    # Must happen before _utils is imported: the backend is chosen at import time
+    os.environ["ANYCOMPANY_BACKEND"] = "duckdb"
+    os.environ["ANYCOMPANY_DISK_CACHE"] = "0"
+    os.environ["ANYCOMPANY_PREWARM"] = "0"  # no background queries during the timings
+    os.environ["ANYCOMPANY_DUCKDB_PATH"] = database
+    if STREAMLIT_DIR not in sys.path:
+        sys.path.insert(0, STREAMLIT_DIR)
+
+    import streamlit as st
+    import _dashboards  # noqa: F401 (imported here so its run_queries binding can be patched)
+    import _utils
+
+    logging.getLogger("streamlit").setLevel(logging.ERROR)  # deprecation notices would flood the report
+
+    st.cache_data.clear()
+    st.cache_resource.clear()  # drops the backend built for the previous scale
+    return st, _utils
+
+
+def _targets(st, utils):
+    from streamlit.delta_generator import DeltaGenerator
+
+    # Pages call the helpers through the modules that imported them by name
+    modules = [utils] + [sys.modules[m] for m in ("_dashboards", "_paging") if m in sys.modules]
+    targets = [(m, name, "query") for m in modules for name in ("run_queries", "run_query") if hasattr(m, name)]
+    for name in RENDER_COMMANDS:
+        if hasattr(DeltaGenerator, name):
+            targets.append((DeltaGenerator, name, "render"))  # col.metric(...), with st.expander(...)
+        if hasattr(st, name):
+            targets.append((st, name, "render"))  # st.metric(...) is bound to the main container
+    return targets
+
+
+def bench_pages(database, pages=None, repeat=3, timeout=300):
+    """{page: {phase: median seconds}}; a page that raises gets {"error": message}."""
+    from streamlit.testing.v1 import AppTest
+
+    st, utils = _setup(database)
+    timer = PhaseTimer()
+    results = {}
+    with patched(timer, _targets(st, utils)):
+        for page in pages or PAGES:
+            # Untimed first run: pays the one-off imports (altair, ...) of the page
+            AppTest.from_file(os.path.join(STREAMLIT_DIR, page), default_timeout=timeout).run()
+            samples = []
+            for _ in range(repeat):
+                st.cache_data.clear()
+                app = AppTest.from_file(os.path.join(STREAMLIT_DIR, page), default_timeout=timeout)
+                timer.reset()
+                start = time.perf_counter()
+                app.run()
+                total = time.perf_counter() - start
+                if app.exception:
+                    samples = None
+                    results[page] = {"error": app.exception[0].value.splitlines()[0]}
+                    break
+
+                sample = dict(timer.seconds, total=total)
+                sample["transform"] = max(0.0, total - sample.get("query", 0.0) - sample.get("render", 0.0))
+                start = time.perf_counter()
+                app.run()
+                sample["warm"] = time.perf_counter() - start
+                samples.append(sample)
+            if samples:
+                results[page] = summarize(samples)
+    return results
@@ -0,0 +1,63 @@
+"""
+Phase timers: wrap functions so the time spent in them is charged to a phase
+(query, render, ...). Nested timed calls are charged to the outermost one.
+"""
+
+import functools
+import statistics
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class PhaseTimer:
+    def __init__(self):
+        self.seconds = defaultdict(float)
+        self._depth = 0
+
+    def wrap(self, phase, fn):
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            if self._depth:
+                return fn(*args, **kwargs)
+            self._depth += 1
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.seconds[phase] += time.perf_counter() - start
+                self._depth -= 1
+
+        return timed
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += time.perf_counter() - start
+
+    def reset(self):
+        self.seconds.clear()
+
+
+@contextmanager
+def patched(timer, targets):
+    """targets: [(object, attribute name, phase)], restored on exit."""
+    originals = []
+    try:
+        for obj, name, phase in targets:
+            original = getattr(obj, name)
+            originals.append((obj, name, original))
+            setattr(obj, name, timer.wrap(phase, original))
+        yield timer
+    finally:
+        for obj, name, original in reversed(originals):
+            setattr(obj, name, original)
+
+
+def summarize(samples: list) -> dict:
+    """[{phase: seconds}] over the repeats -> {phase: median seconds}."""
+    phases = sorted({p for sample in samples for p in sample})
+    return {p: statistics.median(sample.get(p, 0.0) for sample in samples) for p in phases}
@@ -0,0 +1,4 @@
+"""
+SQL pipeline runners for the BRONZE → SILVER → ANALYTICS layers.
+Runs the scripts in sql/ against Snowflake without a worksheet.
+"""
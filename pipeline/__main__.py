@@ -0,0 +1,211 @@
+"""
+Pipeline CLI
+
+Usage:
+    python -m pipeline run                       # full BRONZE → SILVER → ANALYTICS/GOLD refresh
+    python -m pipeline run --parallel 8 --retries 3
+    python -m pipeline run --dry-run             # show the dependency levels, run nothing
+    python -m pipeline run --scripts phase_1/5_clean_data.sql phase_4/1_gold_rollups.sql
+    python -m pipeline incremental [--full]      # stream-based SILVER refresh
+    python -m pipeline local-build --data-dir DIR  # same build in a local DuckDB file
+    python -m pipeline generate --out DIR --scale 10 [--formats native parquet]  # synthetic source files
+    python -m pipeline features [--check] [--out FILE.parquet]  # ML_PROMO_EFFECTIVENESS in Python
+"""
+
+import argparse
+import sys
+import time
+
+from pipeline import incremental
+from pipeline.connection import load_snowflake_config
+from pipeline.dag import DEFAULT_SCRIPTS, build_plan, critical_path, levels
+
+
+def _initial_context():
+    try:
+        cfg = load_snowflake_config()
+    except EnvironmentError:
+        return {}
+    return {k: cfg.get(k) for k in ("role", "warehouse", "database", "schema")}
+
+
+def print_plan(steps):
+    depth = levels(steps)
+    for level in range(max(depth, default=-1) + 1):
+        batch = [s for s, d in zip(steps, depth) if d == level]
+        print(f"\nLevel {level} ({len(batch)} statement(s) in parallel)")
+        for step in batch:
+            deps = ", ".join(f"#{d}" for d in step["deps"]) or "-"
+            print(f"   #{step['id']:<3} {step['label']}  [after {deps}]")
+
+
+def cmd_run(args):
+    steps = build_plan(args.scripts, include_checks=args.with_checks, context=_initial_context())
+    print("=" * 70)
+    print(f"PIPELINE RUN – {len(steps)} statements, {max(levels(steps), default=-1) + 1} levels")
+    print("=" * 70)
+    if args.dry_run:
+        print_plan(steps)
+        return 0
+
+    from pipeline.runner import run_plan
+
+    def on_event(event, step, result):
+        if event == "start":
+            print(f"   ▶ #{step['id']:<3} {step['label']}")
+        elif event == "ok":
+            print(f"   ✓ #{step['id']:<3} {result['seconds']:7.1f}s  {step['label']}")
+        elif event == "retry":
+            print(f"   ↻ #{step['id']:<3} attempt {result['attempts']} failed, retrying: {result['error']}")
+        elif event == "failed":
+            print(f"   ✗ #{step['id']:<3} {step['label']}\n        {result['error']}")
+
+    start = time.perf_counter()
+    results = run_plan(
+        steps,
+        parallel=args.parallel,
+        retries=args.retries,
+        statement_timeout=args.statement_timeout,
+        on_event=on_event,
+    )
+    wall = time.perf_counter() - start
+
+    durations = {i: r["seconds"] for i, r in results.items() if r["status"] == "ok"}
+    path_seconds, path = critical_path(steps, durations)
+    counts = {s: sum(r["status"] == s for r in results.values()) for s in ("ok", "failed", "skipped")}
+
+    print("\n" + "=" * 70)
+    print("SLOWEST STEPS")
+    print("=" * 70)
+    for step_id in sorted(durations, key=durations.get, reverse=True)[:10]:
+        print(f"   {durations[step_id]:7.1f}s  #{step_id:<3} {steps[step_id]['label']}")
+
+    print("\n" + "=" * 70)
+    print("SUMMARY")
+    print("=" * 70)
+    print(f"   ok: {counts['ok']}   failed: {counts['failed']}   skipped: {counts['skipped']}")
+    print(f"   Wall time:            {wall:7.1f}s")
+    print(f"   Serial time (sum):    {sum(durations.values()):7.1f}s")
+    print(f"   Critical path:        {path_seconds:7.1f}s  ({' → '.join(f'#{i}' for i in path)})")
+    return 1 if counts["failed"] or counts["skipped"] else 0
+
+
+def cmd_local_build(args):
+    from pipeline import local_engine
+
+    args.data_dir = args.data_dir or local_engine.DEFAULT_DATA_DIR
+    args.database = args.database or local_engine.DEFAULT_DATABASE
+    print("=" * 70)
+    print(f"LOCAL BUILD – {args.data_dir} → {args.database}")
+    print("=" * 70)
+    start = time.perf_counter()
+    local_engine.build(args.data_dir, args.database)
+    print(f"\n✓ Local build done in {time.perf_counter() - start:.1f}s")
+    print(f"   Serve the dashboards from it with ANYCOMPANY_BACKEND=duckdb ANYCOMPANY_DUCKDB_PATH={args.database}")
+    return 0
+
+
+def cmd_generate(args):
+    from pipeline import synthetic
+
+    print("=" * 70)
+    print(f"SYNTHETIC DATA – scale {args.scale:g} → {args.out}")
+    print("=" * 70)
+    start = time.perf_counter()
+    rows = synthetic.generate(
+        args.out,
+        scale=args.scale,
+        tables=args.tables,
+        formats=args.formats,
+        chunk_rows=args.chunk_rows,
+        dirty_rate=args.dirty_rate,
+        seed=args.seed,
+    )
+    print(f"\n✓ {sum(rows.values()):,} rows written in {time.perf_counter() - start:.1f}s")
+    print(f"   Build them locally with: python -m pipeline local-build --data-dir {args.out}")
+    return 0
+
+
+def cmd_features(args):
+    from pipeline import features
+    from pipeline.local_engine import LocalEngine
+
+    engine = LocalEngine(args.database)
+    print("=" * 70)
+    print(f"PROMO FEATURES – {engine.path}")
+    print("=" * 70)
+    try:
+        start = time.perf_counter()
+        inputs = features.load_inputs(engine)
+        loaded = time.perf_counter()
+        table = features.promo_effectiveness(*inputs)
+        built = time.perf_counter()
+        print(f"\n✓ {len(table):,} promotions – inputs {loaded - start:.2f}s, features {built - loaded:.3f}s")
+
+        if args.out:
+            table.to_parquet(args.out, index=False)
+            print(f"✓ written to {args.out}")
+
+        if args.check:
+            start = time.perf_counter()
+            reference = engine.query_arrow("SELECT * FROM ANALYTICS.ML_PROMO_EFFECTIVENESS").to_pandas()
+            print(f"\nSQL build: {len(reference):,} rows in {time.perf_counter() - start:.2f}s")
+            diffs = features.compare(table, reference)
+            bad = {column: n for column, n in diffs.items() if n}
+            for column, n in bad.items():
+                print(f"   ✗ {column}: {n} row(s) differ")
+            if bad:
+                return 1
+            print("✓ identical to ANALYTICS.ML_PROMO_EFFECTIVENESS")
+    finally:
+        engine.close()
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m pipeline", description="AnyCompany SQL pipeline")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run the SQL scripts as a parallel dependency graph")
+    run.add_argument("--scripts", nargs="+", default=DEFAULT_SCRIPTS, help="scripts relative to sql/, in order")
+    run.add_argument("--parallel", type=int, default=4, help="max concurrent statements (default 4)")
+    run.add_argument("--retries", type=int, default=2, help="retries for expired sessions / failed connections (default 2)")
+    run.add_argument("--statement-timeout", type=int, help="per-statement timeout in seconds")
+    run.add_argument("--with-checks", action="store_true", help="also run the SELECT/SHOW sanity checks")
+    run.add_argument("--dry-run", action="store_true", help="print the plan without connecting")
+    run.set_defaults(func=cmd_run)
+
+    inc = sub.add_parser("incremental", help="stream-based SILVER refresh (see pipeline.incremental)")
+    inc.add_argument("args", nargs=argparse.REMAINDER)
+    inc.set_defaults(func=lambda a: incremental.main(a.args) or 0)
+
+    local = sub.add_parser("local-build", help="build BRONZE → GOLD in a local DuckDB file")
+    local.add_argument("--data-dir", default=None, help="folder with the source CSV/JSON files")
+    local.add_argument("--database", default=None, help="DuckDB file to (re)build")
+    local.set_defaults(func=cmd_local_build)
+
+    gen = sub.add_parser("generate", help="write synthetic BRONZE source files (see pipeline.synthetic)")
+    gen.add_argument("--out", required=True, help="output folder")
+    gen.add_argument("--scale", type=float, default=1.0, help="multiple of the original row counts (default 1)")
+    gen.add_argument("--tables", nargs="+", help="only these BRONZE tables (default all)")
+    gen.add_argument(
+        "--formats", nargs="+", choices=("native", "parquet"), default=["native"],
+        help="native = the stage files (CSV/TSV/JSON); parquet = Parquet copies read first by local-build",
+    )
+    gen.add_argument("--chunk-rows", type=int, default=250_000, help="rows generated per chunk (default 250000)")
+    gen.add_argument("--dirty-rate", type=float, default=0.03, help="share of rows with defects (default 0.03)")
+    gen.add_argument("--seed", type=int, default=42)
+    gen.set_defaults(func=cmd_generate)
+
+    feat = sub.add_parser("features", help="build ML_PROMO_EFFECTIVENESS in Python (see pipeline.features)")
+    feat.add_argument("--database", default=None, help="local DuckDB file (default ANYCOMPANY_DUCKDB_PATH)")
+    feat.add_argument("--check", action="store_true", help="compare with the SQL-built ANALYTICS table")
+    feat.add_argument("--out", help="write the features to this Parquet file")
+    feat.set_defaults(func=cmd_features)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
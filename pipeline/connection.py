@@ -0,0 +1,53 @@
+"""
+Snowflake connection for pipeline runners (no Streamlit context)
+"""
+
+import os
+
+import snowflake.connector
+import toml
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SQL_DIR = os.path.join(REPO_ROOT, "sql")
+
+
+def load_snowflake_config():
+    if (
+        os.getenv("SNOWFLAKE_ACCOUNT")
+        and os.getenv("SNOWFLAKE_USER")
+        and os.getenv("SNOWFLAKE_PASSWORD")
+    ):
+        return {
+            "account": os.getenv("SNOWFLAKE_ACCOUNT"),
+            "user": os.getenv("SNOWFLAKE_USER"),
+            "password": os.getenv("SNOWFLAKE_PASSWORD"),
+            "warehouse": os.getenv("SNOWFLAKE_WAREHOUSE"),
+            "role": os.getenv("SNOWFLAKE_ROLE"),
+            "database": os.getenv("SNOWFLAKE_DATABASE"),
+            "schema": os.getenv("SNOWFLAKE_SCHEMA"),
+        }
+
+    secrets_path = os.path.join(REPO_ROOT, "streamlit", ".streamlit", "secrets.toml")
+    if os.path.exists(secrets_path):
+        with open(secrets_path, "r") as f:
+            secrets = toml.load(f)
+        if "snowflake" in secrets:
+            return secrets["snowflake"]
+
+    raise EnvironmentError(
+        "Snowflake credentials not found. Set the environment variables SNOWFLAKE_ACCOUNT, SNOWFLAKE_USER, "
+        "SNOWFLAKE_PASSWORD, etc., or create streamlit/.streamlit/secrets.toml."
+    )
+
+
+def get_snowflake_connection():
+    cfg = load_snowflake_config()
+    return snowflake.connector.connect(
+        account=cfg["account"],
+        user=cfg["user"],
+        password=cfg["password"],
+        role=cfg.get("role"),
+        warehouse=cfg.get("warehouse"),
+        database=cfg.get("database"),
+        schema=cfg.get("schema"),
+    )
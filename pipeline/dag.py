@@ -0,0 +1,202 @@
+"""
+Dependency graph between the statements of the sql/ scripts
+Every statement is reduced to the objects it reads and writes; a statement
+depends on every earlier statement it conflicts with (write/read or
+write/write on the same object, a schema or database containing it, or the
+warehouse it runs on). Everything else may run concurrently.
+"""
+
+import os
+import re
+
+from pipeline.connection import SQL_DIR
+from pipeline.sql_script import read_statements
+
+# Full refresh in worksheet order (exploration / verification scripts excluded)
+DEFAULT_SCRIPTS = [
+    "phase_1/1_environment_setup.sql",
+    "phase_1/2_create_tables.sql",
+    "phase_1/3_load_data.sql",
+    "phase_1/6_incremental_streams.sql",
+    "phase_1/5_clean_data.sql",
+    "phase_3/1_create_data_product.sql",
+    "phase_3/2_ml_feature_tables.sql",
+    "phase_4/1_gold_rollups.sql",
+]
+
+BARRIER = "*"  # statement we cannot analyse: runs alone, in script order
+
+_NAME = r"[A-Za-z_][\w$]*(?:\.[A-Za-z_][\w$]*){0,2}"
+_STRING = re.compile(r"'(?:[^']|'')*'")
+
+_USE = re.compile(rf"^USE\s+(ROLE|WAREHOUSE|DATABASE|SCHEMA)\s+({_NAME})\s*$", re.I)
+_CHECK = re.compile(r"^(?:SELECT|WITH|SHOW|LIST|LS|DESC|DESCRIBE)\b", re.I)
+_CREATE = re.compile(
+    r"^CREATE\s+(?:OR\s+REPLACE\s+)?(?:(?:TRANSIENT|TEMPORARY|TEMP|SECURE)\s+)*"
+    r"(WAREHOUSE|DATABASE|SCHEMA|TABLE|VIEW|STREAM|FILE\s+FORMAT|STAGE|SEQUENCE|TASK)\s+"
+    rf"(?:IF\s+NOT\s+EXISTS\s+)?({_NAME})",
+    re.I,
+)
+_ALTER = re.compile(
+    r"^(?:ALTER|DROP)\s+(WAREHOUSE|DATABASE|SCHEMA|TABLE|VIEW|STREAM|FILE\s+FORMAT|STAGE|SEQUENCE|TASK)\s+"
+    rf"(?:IF\s+EXISTS\s+)?({_NAME})",
+    re.I,
+)
+_DML = re.compile(
+    rf"^(?:(?:COPY|INSERT(?:\s+OVERWRITE)?|MERGE)\s+INTO|UPDATE|DELETE\s+FROM|TRUNCATE(?:\s+TABLE)?(?:\s+IF\s+EXISTS)?)\s+({_NAME})",
+    re.I,
+)
+_GRANT = re.compile(rf"^(?:GRANT|REVOKE)\b.*?\bON\s+(TABLE|VIEW|SCHEMA|DATABASE)\s+({_NAME})", re.I | re.S)
+
+_READS = [
+    re.compile(rf"\b(?:FROM|JOIN|USING)\s+({_NAME})", re.I),
+    re.compile(rf"\bON\s+TABLE\s+({_NAME})", re.I),  # CREATE STREAM ... ON TABLE
+    re.compile(rf"\bFORMAT_NAME\s*=\s*({_NAME})", re.I),
+    re.compile(rf"@({_NAME})"),  # stages
+]
+_CTE = re.compile(r"(?:\bWITH|,)\s*([A-Za-z_][\w$]*)\s+AS\s*\(", re.I)
+
+
+def _kind(word: str) -> str:
+    return " ".join(word.upper().split())
+
+
+def qualify(name: str, kind: str, context: dict) -> str:
+    """Fully qualified, upper-case object name resolved against the session context."""
+    parts = name.upper().split(".")
+    if kind == "WAREHOUSE":
+        return f"WAREHOUSE:{parts[-1]}"
+    if kind == "DATABASE":
+        return parts[-1]
+    depth = 2 if kind == "SCHEMA" else 3
+    defaults = [context.get("database") or "?", context.get("schema") or "?"][: max(depth - len(parts), 0)]
+    return ".".join(defaults + parts)
+
+
+def _with_parents(name: str) -> set:
+    parts = name.split(".")
+    return {".".join(parts[:i]) for i in range(1, len(parts) + 1)}
+
+
+def covers(written: str, accessed: str) -> bool:
+    """True when writing `written` affects `accessed` (the same object or one inside it)."""
+    return BARRIER in (written, accessed) or accessed == written or accessed.startswith(written + ".")
+
+
+def analyse(sql: str, context: dict):
+    """Return (reads, writes) for one statement; writes == {BARRIER} if unknown."""
+    head = _STRING.sub("''", sql)
+    writes, reads = set(), set()
+
+    match = _CREATE.match(head) or _ALTER.match(head) or _GRANT.match(head)
+    if match:
+        writes.add(qualify(match.group(2), _kind(match.group(1)), context))
+    elif _DML.match(head):
+        writes.add(qualify(_DML.match(head).group(1), "TABLE", context))
+    elif not _CHECK.match(head):
+        return set(), {BARRIER}
+
+    ctes = {c.upper() for c in _CTE.findall(head)}
+    for pattern in _READS:
+        for name in pattern.findall(head):
+            if name.upper() not in ctes:
+                reads.add(qualify(name, "TABLE", context))
+
+    # Objects need their schema/database, statements need the session context
+    for name in list(reads | writes):
+        if not name.startswith("WAREHOUSE:"):
+            reads |= _with_parents(name) - {name}
+    if context.get("warehouse"):
+        reads.add(f"WAREHOUSE:{context['warehouse']}")
+    if context.get("database"):
+        reads.add(context["database"])
+        if context.get("schema"):
+            reads.add(f"{context['database']}.{context['schema']}")
+    return reads - writes, writes
+
+
+def _summary(sql: str) -> str:
+    text = " ".join(sql.split())
+    return text if len(text) <= 80 else text[:77] + "..."
+
+
+def build_plan(scripts=None, include_checks=False, context=None) -> list:
+    """Parse the scripts into steps with their dependencies.
+
+    Each step is a dict: id, script, sql, label, context (USE state to apply),
+    reads, writes and deps (ids of earlier steps it must wait for).
+    """
+    context = {k: (v or "").upper() or None for k, v in (context or {}).items()}
+    steps = []
+    for script in scripts or DEFAULT_SCRIPTS:
+        path = script if os.path.isabs(script) else os.path.join(SQL_DIR, script)
+        for n, sql in enumerate(read_statements(path), start=1):
+            use = _USE.match(sql)
+            if use:
+                kind, name = use.group(1).lower(), use.group(2).upper()
+                if kind == "schema":
+                    database, schema = qualify(name, "SCHEMA", context).split(".")
+                    context.update(database=database, schema=schema)
+                else:
+                    context[kind] = name
+                    if kind == "database":
+                        context["schema"] = "PUBLIC"
+                continue
+            if _CHECK.match(sql) and not include_checks:
+                continue
+
+            reads, writes = analyse(sql, context)
+            step = {
+                "id": len(steps),
+                "script": os.path.relpath(path, SQL_DIR),
+                "label": f"{os.path.basename(path)}#{n} {_summary(sql)}",
+                "sql": sql,
+                "context": dict(context),
+                "reads": reads,
+                "writes": writes,
+            }
+            step["deps"] = [
+                prev["id"]
+                for prev in steps
+                if any(covers(w, o) for w in writes for o in prev["reads"] | prev["writes"])
+                or any(covers(w, o) for w in prev["writes"] for o in reads | writes)
+            ]
+            steps.append(step)
+
+            # CREATE DATABASE / SCHEMA / WAREHOUSE also switch the session to the new object
+            create = _CREATE.match(_STRING.sub("''", sql))
+            if create:
+                kind = _kind(create.group(1))
+                target = qualify(create.group(2), kind, context)
+                if kind == "DATABASE":
+                    context.update(database=target, schema="PUBLIC")
+                elif kind == "SCHEMA":
+                    database, schema = target.split(".")
+                    context.update(database=database, schema=schema)
+                elif kind == "WAREHOUSE":
+                    context["warehouse"] = target.split(":", 1)[1]
+    return steps
+
+
+def levels(steps) -> list:
+    """Depth of each step in the graph (0 = no dependencies)."""
+    depth = []
+    for step in steps:
+        depth.append(1 + max((depth[d] for d in step["deps"]), default=-1))
+    return depth
+
+
+def critical_path(steps, durations: dict) -> tuple:
+    """(length in seconds, step ids) of the longest dependency chain."""
+    finish, via = {}, {}
+    for step in steps:
+        prev = max(step["deps"], key=lambda d: finish.get(d, 0.0), default=None)
+        finish[step["id"]] = durations.get(step["id"], 0.0) + (finish.get(prev, 0.0) if prev is not None else 0.0)
+        via[step["id"]] = prev
+    if not finish:
+        return 0.0, []
+    end = max(finish, key=finish.get)
+    path = [end]
+    while via[path[-1]] is not None:
+        path.append(via[path[-1]])
+    return finish[end], path[::-1]
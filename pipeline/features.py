@@ -0,0 +1,248 @@
+"""
+Promo feature builder (vectorized)
+Computes ANALYTICS.ML_PROMO_EFFECTIVENESS (sql/phase_3/2_ml_feature_tables.sql)
+in Python: same columns, same values, without the three range joins.
+
+  - Sales are aggregated per (region, day) once, laid on a dense day grid and
+    turned into per-region prefix sums; every promotion's window and 30-day
+    baseline are then two cumulative-sum lookups, O(1) per promotion.
+  - Campaign overlap counts come from sorted start/end arrays per region
+    (#starts <= promo end - #ends < promo start), with an exact fallback for
+    the few campaign ids that appear more than once (COUNT(DISTINCT)).
+
+Amounts are summed as integer cents, so totals are exact like the SQL's
+NUMBER arithmetic. Transaction counts assume unique transaction_id values,
+which SILVER guarantees (deduplicated in phase_1/5_clean_data.sql).
+
+Usage:
+    python -m pipeline features [--database FILE] [--check] [--out FILE.parquet]
+"""
+
+import numpy as np
+import pandas as pd
+
+BASELINE_DAYS = 30
+
+# Column order of ANALYTICS.ML_PROMO_EFFECTIVENESS
+COLUMNS = [
+    "PROMOTION_ID",
+    "PRODUCT_CATEGORY",
+    "PROMOTION_TYPE",
+    "REGION",
+    "DISCOUNT_PERCENTAGE",
+    "DURATION_DAYS",
+    "START_DATE",
+    "END_DATE",
+    "TRANSACTIONS_COUNT",
+    "TOTAL_SALES",
+    "AVG_TRANSACTION_VALUE",
+    "BASELINE_AVG_TRANSACTION",
+    "BASELINE_DAILY_TRANSACTIONS",
+    "BASELINE_DAILY_SALES",
+    "HAS_CAMPAIGN_OVERLAP",
+    "NUM_OVERLAPPING_CAMPAIGNS",
+    "START_MONTH",
+    "START_QUARTER",
+    "START_DAY_OF_WEEK",
+    "IS_HOLIDAY_SEASON",
+    "STARTS_ON_WEEKEND",
+    "SALES_LIFT_RATIO",
+    "IS_SUCCESSFUL",
+    "ESTIMATED_PROMO_COST",
+    "ROI_PROXY",
+]
+
+SALES_DAILY_SQL = """
+SELECT
+    region,
+    transaction_date,
+    CAST(SUM(amount) * 100 AS BIGINT) AS amount_cents,
+    COUNT(DISTINCT transaction_id) AS nb_transactions,
+    COUNT(amount) AS nb_amounts
+FROM SILVER.FINANCIAL_TRANSACTIONS_CLEAN
+WHERE transaction_type = 'Sale'
+  AND region IS NOT NULL
+  AND transaction_date IS NOT NULL
+GROUP BY region, transaction_date
+"""
+
+PROMOTIONS_SQL = """
+SELECT promotion_id, product_category, start_date, end_date, discount_percentage, promotion_type, region
+FROM SILVER.PROMOTIONS_CLEAN
+"""
+
+CAMPAIGNS_SQL = """
+SELECT DISTINCT region, campaign_id, start_date, end_date
+FROM SILVER.MARKETING_CAMPAIGNS_CLEAN
+WHERE region IS NOT NULL
+  AND campaign_id IS NOT NULL
+  AND start_date IS NOT NULL
+  AND end_date IS NOT NULL
+"""
+
+
+def _days(values) -> np.ndarray:
+    """Dates -> int64 days since 1970-01-01."""
+    return np.asarray(pd.to_datetime(values).values.astype("datetime64[D]"), dtype=np.int64)
+
+
+class DailyPrefixSums:
+    """Per-region cumulative sums of daily measures over a dense day grid."""
+
+    def __init__(self, regions, days, measures: dict):
+        self.codes = {region: i for i, region in enumerate(pd.unique(regions))}
+        codes = np.array([self.codes[r] for r in regions], dtype=np.int64)
+        days = np.asarray(days, dtype=np.int64)
+        self.first = int(days.min()) if len(days) else 0
+        self.n_days = int(days.max()) - self.first + 1 if len(days) else 0
+        self.sums = {}
+        for name, values in measures.items():
+            grid = np.zeros((len(self.codes), self.n_days + 1), dtype=np.int64)
+            np.add.at(grid, (codes, days - self.first + 1), np.asarray(values, dtype=np.int64))
+            self.sums[name] = np.cumsum(grid, axis=1)
+
+    def region_codes(self, regions) -> np.ndarray:
+        """Row of each region in the grid, -1 for regions without sales (or NULL)."""
+        return np.array([self.codes.get(r, -1) for r in regions], dtype=np.int64)
+
+    def window(self, codes, start, end) -> dict:
+        """{measure: sum over [start, end] (inclusive day numbers)} for each (region code, window)."""
+        lo = np.clip(np.asarray(start) - self.first, 0, self.n_days)
+        hi = np.clip(np.asarray(end) - self.first + 1, 0, self.n_days)
+        hi = np.maximum(hi, lo)
+        known = codes >= 0
+        rows = np.where(known, codes, 0)
+        return {
+            name: np.where(known, cs[rows, hi] - cs[rows, lo], 0) for name, cs in self.sums.items()
+        }
+
+
+def overlap_counts(p_region, p_start, p_end, c_region, c_id, c_start, c_end) -> np.ndarray:
+    """COUNT(DISTINCT campaign id) of same-region campaigns overlapping each promotion."""
+    p_region, c_region, c_id = (np.asarray(a, dtype=object) for a in (p_region, c_region, c_id))
+    counts = np.zeros(len(p_start), dtype=np.int64)
+    campaigns = pd.DataFrame({"region": c_region, "id": c_id, "start": c_start, "end": c_end})
+    repeated = campaigns.duplicated(["region", "id"], keep=False).to_numpy()
+
+    for region, group in campaigns.groupby("region", sort=False):
+        promos = np.flatnonzero(p_region == region)
+        if not len(promos):
+            continue
+        s, e = p_start[promos], p_end[promos]
+
+        single = group[~repeated[group.index]]
+        starts, ends = np.sort(single["start"].to_numpy()), np.sort(single["end"].to_numpy())
+        # campaign.start <= promo.end AND campaign.end >= promo.start (start <= end in SILVER)
+        counts[promos] += np.searchsorted(starts, e, side="right") - np.searchsorted(ends, s, side="left")
+
+        multi = group[repeated[group.index]].sort_values("id")
+        if len(multi):
+            hits = (multi["start"].to_numpy()[None, :] <= e[:, None]) & (multi["end"].to_numpy()[None, :] >= s[:, None])
+            ids = multi["id"].to_numpy()
+            boundaries = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+            counts[promos] += np.logical_or.reduceat(hits, boundaries, axis=1).sum(axis=1)
+    return counts
+
+
+def promo_effectiveness(sales_daily: pd.DataFrame, promotions: pd.DataFrame, campaigns: pd.DataFrame) -> pd.DataFrame:
+    """ML_PROMO_EFFECTIVENESS from the three inputs of SALES_DAILY_SQL, PROMOTIONS_SQL and CAMPAIGNS_SQL."""
+    grid = DailyPrefixSums(
+        sales_daily["REGION"].to_numpy(),
+        _days(sales_daily["TRANSACTION_DATE"]),
+        {
+            "cents": sales_daily["AMOUNT_CENTS"].to_numpy(),
+            "transactions": sales_daily["NB_TRANSACTIONS"].to_numpy(),
+            "amounts": sales_daily["NB_AMOUNTS"].to_numpy(),
+        },
+    )
+    start, end = _days(promotions["START_DATE"]), _days(promotions["END_DATE"])
+    codes = grid.region_codes(promotions["REGION"].to_numpy())
+    promo = grid.window(codes, start, end)
+    base = grid.window(codes, start - BASELINE_DAYS, start - 1)
+
+    duration = end - start + 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total_sales = np.where(promo["amounts"] > 0, promo["cents"] / 100.0, np.nan)
+        avg_value = np.where(promo["amounts"] > 0, promo["cents"] / 100.0 / promo["amounts"], np.nan)
+        base_avg = np.where(base["amounts"] > 0, base["cents"] / 100.0 / base["amounts"], 0.0)
+        base_daily_tx = base["transactions"] / float(BASELINE_DAYS)
+        base_daily_sales = np.where(base["amounts"] > 0, base["cents"] / 100.0 / BASELINE_DAYS, np.nan)
+
+        discount = promotions["DISCOUNT_PERCENTAGE"].to_numpy(dtype=float)
+        expected = base_daily_sales * duration
+        cost = total_sales * discount
+        lift = np.where(base_daily_sales > 0, (total_sales / duration - base_daily_sales) / base_daily_sales, 0.0)
+        roi = np.where(cost > 0, (total_sales - expected) / cost, 0.0)
+
+    n_campaigns = overlap_counts(
+        promotions["REGION"].to_numpy(),
+        start,
+        end,
+        campaigns["REGION"].to_numpy(),
+        campaigns["CAMPAIGN_ID"].to_numpy(),
+        _days(campaigns["START_DATE"]),
+        _days(campaigns["END_DATE"]),
+    )
+
+    started = pd.DatetimeIndex(pd.to_datetime(promotions["START_DATE"]))
+    day_of_week = (started.dayofweek.to_numpy() + 1) % 7  # Snowflake DAYOFWEEK: Sunday = 0
+    month = started.month.to_numpy()
+
+    out = pd.DataFrame(
+        {
+            "PROMOTION_ID": promotions["PROMOTION_ID"].to_numpy(),
+            "PRODUCT_CATEGORY": promotions["PRODUCT_CATEGORY"].to_numpy(),
+            "PROMOTION_TYPE": promotions["PROMOTION_TYPE"].to_numpy(),
+            "REGION": promotions["REGION"].to_numpy(),
+            "DISCOUNT_PERCENTAGE": discount,
+            "DURATION_DAYS": duration,
+            "START_DATE": promotions["START_DATE"].to_numpy(),
+            "END_DATE": promotions["END_DATE"].to_numpy(),
+            "TRANSACTIONS_COUNT": promo["transactions"],
+            "TOTAL_SALES": total_sales,
+            "AVG_TRANSACTION_VALUE": avg_value,
+            "BASELINE_AVG_TRANSACTION": base_avg,
+            "BASELINE_DAILY_TRANSACTIONS": base_daily_tx,
+            "BASELINE_DAILY_SALES": np.nan_to_num(base_daily_sales, nan=0.0),
+            "HAS_CAMPAIGN_OVERLAP": (n_campaigns > 0).astype(np.int64),
+            "NUM_OVERLAPPING_CAMPAIGNS": n_campaigns,
+            "START_MONTH": month,
+            "START_QUARTER": started.quarter.to_numpy(),
+            "START_DAY_OF_WEEK": day_of_week,
+            "IS_HOLIDAY_SEASON": np.isin(month, (11, 12)).astype(np.int64),
+            "STARTS_ON_WEEKEND": np.isin(day_of_week, (0, 6)).astype(np.int64),
+            "SALES_LIFT_RATIO": lift,
+            "IS_SUCCESSFUL": (total_sales > expected).astype(np.int64),
+            "ESTIMATED_PROMO_COST": cost,
+            "ROI_PROXY": roi,
+        },
+        columns=COLUMNS,
+    )
+    # WHERE bs.baseline_daily_sales IS NOT NULL
+    return out[~np.isnan(base_daily_sales)].reset_index(drop=True)
+
+
+def load_inputs(engine) -> tuple:
+    """(sales_daily, promotions, campaigns) DataFrames from a LocalEngine or any object with query_arrow()."""
+    return tuple(engine.query_arrow(sql).to_pandas() for sql in (SALES_DAILY_SQL, PROMOTIONS_SQL, CAMPAIGNS_SQL))
+
+
+def build_promo_effectiveness(engine) -> pd.DataFrame:
+    return promo_effectiveness(*load_inputs(engine))
+
+
+def compare(built: pd.DataFrame, reference: pd.DataFrame, rtol=1e-9) -> dict:
+    """{column: number of differing rows} between two feature tables, matched on PROMOTION_ID."""
+    left = built.set_index("PROMOTION_ID").sort_index()
+    right = reference.set_index("PROMOTION_ID").sort_index()
+    diffs = {"__rows__": int(len(left.index.symmetric_difference(right.index)))}
+    left, right = left.align(right, join="inner", axis=0)
+    for column in COLUMNS[1:]:
+        a, b = left[column], right[column]
+        try:
+            a, b = a.astype(float).to_numpy(), b.astype(float).to_numpy()
+            same = np.isclose(a, b, rtol=rtol, atol=1e-9, equal_nan=True)
+        except (TypeError, ValueError):
+            same = (a.astype(str).to_numpy() == b.astype(str).to_numpy()) | (a.isna() & b.isna()).to_numpy()
+        diffs[column] = int((~same).sum())
+    return diffs
@@ -0,0 +1,215 @@
+"""
+Incremental SILVER refresh
+Merges only the BRONZE rows loaded since the last run into the *_CLEAN tables,
+then refreshes the ML_PROMO_EFFECTIVENESS rows those changes touch.
+
+Usage:
+    python -m pipeline.incremental                  # MERGE new rows (all tables) + feature refresh
+    python -m pipeline.incremental --table PROMOTIONS_CLEAN
+    python -m pipeline.incremental --skip-features  # SILVER only
+    python -m pipeline.incremental --full           # reset streams + full rebuild
+
+Keys whose winning row was dropped by a quality rule (amount <= 0, negative
+salary, ...) keep that row in SILVER.<T>_REJECTED, so the MERGEs match a full
+rebuild (see the header of sql/phase_1/7_incremental_merge.sql).
+"""
+
+import argparse
+import os
+import re
+import time
+
+from pipeline.connection import SQL_DIR, get_snowflake_connection
+from pipeline.sql_script import read_statements
+
+STREAMS_SCRIPT = os.path.join(SQL_DIR, "phase_1", "6_incremental_streams.sql")
+MERGE_SCRIPT = os.path.join(SQL_DIR, "phase_1", "7_incremental_merge.sql")
+FULL_BUILD_SCRIPT = os.path.join(SQL_DIR, "phase_1", "5_clean_data.sql")
+FEATURES_SCRIPT = os.path.join(SQL_DIR, "phase_3", "3_ml_feature_incremental.sql")
+FULL_FEATURES_SCRIPT = os.path.join(SQL_DIR, "phase_3", "2_ml_feature_tables.sql")
+
+FEATURES_TABLE = "ANALYTICS.ML_PROMO_EFFECTIVENESS"
+FEATURES_QUEUE = "ANALYTICS.ML_PROMO_DIRTY"
+FEATURES_STREAMS = (
+    "ANALYTICS.ML_TRANSACTIONS_STREAM",
+    "ANALYTICS.ML_PROMOTIONS_STREAM",
+    "ANALYTICS.ML_CAMPAIGNS_STREAM",
+)
+
+_MERGE_TARGET = re.compile(r"^MERGE\s+INTO\s+(SILVER\.\w+)", re.I)
+_STREAM_SOURCE = re.compile(r"\bFROM\s+(BRONZE\.\w+_STREAM)\b", re.I)
+_SETUP = re.compile(r"^(?:USE|CREATE)\b", re.I)
+_BEGIN = re.compile(r"^BEGIN\b", re.I)
+_COMMIT = re.compile(r"^COMMIT\b", re.I)
+
+
+def _merge_entry(statements):
+    target = next(m for m in map(_MERGE_TARGET.match, statements) if m)  # the *_CLEAN MERGE comes first
+    stream = _STREAM_SOURCE.search(target.string)
+    if stream is None:
+        raise ValueError(f"No BRONZE stream found in MERGE INTO {target.group(1)}")
+    return target.group(1).upper(), stream.group(1).upper(), statements
+
+
+def load_merges(path=MERGE_SCRIPT):
+    """Return (setup statements, [(target table, source stream, statements), ...]).
+
+    A table's statements are its MERGE, or a BEGIN ... COMMIT block: its MERGE
+    followed by the MERGE of its tombstones, reading the same stream rows.
+    """
+    setup, merges, block = [], [], None
+    for sql in read_statements(path):
+        if _BEGIN.match(sql):
+            block = [sql]
+        elif block is not None:
+            block.append(sql)
+            if _COMMIT.match(sql):
+                merges.append(_merge_entry(block))
+                block = None
+        elif _MERGE_TARGET.match(sql):
+            merges.append(_merge_entry([sql]))
+        else:
+            setup.append(sql)
+    return setup, merges
+
+
+def stream_has_data(cur, stream: str) -> bool:
+    cur.execute(f"SELECT SYSTEM$STREAM_HAS_DATA('{stream}')")
+    return bool(cur.fetchone()[0])
+
+
+def run_incremental(conn, tables=None):
+    """MERGE every stream that has new rows; returns one result dict per table."""
+    setup, merges = load_merges()
+    if tables:
+        wanted = {t.upper() if "." in t else f"SILVER.{t.upper()}" for t in tables}
+        merges = [m for m in merges if m[0] in wanted]
+
+    results = []
+    cur = conn.cursor()
+    try:
+        for sql in setup:
+            cur.execute(sql)
+
+        for target, stream, statements in merges:
+            start = time.perf_counter()
+            if not stream_has_data(cur, stream):
+                results.append({"table": target, "skipped": True, "seconds": time.perf_counter() - start})
+                continue
+
+            try:
+                for sql in statements:
+                    cur.execute(sql)
+                    merged = _MERGE_TARGET.match(sql)
+                    if merged and merged.group(1).upper() == target:
+                        row = cur.fetchone() or ()
+                        counts = {d[0].lower(): v for d, v in zip(cur.description or [], row)}
+            except Exception:
+                if len(statements) > 1:
+                    cur.execute("ROLLBACK")
+                raise
+            results.append(
+                {
+                    "table": target,
+                    "skipped": False,
+                    "inserted": counts.get("number of rows inserted", 0),
+                    "updated": counts.get("number of rows updated", 0),
+                    "deleted": counts.get("number of rows deleted", 0),
+                    "seconds": time.perf_counter() - start,
+                }
+            )
+    finally:
+        cur.close()
+    return results
+
+
+def run_feature_refresh(conn):
+    """Recompute the ML_PROMO_EFFECTIVENESS rows touched by SILVER changes since the last refresh."""
+    statements = read_statements(FEATURES_SCRIPT)
+    setup = [sql for sql in statements if _SETUP.match(sql)]
+    refresh = [sql for sql in statements if not _SETUP.match(sql)]
+
+    start = time.perf_counter()
+    cur = conn.cursor()
+    try:
+        for sql in setup:
+            cur.execute(sql)
+        # Ids left by a failed run are still queued even when the streams are empty
+        cur.execute(f"SELECT COUNT(*) FROM {FEATURES_QUEUE}")
+        queued = cur.fetchone()[0]
+        if not queued and not any(stream_has_data(cur, s) for s in FEATURES_STREAMS):
+            return {"table": FEATURES_TABLE, "skipped": True, "seconds": time.perf_counter() - start}
+
+        counts = {}
+        try:
+            for sql in refresh:
+                cur.execute(sql)
+                if sql.upper().startswith("INSERT"):
+                    queued += cur.fetchone()[0]
+                elif sql.upper().startswith("MERGE"):
+                    row = cur.fetchone() or ()
+                    counts = {d[0].lower(): v for d, v in zip(cur.description or [], row)}
+        except Exception:
+            cur.execute("ROLLBACK")
+            raise
+    finally:
+        cur.close()
+    return {
+        "table": FEATURES_TABLE,
+        "skipped": False,
+        "promotions": queued,
+        "inserted": counts.get("number of rows inserted", 0),
+        "updated": counts.get("number of rows updated", 0),
+        "deleted": counts.get("number of rows deleted", 0),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def run_full(conn):
+    """Reset the streams, then rebuild SILVER from the whole BRONZE history and the feature table from SILVER."""
+    cur = conn.cursor()
+    try:
+        for path in (STREAMS_SCRIPT, FULL_BUILD_SCRIPT, FULL_FEATURES_SCRIPT):
+            for sql in read_statements(path):
+                cur.execute(sql)
+    finally:
+        cur.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Incremental BRONZE → SILVER refresh")
+    parser.add_argument("--full", action="store_true", help="reset streams and rebuild SILVER from scratch")
+    parser.add_argument("--table", action="append", help="only refresh this SILVER table (repeatable)")
+    parser.add_argument("--skip-features", action="store_true", help="do not refresh ML_PROMO_EFFECTIVENESS")
+    args = parser.parse_args(argv)
+
+    conn = get_snowflake_connection()
+    try:
+        if args.full:
+            print("Full rebuild: resetting streams and running 5_clean_data.sql + 2_ml_feature_tables.sql...")
+            start = time.perf_counter()
+            run_full(conn)
+            print(f"✓ Full rebuild done in {time.perf_counter() - start:.1f}s")
+            return
+
+        print("=" * 70)
+        print("INCREMENTAL SILVER REFRESH")
+        print("=" * 70)
+        results = run_incremental(conn, args.table)
+        if not args.skip_features:
+            results.append(run_feature_refresh(conn))
+        for r in results:
+            if r["skipped"]:
+                print(f"   - {r['table']}: no new rows")
+            else:
+                touched = f"{r['promotions']} promotions touched: " if "promotions" in r else ""
+                print(
+                    f"   ✓ {r['table']}: {touched}+{r['inserted']} inserted, {r['updated']} updated, "
+                    f"{r['deleted']} deleted ({r['seconds']:.1f}s)"
+                )
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,357 @@
+"""
+Local DuckDB engine
+Builds BRONZE → SILVER → ANALYTICS/GOLD in a DuckDB file from the source
+files listed in sql/phase_1/3_load_data.sql, by running the same sql/
+scripts through a small Snowflake → DuckDB translation, and answers the
+dashboard queries offline (ANYCOMPANY_BACKEND=duckdb).
+
+Usage:
+    python -m pipeline local-build --data-dir path/to/files [--database path.duckdb]
+"""
+
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+
+from pipeline.dag import build_plan
+
+DEFAULT_DATA_DIR = os.getenv(
+    "ANYCOMPANY_DATA_DIR", os.path.join(os.path.expanduser("~"), ".cache", "anycompany", "data")
+)
+DEFAULT_DATABASE = os.getenv("ANYCOMPANY_DUCKDB_PATH", os.path.join(DEFAULT_DATA_DIR, "anycompany_lab.duckdb"))
+
+# Same scripts as the Snowflake build, minus environment setup and streams
+LOCAL_SCRIPTS = [
+    "phase_1/2_create_tables.sql",
+    "phase_1/3_load_data.sql",
+    "phase_1/5_clean_data.sql",
+    "phase_3/1_create_data_product.sql",
+    "phase_3/2_ml_feature_tables.sql",
+    "phase_4/1_gold_rollups.sql",
+]
+SCHEMAS = ("BRONZE", "SILVER", "ANALYTICS", "GOLD")
+
+# Mirrors the file formats of sql/phase_1/1_environment_setup.sql
+FILE_FORMATS = {
+    "FF_CSV": {"delim": ",", "nullstr": ["", "NULL"], "null_padding": False},
+    "FF_TSV": {"delim": "\t", "nullstr": ["", "NULL", "null"], "null_padding": True},
+    "FF_JSON": None,
+}
+
+# Account-level objects and statements with no local equivalent
+_SKIPPED = re.compile(
+    r"^(?:CREATE\s+(?:OR\s+REPLACE\s+)?(?:WAREHOUSE|DATABASE|FILE\s+FORMAT|STAGE|STREAM|TASK)\b"
+    r"|GRANT\b|REVOKE\b|ALTER\s+(?:WAREHOUSE|SESSION)\b|LIST\b|SHOW\b)",
+    re.I,
+)
+_COPY = re.compile(
+    r"^COPY\s+INTO\s+([\w.]+)\s+FROM\s+@[\w.]+/(\S+)\s+FILE_FORMAT\s*=\s*\(\s*FORMAT_NAME\s*=\s*(\w+)\s*\)",
+    re.I,
+)
+
+# ------------------------------------------------------------
+# Snowflake → DuckDB translation
+# ------------------------------------------------------------
+_PROTECTED = re.compile(r"'(?:[^']|'')*'|--[^\n]*|/\*.*?\*/", re.S)
+_PLACEHOLDER = re.compile(r"\x00(\d+)\x00")
+_VARIANT_PATH = re.compile(
+    r"(?<![:\w])([A-Za-z_]\w*):(?!:)([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)(\s*::\s*(?:STRING|VARCHAR|TEXT)\b)?", re.I
+)
+_TYPES = [
+    (re.compile(r"\bNUMBER\s*\(", re.I), "DECIMAL("),
+    (re.compile(r"\bNUMBER\b", re.I), "DECIMAL(38,0)"),
+    (re.compile(r"\b(?:FLOAT[48]?|DOUBLE\s+PRECISION)\b", re.I), "DOUBLE"),
+    (re.compile(r"\bVARIANT\b", re.I), "JSON"),
+    (re.compile(r"\bTIMESTAMP_NTZ\b", re.I), "TIMESTAMP"),
+    (re.compile(r"\bTIMESTAMP_[LT]Z\b", re.I), "TIMESTAMPTZ"),
+]
+_CLUSTER_BY = re.compile(r"\bCLUSTER\s+BY\s*\([^()]*\)", re.I)
+_DATABASE_PREFIX = re.compile(r"\bANYCOMPANY_LAB\.", re.I)
+
+_DATE_PARTS = {
+    "d": "day", "dd": "day", "day": "day", "days": "day",
+    "w": "week", "wk": "week", "week": "week", "weeks": "week",
+    "mm": "month", "mon": "month", "month": "month", "months": "month",
+    "q": "quarter", "qtr": "quarter", "quarter": "quarter", "quarters": "quarter",
+    "y": "year", "yy": "year", "yyyy": "year", "year": "year", "years": "year",
+    "h": "hour", "hh": "hour", "hour": "hour", "hours": "hour",
+    "mi": "minute", "minute": "minute", "minutes": "minute",
+    "s": "second", "ss": "second", "second": "second", "seconds": "second",
+}
+_FORMAT_TOKENS = [("YYYY", "%Y"), ("MM", "%m"), ("DD", "%d"), ("HH24", "%H"), ("MI", "%M"), ("SS", "%S")]
+
+
+def _split_args(body: str) -> list:
+    args, depth, start = [], 0, 0
+    for i, ch in enumerate(body):
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            args.append(body[start:i].strip())
+            start = i + 1
+    args.append(body[start:].strip())
+    return [a for a in args if a]
+
+
+def _rewrite_calls(sql: str, name: str, rewrite) -> str:
+    """Replace every NAME(args) call, innermost first, by rewrite(args)."""
+    pattern = re.compile(rf"\b{name}\s*\(", re.I)
+    limit = len(sql)
+    while True:
+        # Right to left, so nested calls are rewritten before the call around them
+        matches = list(pattern.finditer(sql, 0, limit))
+        if not matches:
+            return sql
+        match = matches[-1]
+        limit = match.start()
+        depth, end = 1, match.end()
+        while depth and end < len(sql):
+            depth += {"(": 1, ")": -1}.get(sql[end], 0)
+            end += 1
+        if depth:
+            raise ValueError(f"Unbalanced parentheses after {name}")
+        sql = sql[: match.start()] + rewrite(_split_args(sql[match.end() : end - 1])) + sql[end:]
+
+
+def translate(sql: str) -> str:
+    """Rewrite a Snowflake statement into DuckDB SQL (the subset used in this repo)."""
+    protected = []
+
+    def protect(match):
+        protected.append(match.group(0))
+        return f"\x00{len(protected) - 1}\x00"
+
+    def literal(arg):
+        found = _PLACEHOLDER.fullmatch(arg.strip())
+        return protected[int(found.group(1))][1:-1] if found else arg.strip()
+
+    def part(arg):
+        value = literal(arg).lower()
+        return _DATE_PARTS.get(value, value)
+
+    def strptime_format(arg):
+        fmt = literal(arg)
+        for token, directive in _FORMAT_TOKENS:
+            fmt = fmt.replace(token, directive)
+        return "'" + fmt.replace("'", "''") + "'"
+
+    def to_decimal(args, try_=True):
+        rest = [a for a in args[1:] if not _PLACEHOLDER.fullmatch(a)]  # drop a format argument
+        precision, scale = (rest + ["38", "0"])[:2] if len(rest) != 1 else (rest[0], "0")
+        return f"{'TRY_CAST' if try_ else 'CAST'}({args[0]} AS DECIMAL({precision},{scale}))"
+
+    def to_date(args, try_=True):
+        if len(args) > 1:
+            parsed = f"{'TRY_STRPTIME' if try_ else 'STRPTIME'}({args[0]}, {strptime_format(args[1])})"
+            return f"CAST({parsed} AS DATE)"
+        return f"{'TRY_CAST' if try_ else 'CAST'}({args[0]} AS DATE)"
+
+    def dateadd(args):
+        unit = part(args[0])
+        shifted = f"{args[2]} + INTERVAL ({args[1]}) {unit.upper()}"
+        return f"CAST({shifted} AS DATE)" if unit in ("day", "week", "month", "quarter", "year") else f"({shifted})"
+
+    def flatten(args):
+        values = re.sub(r"^INPUT\s*=>\s*", "", args[0], flags=re.I)
+        return f"LATERAL (SELECT UNNEST({values}) AS value, UNNEST(range(len({values}))) AS index)"
+
+    rules = [
+        ("LATERAL\\s+FLATTEN", flatten),
+        ("IFF", lambda a: f"(CASE WHEN {a[0]} THEN {a[1]} ELSE {a[2]} END)"),
+        ("EQUAL_NULL", lambda a: f"({a[0]} IS NOT DISTINCT FROM {a[1]})"),
+        ("DIV0", lambda a: f"(CASE WHEN {a[1]} = 0 THEN 0 ELSE {a[0]} / {a[1]} END)"),
+        ("ZEROIFNULL", lambda a: f"COALESCE({a[0]}, 0)"),
+        ("NVL", lambda a: f"COALESCE({a[0]}, {a[1]})"),
+        ("TRY_TO_DATE", to_date),
+        ("TO_DATE", lambda a: to_date(a, try_=False)),
+        ("TRY_TO_(?:NUMBER|NUMERIC|DECIMAL)", to_decimal),
+        ("TO_(?:NUMBER|NUMERIC|DECIMAL)", lambda a: to_decimal(a, try_=False)),
+        ("TRY_TO_DOUBLE", lambda a: f"TRY_CAST({a[0]} AS DOUBLE)"),
+        ("TO_DOUBLE", lambda a: f"CAST({a[0]} AS DOUBLE)"),
+        ("TRY_TO_TIMESTAMP(?:_NTZ)?", lambda a: f"TRY_CAST({a[0]} AS TIMESTAMP)"),
+        ("TO_TIMESTAMP(?:_NTZ)?", lambda a: f"CAST({a[0]} AS TIMESTAMP)"),
+        ("TO_(?:VARCHAR|CHAR)", lambda a: f"strftime({a[0]}, {strptime_format(a[1])})" if len(a) > 1 else f"CAST({a[0]} AS VARCHAR)"),
+        ("DATEADD", dateadd),
+        ("DATEDIFF", lambda a: f"datediff('{part(a[0])}', {a[1]}, {a[2]})"),
+        ("DATE_PART", lambda a: f"date_part('{part(a[0])}', {a[1]})"),
+        ("DATE_TRUNC", lambda a: f"date_trunc('{part(a[0])}', {a[1]})"),
+        ("ARRAY_GENERATE_RANGE", lambda a: f"range({', '.join(a)})"),
+    ]
+
+    sql = _PROTECTED.sub(protect, sql)
+    sql = _VARIANT_PATH.sub(
+        lambda m: f"json_extract{'_string' if m.group(3) else ''}({m.group(1)}, '$.{m.group(2)}')", sql
+    )
+    for name, rewrite in rules:
+        sql = _rewrite_calls(sql, name, rewrite)
+    for pattern, replacement in _TYPES:
+        sql = pattern.sub(replacement, sql)
+    sql = _CLUSTER_BY.sub("", sql)
+    sql = _DATABASE_PREFIX.sub("", sql)
+    return _PLACEHOLDER.sub(lambda m: protected[int(m.group(1))], sql)
+
+
+# ------------------------------------------------------------
+# Build
+# ------------------------------------------------------------
+def _connect(path, read_only=False):
+    import duckdb
+
+    if not read_only:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    return duckdb.connect(path, read_only=read_only)
+
+
+def _quote(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def load_file(con, table: str, data_dir: str, file_name: str, file_format: str):
+    """COPY INTO equivalent: rows that do not fit the BRONZE types are skipped (ON_ERROR = 'CONTINUE').
+
+    A Parquet copy next to the file (same stem, see pipeline.synthetic) is read instead when present.
+    """
+    path = os.path.join(data_dir, file_name)
+    parquet = os.path.splitext(path)[0] + ".parquet"
+    if os.path.exists(parquet):
+        _load_parquet(con, table, parquet, file_format)
+        return
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"{file_name} not found in {data_dir}")
+
+    options = FILE_FORMATS[file_format.upper()]
+    if options is None:
+        con.execute(f"INSERT INTO {table} SELECT json FROM read_json_objects({_quote(path)}, format='auto')")
+        return
+
+    columns = con.execute(f"DESCRIBE {table}").fetchall()
+    struct = ", ".join(f"{_quote(name)}: {_quote(dtype)}" for name, dtype, *_ in columns)
+    nullstr = ", ".join(_quote(v) for v in options["nullstr"])
+    con.execute(
+        f"INSERT INTO {table} SELECT * FROM read_csv({_quote(path)}, header=true, delim={_quote(options['delim'])}, "
+        f"quote='\"', nullstr=[{nullstr}], columns={{{struct}}}, ignore_errors=true, "
+        f"null_padding={str(options['null_padding']).lower()})"
+    )
+
+
+def _load_parquet(con, table: str, path: str, file_format: str):
+    """String-typed Parquet (one 'raw' JSON column for FF_JSON) with the same NULL_IF / skip rules."""
+    if FILE_FORMATS[file_format.upper()] is None:
+        con.execute(f"INSERT INTO {table} SELECT CAST(raw AS JSON) FROM read_parquet({_quote(path)}) WHERE json_valid(raw)")
+        return
+
+    nullstr = ", ".join(_quote(v) for v in FILE_FORMATS[file_format.upper()]["nullstr"])
+    values, fits = [], []
+    for name, dtype, *_ in con.execute(f"DESCRIBE {table}").fetchall():
+        raw = f'CASE WHEN trim("{name}") IN ({nullstr}) THEN NULL ELSE "{name}" END'
+        values.append(f'TRY_CAST({raw} AS {dtype}) AS "{name}"')
+        fits.append(f"({raw} IS NULL OR TRY_CAST({raw} AS {dtype}) IS NOT NULL)")
+    con.execute(
+        f"INSERT INTO {table} SELECT {', '.join(values)} FROM read_parquet({_quote(path)}, union_by_name=true) "
+        f"WHERE {' AND '.join(fits)}"
+    )
+
+
+def _table_name(qualified: str) -> str:
+    return ".".join(qualified.split(".")[-2:])
+
+
+def build(data_dir=None, path=None, scripts=None, log=print) -> dict:
+    """Run the local build; returns {step label: seconds}."""
+    data_dir = data_dir or DEFAULT_DATA_DIR
+    path = path or DEFAULT_DATABASE
+    steps = build_plan(scripts or LOCAL_SCRIPTS, context={"database": "ANYCOMPANY_LAB", "schema": "BRONZE"})
+
+    timings = {}
+    con = _connect(path)
+    try:
+        for schema in SCHEMAS:
+            con.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
+        con.execute("CREATE TABLE IF NOT EXISTS main.table_versions (table_name VARCHAR PRIMARY KEY, version VARCHAR)")
+
+        for step in steps:
+            if _SKIPPED.match(step["sql"]):
+                continue
+            start = time.perf_counter()
+            copy = _COPY.match(step["sql"])
+            if copy:
+                load_file(con, translate(copy.group(1)), data_dir, copy.group(2), copy.group(3))
+            else:
+                con.execute(translate(step["sql"]))
+
+            version = datetime.now(timezone.utc).isoformat(timespec="microseconds")
+            for table in step["writes"]:
+                if table.count(".") == 2:
+                    con.execute(
+                        "INSERT INTO main.table_versions VALUES (?, ?) "
+                        "ON CONFLICT (table_name) DO UPDATE SET version = excluded.version",
+                        [_table_name(table), version],
+                    )
+            timings[step["label"]] = time.perf_counter() - start
+            log(f"   ✓ {timings[step['label']]:6.2f}s  {step['label']}")
+    finally:
+        con.close()
+    return timings
+
+
+# ------------------------------------------------------------
+# Queries
+# ------------------------------------------------------------
+class LocalEngine:
+    """Read-only access to a local build, returning Snowflake-shaped Arrow results."""
+
+    def __init__(self, path=None):
+        self.path = path or os.getenv("ANYCOMPANY_DUCKDB_PATH", DEFAULT_DATABASE)
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(
+                f"{self.path} does not exist; run `python -m pipeline local-build --data-dir <files>` first."
+            )
+        self._con = _connect(self.path, read_only=True)
+        self._lock = threading.Lock()
+
+    def query_arrow(self, sql: str):
+        """Run a Snowflake query; unquoted column names come back upper-case, as in Snowflake."""
+        with self._lock:
+            cur = self._con.cursor()
+        try:
+            table = cur.execute(translate(sql)).fetch_arrow_table()
+        finally:
+            cur.close()
+        return table.rename_columns([c if c != c.lower() else c.upper() for c in table.column_names])
+
+    def stream_arrow(self, sql: str, batch_rows=50_000):
+        """Yield the result as Arrow record batches of at most batch_rows rows."""
+        with self._lock:
+            cur = self._con.cursor()
+        try:
+            cur.execute(translate(sql))
+            # to_arrow_reader replaced fetch_record_batch in DuckDB 1.4
+            reader = getattr(cur, "to_arrow_reader", None) or cur.fetch_record_batch
+            for batch in reader(batch_rows):
+                yield batch.rename_columns([c if c != c.lower() else c.upper() for c in batch.schema.names])
+        finally:
+            cur.close()
+
+    def table_versions(self, tables) -> dict:
+        """Build time of each SCHEMA.TABLE (same shape as the INFORMATION_SCHEMA probe)."""
+        by_name = {_table_name(t.upper()): t for t in tables}
+        if not by_name:
+            return {}
+        placeholders = ", ".join("?" for _ in by_name)
+        with self._lock:
+            cur = self._con.cursor()
+        try:
+            rows = cur.execute(
+                f"SELECT table_name, version FROM main.table_versions WHERE table_name IN ({placeholders})",
+                list(by_name),
+            ).fetchall()
+        finally:
+            cur.close()
+        return {by_name[name]: version for name, version in rows}
+
+    def close(self):
+        self._con.close()
@@ -0,0 +1,159 @@
+"""
+Execute a statement plan (pipeline.dag) with bounded parallelism
+Each worker thread owns its own Snowflake session, so independent statements
+really run side by side on the warehouse. A step starts as soon as all of
+its dependencies succeeded; dependents of a failed step are skipped.
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from snowflake.connector.errors import DatabaseError, OperationalError
+
+from pipeline.connection import get_snowflake_connection
+
+# Session expired / token invalid: the statement was refused, reconnect and retry
+SESSION_EXPIRED_ERRNOS = {390111, 390112, 390114}
+_CONTEXT_ORDER = ("role", "warehouse", "database", "schema")
+
+
+def is_retryable(exc, sent=True) -> bool:
+    """Session expiry, or a connection error before the step's SQL was sent.
+    An OperationalError after sending it (network drop, timeout) may come after
+    the DML committed, so that step is not retried."""
+    if isinstance(exc, DatabaseError) and getattr(exc, "errno", None) in SESSION_EXPIRED_ERRNOS:
+        return True
+    return not sent and isinstance(exc, OperationalError)
+
+
+class _Sessions:
+    """One connection per worker thread, remembering the USE state it was left in."""
+
+    def __init__(self, connect, statement_timeout=None):
+        self._connect = connect
+        self._statement_timeout = statement_timeout
+        self._local = threading.local()
+        self._all = []
+        self._lock = threading.Lock()
+
+    def get(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            if self._statement_timeout:
+                conn.cursor().execute(
+                    f"ALTER SESSION SET STATEMENT_TIMEOUT_IN_SECONDS = {int(self._statement_timeout)}"
+                )
+            self._local.conn, self._local.context = conn, {}
+            with self._lock:
+                self._all.append(conn)
+        return conn
+
+    def sent(self) -> bool:
+        """Whether the current thread's last execute() got as far as sending the step's SQL."""
+        return getattr(self._local, "sent", False)
+
+    def execute(self, step):
+        self._local.sent = False
+        conn = self.get()
+        cur = conn.cursor()
+        try:
+            for key in _CONTEXT_ORDER:
+                value = step["context"].get(key)
+                if value and self._local.context.get(key) != value:
+                    target = f"{step['context']['database']}.{value}" if key == "schema" else value
+                    cur.execute(f"USE {key.upper()} {target}")
+                    self._local.context[key] = value
+            self._local.sent = True
+            cur.execute(step["sql"])
+            return cur.rowcount
+        finally:
+            cur.close()
+            if step["sql"].lstrip().upper().startswith("CREATE"):
+                self._local.context = {}  # CREATE DATABASE/SCHEMA/WAREHOUSE switch the session
+
+    def reset(self):
+        """Drop the current thread's session (after it expired)."""
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def close(self):
+        with self._lock:
+            for conn in self._all:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._all.clear()
+
+
+def _run_step(sessions, step, retries, backoff, on_event):
+    attempt, start = 0, time.perf_counter()
+    while True:
+        attempt += 1
+        try:
+            rows = sessions.execute(step)
+            return {"status": "ok", "attempts": attempt, "rows": rows, "seconds": time.perf_counter() - start}
+        except Exception as exc:
+            if attempt > retries or not is_retryable(exc, sessions.sent()):
+                return {
+                    "status": "failed",
+                    "attempts": attempt,
+                    "error": str(exc),
+                    "seconds": time.perf_counter() - start,
+                }
+            on_event("retry", step, {"attempts": attempt, "error": str(exc)})
+            sessions.reset()
+            time.sleep(backoff * 2 ** (attempt - 1))
+
+
+def run_plan(steps, parallel=4, retries=2, backoff=2.0, statement_timeout=None, connect=None, on_event=None):
+    """Run the steps; returns {step id: result dict} (status ok / failed / skipped)."""
+    on_event = on_event or (lambda event, step, result: None)
+    sessions = _Sessions(connect or get_snowflake_connection, statement_timeout)
+
+    waiting = {s["id"]: set(s["deps"]) for s in steps}
+    dependents = {s["id"]: [] for s in steps}
+    for s in steps:
+        for d in s["deps"]:
+            dependents[d].append(s["id"])
+    by_id = {s["id"]: s for s in steps}
+    results, running = {}, {}
+
+    def skip(step_id, reason):
+        for child in dependents[step_id]:
+            if child not in results:
+                results[child] = {"status": "skipped", "attempts": 0, "seconds": 0.0, "error": reason}
+                waiting.pop(child, None)
+                on_event("skipped", by_id[child], results[child])
+                skip(child, reason)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, parallel), thread_name_prefix="pipeline") as pool:
+            while waiting or running:
+                for step_id in sorted(i for i, deps in waiting.items() if not deps):
+                    del waiting[step_id]
+                    on_event("start", by_id[step_id], None)
+                    future = pool.submit(_run_step, sessions, by_id[step_id], retries, backoff, on_event)
+                    running[future] = step_id
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step_id = running.pop(future)
+                    results[step_id] = future.result()
+                    on_event(results[step_id]["status"], by_id[step_id], results[step_id])
+                    if results[step_id]["status"] == "ok":
+                        for child in dependents[step_id]:
+                            if child in waiting:
+                                waiting[child].discard(step_id)
+                    else:
+                        skip(step_id, f"dependency #{step_id} failed")
+    finally:
+        sessions.close()
+    return results
@@ -0,0 +1,32 @@
+"""
+Split the worksheet-style scripts in sql/ into individual statements
+"""
+
+import re
+
+# String literals, line comments, block comments, or a statement separator
+_TOKEN = re.compile(r"'(?:[^']|'')*'|--[^\n]*|/\*.*?\*/|;", re.S)
+
+
+def split_statements(script: str) -> list:
+    """Return the statements of a script, without comments and trailing ';'."""
+    statements, current, pos = [], [], 0
+    for match in _TOKEN.finditer(script):
+        current.append(script[pos : match.start()])
+        token = match.group(0)
+        if token == ";":
+            statements.append("".join(current))
+            current = []
+        elif token.startswith("'"):
+            current.append(token)
+        else:
+            current.append(" ")  # comments become whitespace
+        pos = match.end()
+    current.append(script[pos:])
+    statements.append("".join(current))
+    return [s.strip() for s in statements if s.strip()]
+
+
+def read_statements(path: str) -> list:
+    with open(path, "r", encoding="utf-8") as f:
+        return split_statements(f.read())
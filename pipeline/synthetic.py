@@ -0,0 +1,582 @@
+"""
+Synthetic BRONZE source files for scale tests
+Writes the eleven files loaded by sql/phase_1/3_load_data.sql (same names,
+columns and delimiters), plus optional Parquet copies, at any multiple of
+the original volumes. Rows are generated with NumPy one chunk at a time, so
+memory stays flat whatever the scale.
+
+Realism knobs: region and seasonal/weekday date skew, promotions released in
+regional waves (overlapping promos), campaigns anchored on promotions, a
+sales uplift inside promo windows, and a share of dirty rows exercising each
+rule of sql/phase_1/5_clean_data.sql (blank/duplicate ids, padded strings,
+out-of-range values, reversed date ranges, less complete duplicates...).
+
+Usage:
+    python -m pipeline generate --out DIR --scale 10 [--formats native parquet]
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+START_DATE, END_DATE = np.datetime64("2010-01-01"), np.datetime64("2023-12-31")
+
+# Row counts at scale 1 (roughly the size of the original extracts)
+BASE_ROWS = {
+    "CUSTOMER_DEMOGRAPHICS": 5000,
+    "CUSTOMER_SERVICE_INTERACTIONS": 5000,
+    "FINANCIAL_TRANSACTIONS": 5000,
+    "PROMOTIONS_DATA": 300,
+    "MARKETING_CAMPAIGNS": 1000,
+    "PRODUCT_REVIEWS": 5000,
+    "LOGISTICS_AND_SHIPPING": 5000,
+    "SUPPLIER_INFORMATION": 500,
+    "EMPLOYEE_RECORDS": 1000,
+    "INVENTORY_RAW": 5000,
+    "STORE_LOCATIONS_RAW": 1000,
+}
+
+# table -> (file name in the stage, format)
+FILES = {
+    "CUSTOMER_DEMOGRAPHICS": ("customer_demographics.csv", "csv"),
+    "CUSTOMER_SERVICE_INTERACTIONS": ("customer_service_interactions.csv", "csv"),
+    "FINANCIAL_TRANSACTIONS": ("financial_transactions.csv", "csv"),
+    "PROMOTIONS_DATA": ("promotions-data.csv", "csv"),
+    "MARKETING_CAMPAIGNS": ("marketing_campaigns.csv", "csv"),
+    "PRODUCT_REVIEWS": ("product_reviews.csv", "tsv"),
+    "LOGISTICS_AND_SHIPPING": ("logistics_and_shipping.csv", "csv"),
+    "SUPPLIER_INFORMATION": ("supplier_information.csv", "csv"),
+    "EMPLOYEE_RECORDS": ("employee_records.csv", "csv"),
+    "INVENTORY_RAW": ("inventory.json", "json"),
+    "STORE_LOCATIONS_RAW": ("store_locations.json", "json"),
+}
+
+REGIONS = {
+    "North America": (0.24, ["United States", "Canada", "Mexico"]),
+    "Europe": (0.22, ["France", "Germany", "United Kingdom", "Spain", "Italy"]),
+    "Asia": (0.20, ["China", "Japan", "India", "South Korea", "Vietnam"]),
+    "South America": (0.14, ["Brazil", "Argentina", "Chile", "Colombia"]),
+    "Middle East and North Africa": (0.10, ["Morocco", "Egypt", "United Arab Emirates", "Saudi Arabia"]),
+    "Africa": (0.10, ["Nigeria", "Kenya", "South Africa", "Ghana"]),
+}
+CATEGORIES = ["Organic Beverages", "Organic Snacks", "Organic Meal Solutions"]
+PROMOTION_TYPES = [
+    "BOGO Beverage Bash", "Bavarian Bites", "Crispy Carnival", "December Delight", "Europa Edibles",
+    "February Fuel-Up", "Indian Indulgence", "January Jewels", "Korean Cuisine Kickoff", "Nibble Nirvana",
+    "October Oasis", "Sip into Savings", "Spicy September", "Tasty Turkey",
+]
+TRANSACTION_TYPES = ["Sale", "Investment", "Tax Payment", "Refund", "Expense"]
+FIRST_NAMES = ["Amina", "Liam", "Sofia", "Kenji", "Lucas", "Fatima", "Noah", "Mei", "Omar", "Emma", "Diego", "Aisha"]
+LAST_NAMES = ["Smith", "Garcia", "Chen", "Okafor", "Müller", "Rossi", "Tanaka", "Haddad", "Silva", "Dubois"]
+CITIES = ["Capital City", "Harbor Town", "Riverside", "Hillview", "Lakeside", "Old Town", "Northgate"]
+
+
+# ------------------------------------------------------------
+# Vectorized helpers
+# ------------------------------------------------------------
+def _pick(rng, values, n, p=None) -> np.ndarray:
+    return np.asarray(values, dtype=object)[rng.choice(len(values), size=n, p=p)]
+
+
+def _regions(rng, n) -> np.ndarray:
+    weights = np.array([w for w, _ in REGIONS.values()])
+    return _pick(rng, list(REGIONS), n, weights / weights.sum())
+
+
+def _countries(rng, regions) -> np.ndarray:
+    out = np.empty(len(regions), dtype=object)
+    for region, (_, countries) in REGIONS.items():
+        rows = regions == region
+        out[rows] = _pick(rng, countries, int(rows.sum()))
+    return out
+
+
+def _day_weights() -> np.ndarray:
+    days = np.arange(START_DATE, END_DATE + 1)
+    month = days.astype("datetime64[M]").astype(int) % 12 + 1
+    weekday = (days.astype(int) + 3) % 7  # 0 = Monday
+    trend = np.linspace(0.8, 1.2, len(days))
+    weights = trend * np.where(np.isin(month, (11, 12)), 1.5, 1.0) * np.where(weekday >= 5, 1.15, 1.0)
+    return weights / weights.sum()
+
+
+_DAY_P = _day_weights()
+
+
+def _dates(rng, n) -> np.ndarray:
+    return START_DATE + rng.choice(len(_DAY_P), size=n, p=_DAY_P).astype("timedelta64[D]")
+
+
+def _iso(days) -> np.ndarray:
+    out = np.datetime_as_string(days, unit="D").astype(object)
+    out[np.isnat(days)] = None
+    return out
+
+
+def _fmt(values, pattern="%.2f") -> np.ndarray:
+    values = np.asarray(values, dtype=float)
+    out = np.char.mod(pattern, np.nan_to_num(values)).astype(object)
+    out[np.isnan(values)] = None
+    return out
+
+
+def _ids(prefix, start, n, width=8) -> np.ndarray:
+    numbers = np.char.zfill(np.arange(start, start + n).astype(str), width)
+    return np.char.add(prefix, numbers).astype(object)
+
+
+def _names(rng, n) -> np.ndarray:
+    return (_pick(rng, FIRST_NAMES, n) + " " + _pick(rng, LAST_NAMES, n)).astype(object)
+
+
+class _Dirt:
+    """Applies the defects the SILVER cleaning has to deal with, on a share of rows."""
+
+    def __init__(self, rng, n, rate):
+        self.rng, self.n, self.rate = rng, n, rate
+
+    def mask(self, share=1.0) -> np.ndarray:
+        return self.rng.random(self.n) < self.rate * share
+
+    def blank(self, values, share=1.0):
+        rows = self.mask(share)
+        values[rows] = _pick(self.rng, ["", "  ", None], int(rows.sum()))
+        return values
+
+    def pad(self, values, share=1.0):
+        rows = self.mask(share) & pd.notna(values)
+        values[rows] = " " + values[rows].astype(str) + "  "
+        return values
+
+    def replace(self, values, choices, share=1.0):
+        rows = self.mask(share)
+        values[rows] = _pick(self.rng, choices, int(rows.sum()))
+        return values
+
+    def duplicate_rows(self, frame: pd.DataFrame, share=1.0) -> pd.DataFrame:
+        """Append copies of random rows (same id), some of them less complete."""
+        count = int(self.rng.binomial(self.n, min(self.rate * share, 1.0)))
+        if count == 0 or frame.empty:
+            return frame
+        frame = frame.astype(object)
+        copies = frame.iloc[self.rng.integers(0, len(frame), count)].copy()
+        for col in copies.columns[1:]:
+            drop = self.rng.random(count) < 0.3
+            copies.loc[drop, col] = None
+        return pd.concat([frame, copies], ignore_index=True)
+
+
+# ------------------------------------------------------------
+# Tables
+# ------------------------------------------------------------
+def make_promotions(rng, n, dirty_rate):
+    """Promotions in regional waves: a third start within ten days of another one."""
+    regions = _regions(rng, n)
+    starts = _dates(rng, n)
+    waves = rng.random(n) < 0.35
+    anchors = rng.integers(0, n, n)
+    starts[waves] = starts[anchors[waves]] + rng.integers(-10, 11, int(waves.sum())).astype("timedelta64[D]")
+    regions[waves] = regions[anchors[waves]]
+    ends = starts + rng.integers(2, 45, n).astype("timedelta64[D]")
+
+    dirt = _Dirt(rng, n, dirty_rate)
+    discount = np.round(rng.beta(2, 8, n) * 0.6 + 0.05, 2)
+    discount[dirt.mask(0.5)] *= 100  # "15" instead of 0.15
+    swapped = dirt.mask(0.5)
+    starts[swapped], ends[swapped] = ends[swapped], starts[swapped]
+    ends[dirt.mask(0.3)] = np.datetime64("NaT")
+
+    frame = pd.DataFrame(
+        {
+            "promotion_id": dirt.blank(_ids("PROMO", 1, n, 6), 0.3),
+            "product_category": dirt.blank(_pick(rng, CATEGORIES, n, [0.4, 0.35, 0.25]), 0.3),
+            "promotion_type": dirt.pad(_pick(rng, PROMOTION_TYPES, n)),
+            "discount_percentage": _fmt(discount),
+            "start_date": _iso(starts),
+            "end_date": _iso(ends),
+            "region": dirt.blank(regions.copy(), 0.3),
+        }
+    )
+    return dirt.duplicate_rows(frame, 0.5)
+
+
+def _promo_windows(promotions: pd.DataFrame) -> dict:
+    """The clean promotion windows as plain arrays (start, days, region, category)."""
+    valid = promotions.dropna(subset=["start_date", "end_date", "region", "product_category"])
+    valid = valid[(valid["start_date"] <= valid["end_date"]) & (valid["region"].str.strip() != "")]
+    start = pd.to_datetime(valid["start_date"]).to_numpy().astype("datetime64[D]")
+    end = pd.to_datetime(valid["end_date"]).to_numpy().astype("datetime64[D]")
+    return {
+        "start": start,
+        "days": (end - start).astype(int) + 1,
+        "region": valid["region"].str.strip().to_numpy(dtype=object),
+        "category": valid["product_category"].to_numpy(dtype=object),
+    }
+
+
+def make_campaigns(rng, n, start, dirty_rate, promos):
+    """Campaigns; 40% are launched around a promotion of the same region/category."""
+    regions = _regions(rng, n)
+    categories = _pick(rng, CATEGORIES, n)
+    starts = _dates(rng, n)
+    anchored = rng.random(n) < 0.4
+    if len(promos["start"]) and anchored.any():
+        picks = rng.integers(0, len(promos["start"]), int(anchored.sum()))
+        shift = rng.integers(-15, 16, len(picks)).astype("timedelta64[D]")
+        starts[anchored] = promos["start"][picks] + shift
+        regions[anchored] = promos["region"][picks]
+        categories[anchored] = promos["category"][picks]
+    ends = starts + rng.integers(7, 90, n).astype("timedelta64[D]")
+
+    dirt = _Dirt(rng, n, dirty_rate)
+    budget = np.round(rng.lognormal(8.8, 0.5, n), 2)
+    budget[dirt.mask(0.3)] *= -1
+    budget[dirt.mask(0.3)] = 0
+    budget[dirt.mask(0.3)] = np.nan
+    reach = rng.integers(1_000, 120_000, n).astype(float)
+    reach[dirt.mask(0.3)] *= -1
+    conversion = np.round(rng.beta(2, 30, n), 4)
+    conversion[dirt.mask(0.3)] = 1.5
+    swapped = dirt.mask(0.3)
+    starts[swapped], ends[swapped] = ends[swapped], starts[swapped]
+
+    frame = pd.DataFrame(
+        {
+            "campaign_id": dirt.blank(_ids("CAMP", start + 1, n, 8), 0.3),
+            "campaign_name": (_pick(rng, ["Fresh", "Green", "Pure", "Harvest", "Vital"], n) + " "
+                              + _pick(rng, ["Launch", "Push", "Boost", "Wave"], n)).astype(object),
+            "campaign_type": _pick(rng, ["Email", "Social Media", "TV", "Print", "Influencer", "Search"], n),
+            "product_category": categories,
+            "target_audience": _pick(rng, ["Families", "Young Adults", "Seniors", "Health Enthusiasts"], n),
+            "start_date": _iso(starts),
+            "end_date": _iso(ends),
+            "region": dirt.pad(regions),
+            "budget": _fmt(budget),
+            "reach": _fmt(reach, "%.0f"),
+            "conversion_rate": _fmt(conversion, "%.4f"),
+        }
+    )
+    return dirt.duplicate_rows(frame, 0.5)
+
+
+def make_transactions(rng, n, start, dirty_rate, promos):
+    """Five transaction types; 15% of sales are drawn inside a promo window (uplift)."""
+    types = _pick(rng, TRANSACTION_TYPES, n)
+    dates, regions = _dates(rng, n), _regions(rng, n)
+
+    uplift = (types == "Sale") & (rng.random(n) < 0.15)
+    if len(promos["start"]) and uplift.any():
+        picks = rng.integers(0, len(promos["start"]), int(uplift.sum()))
+        offset = (rng.random(len(picks)) * promos["days"][picks]).astype(int).astype("timedelta64[D]")
+        dates[uplift] = promos["start"][picks] + offset
+        regions[uplift] = promos["region"][picks]
+
+    dirt = _Dirt(rng, n, dirty_rate)
+    amount = np.round(rng.lognormal(8.2, 0.6, n), 2)
+    amount[dirt.mask(0.5)] *= -1
+    amount[dirt.mask(0.3)] = 0
+    amount[dirt.mask(0.3)] = np.nan
+    dates[dirt.mask(0.2)] = np.datetime64("NaT")
+
+    frame = pd.DataFrame(
+        {
+            "transaction_id": dirt.blank(_ids("TXN", start + 1, n, 10), 0.2),
+            "transaction_date": _iso(dates),
+            "transaction_type": dirt.pad(types),
+            "amount": _fmt(amount),
+            "payment_method": _pick(rng, ["Credit Card", "Bank Transfer", "Cash", "PayPal"], n),
+            "entity": _pick(rng, ["AnyCompany Retail", "AnyCompany Online", "AnyCompany Wholesale"], n),
+            "region": dirt.blank(regions, 0.3),
+            "account_code": _pick(rng, [f"ACC{i:04d}" for i in range(1, 60)], n),
+        }
+    )
+    return dirt.duplicate_rows(frame, 0.5)
+
+
+def make_customers(rng, n, start, dirty_rate):
+    regions = _regions(rng, n)
+    dirt = _Dirt(rng, n, dirty_rate)
+    income = np.round(rng.normal(110_000, 35_000, n).clip(12_000), 2)
+    income[dirt.mask(0.3)] *= -1
+    dob = START_DATE - rng.integers(18 * 365, 75 * 365, n).astype("timedelta64[D]")
+    frame = pd.DataFrame(
+        {
+            "customer_id": np.arange(start + 1, start + n + 1).astype(str).astype(object),
+            "name": dirt.blank(_names(rng, n), 0.5),
+            "date_of_birth": _iso(dob),
+            "gender": _pick(rng, ["Female", "Male", "Other"], n),
+            "region": dirt.pad(regions),
+            "country": _countries(rng, regions),
+            "city": dirt.blank(_pick(rng, CITIES, n), 0.5),
+            "marital_status": _pick(rng, ["Married", "Single", "Widowed", "Divorced"], n),
+            "annual_income": _fmt(income),
+        }
+    )
+    return dirt.duplicate_rows(frame)
+
+
+def make_service(rng, n, start, dirty_rate):
+    dirt = _Dirt(rng, n, dirty_rate)
+    duration = rng.integers(1, 90, n).astype(float)
+    duration[dirt.mask(0.5)] = rng.choice([-5, 900, 1440])
+    satisfaction = rng.choice([1, 2, 3, 4, 5], n, p=[0.08, 0.12, 0.25, 0.3, 0.25]).astype(float)
+    satisfaction[dirt.mask(0.5)] = rng.choice([0, 9])
+    frame = pd.DataFrame(
+        {
+            "interaction_id": dirt.blank(_ids("INT", start + 1, n, 9), 0.3),
+            "interaction_date": _iso(_dates(rng, n)),
+            "interaction_type": _pick(rng, ["Phone", "Email", "Chat", "In-Person"], n),
+            "issue_category": _pick(rng, ["Billing", "Product Quality", "Delivery", "Returns", "Technical"], n),
+            "description": _pick(rng, ["Customer reported an issue", "Follow-up request", "General inquiry"], n),
+            "duration_minutes": _fmt(duration, "%.0f"),
+            "resolution_status": dirt.pad(_pick(rng, ["Resolved", "Pending", "Escalated"], n, [0.7, 0.2, 0.1])),
+            "follow_up_required": _pick(rng, ["Yes", "No", "Y", "N", "TRUE", "false"], n),
+            "customer_satisfaction": _fmt(satisfaction, "%.0f"),
+        }
+    )
+    return dirt.duplicate_rows(frame, 0.5)
+
+
+def make_reviews(rng, n, start, dirty_rate):
+    dirt = _Dirt(rng, n, dirty_rate)
+    rating = _pick(rng, ["1", "2", "3", "4", "5"], n, [0.05, 0.08, 0.17, 0.35, 0.35])
+    frame = pd.DataFrame(
+        {
+            "review_id": np.arange(start + 1, start + n + 1).astype(str).astype(object),
+            "product_id": dirt.blank(_pick(rng, [f"PRD{i:05d}" for i in range(1, 2000)], n), 0.3),
+            "reviewer_id": _pick(rng, [f"USR{i:06d}" for i in range(1, 5000)], n),
+            "reviewer_name": _names(rng, n),
+            "rating": dirt.replace(rating, ["0", "7", "five", "", "4.5"]),
+            "review_date": _iso(_dates(rng, n)),
+            "review_title": _pick(rng, ["Great taste", "Not for me", "Good value", "Would buy again"], n),
+            "review_text": dirt.blank(_pick(rng, ["Loved it.", "Too sweet.", "Fresh and tasty.", "Arrived late."], n)),
+            "product_category": dirt.blank(_pick(rng, CATEGORIES, n), 0.5),
+        }
+    )
+    return dirt.duplicate_rows(frame, 0.5)
+
+
+def make_logistics(rng, n, start, dirty_rate):
+    regions = _regions(rng, n)
+    ship = _dates(rng, n)
+    eta = ship + rng.integers(1, 15, n).astype("timedelta64[D]")
+    dirt = _Dirt(rng, n, dirty_rate)
+    late = dirt.mask(0.5)
+    eta[late] = ship[late] - rng.integers(1, 5, int(late.sum())).astype("timedelta64[D]")
+    cost = np.round(rng.gamma(2.0, 25.0, n), 2)
+    cost[dirt.mask(0.5)] *= -1
+    frame = pd.DataFrame(
+        {
+            "shipment_id": dirt.blank(_ids("SHP", start + 1, n, 9), 0.3),
+            "order_id": _ids("ORD", start + 1, n, 9),
+            "ship_date": _iso(ship),
+            "estimated_delivery": _iso(eta),
+            "shipping_method": _pick(rng, ["Standard", "Express", "Overnight"], n, [0.6, 0.3, 0.1]),
+            "status": _pick(rng, ["Delivered", "In Transit", "Delayed", "Returned"], n, [0.7, 0.15, 0.1, 0.05]),
+            "shipping_cost": _fmt(cost),
+            "destination_region": regions,
+            "destination_country": _countries(rng, regions),
+            "carrier": dirt.pad(_pick(rng, ["DHL", "FedEx", "UPS", "Maersk", "Local Courier"], n)),
+        }
+    )
+    return dirt.duplicate_rows(frame, 0.5)
+
+
+def make_suppliers(rng, n, start, dirty_rate):
+    regions = _regions(rng, n)
+    dirt = _Dirt(rng, n, dirty_rate)
+    lead = rng.integers(2, 60, n).astype(float)
+    lead[dirt.mask(0.5)] = 400
+    reliability = np.round(rng.beta(8, 2, n), 3)
+    reliability[dirt.mask(0.5)] = 1.5
+    frame = pd.DataFrame(
+        {
+            "supplier_id": dirt.blank(_ids("SUP", start + 1, n, 6), 0.3),
+            "supplier_name": (_pick(rng, ["Green", "Terra", "Nature's", "Sunrise", "Golden"], n) + " "
+                              + _pick(rng, ["Farms", "Foods", "Organics", "Growers"], n)).astype(object),
+            "product_category": _pick(rng, CATEGORIES, n),
+            "region": regions,
+            "country": _countries(rng, regions),
+            "city": _pick(rng, CITIES, n),
+            "lead_time": _fmt(lead, "%.0f"),
+            "reliability_score": _fmt(reliability, "%.3f"),
+            "quality_rating": dirt.blank(_pick(rng, ["A", "B", "C", "D"], n, [0.3, 0.4, 0.2, 0.1])),
+        }
+    )
+    return dirt.duplicate_rows(frame)
+
+
+def make_employees(rng, n, start, dirty_rate):
+    regions = _regions(rng, n)
+    dirt = _Dirt(rng, n, dirty_rate)
+    salary = np.round(rng.lognormal(11.0, 0.35, n), 2)
+    salary[dirt.mask(0.3)] = 0
+    salary[dirt.mask(0.3)] = np.nan
+    ids = _ids("EMP", start + 1, n, 7)
+    email = np.char.add(np.char.lower(ids.astype(str)), "@anycompany.com").astype(object)
+    mailto = dirt.mask(1.0)
+    email[mailto] = "mailto:" + email[mailto]
+    frame = pd.DataFrame(
+        {
+            "employee_id": dirt.blank(ids.copy(), 0.2),
+            "name": _names(rng, n),
+            "date_of_birth": _iso(START_DATE - rng.integers(20 * 365, 60 * 365, n).astype("timedelta64[D]")),
+            "hire_date": _iso(_dates(rng, n)),
+            "department": _pick(rng, ["Sales", "Marketing", "Operations", "Finance", "HR", "IT"], n),
+            "job_title": _pick(rng, ["Analyst", "Manager", "Associate", "Director", "Specialist"], n),
+            "salary": _fmt(salary),
+            "region": regions,
+            "country": _countries(rng, regions),
+            "email": email,
+        }
+    )
+    return dirt.duplicate_rows(frame)
+
+
+def make_inventory(rng, n, start, dirty_rate):
+    regions = _regions(rng, n)
+    dirt = _Dirt(rng, n, dirty_rate)
+    stock = rng.integers(0, 2_000, n).astype(object)
+    stock[dirt.mask(0.5)] = -10
+    stock[dirt.mask(0.3)] = "N/A"
+    frame = pd.DataFrame(
+        {
+            "product_id": dirt.blank(_ids("PRD", start + 1, n, 7), 0.3),
+            "product_category": _pick(rng, CATEGORIES, n),
+            "region": regions,
+            "country": _countries(rng, regions),
+            "warehouse": _pick(rng, ["WH-North", "WH-South", "WH-East", "WH-West"], n),
+            "current_stock": stock,
+            "reorder_point": rng.integers(20, 300, n),
+            "lead_time": rng.integers(1, 30, n),
+            "last_restock_date": _iso(_dates(rng, n)),
+        }
+    )
+    return dirt.duplicate_rows(frame)
+
+
+def make_stores(rng, n, start, dirty_rate):
+    regions = _regions(rng, n)
+    dirt = _Dirt(rng, n, dirty_rate)
+    footage = np.round(rng.uniform(800, 12_000, n), 0)
+    footage[dirt.mask(0.5)] = 0
+    employees = rng.integers(5, 150, n)
+    employees[dirt.mask(0.5)] = -3
+    frame = pd.DataFrame(
+        {
+            "store_id": _ids("STR", start + 1, n, 6),
+            "store_name": ("AnyCompany " + _pick(rng, CITIES, n)).astype(object),
+            "store_type": _pick(rng, ["Supermarket", "Convenience", "Hypermarket", "Online Hub"], n),
+            "region": regions,
+            "country": _countries(rng, regions),
+            "city": _pick(rng, CITIES, n),
+            "address": np.char.add(rng.integers(1, 999, n).astype(str), " Main Street").astype(object),
+            "postal_code": np.char.zfill(rng.integers(0, 99_999, n).astype(str), 5).astype(object),
+            "square_footage": footage,
+            "employee_count": employees,
+        }
+    )
+    # Store files are known to repeat store_id with partial rows
+    return dirt.duplicate_rows(frame, 3.0)
+
+
+# ------------------------------------------------------------
+# Writers
+# ------------------------------------------------------------
+class _TableWriter:
+    """Streams chunks to the stage-format file and, optionally, a Parquet copy."""
+
+    def __init__(self, out_dir, file_name, kind, formats):
+        self.kind, self.formats = kind, formats
+        self.path = os.path.join(out_dir, file_name)
+        self.parquet_path = os.path.splitext(self.path)[0] + ".parquet"
+        self._csv = self._parquet = self._json = None
+        self.rows = 0
+
+    def write(self, frame: pd.DataFrame):
+        if self.kind == "json":
+            lines = frame.to_json(orient="records", lines=True, force_ascii=False).splitlines()
+            if "native" in self.formats:
+                if self._json is None:
+                    self._json = open(self.path, "w", encoding="utf-8")
+                    self._json.write("[\n")
+                else:
+                    self._json.write(",\n")
+                self._json.write(",\n".join(lines))
+            table = pa.table({"raw": pa.array(lines, pa.string())})
+        else:
+            table = pa.Table.from_pandas(frame.astype(object).where(frame.notna(), None), preserve_index=False)
+            table = table.cast(pa.schema([(c, pa.string()) for c in frame.columns]))
+            if "native" in self.formats:
+                if self._csv is None:
+                    options = pacsv.WriteOptions(delimiter="\t" if self.kind == "tsv" else ",")
+                    self._csv = pacsv.CSVWriter(self.path, table.schema, write_options=options)
+                self._csv.write_table(table)
+
+        if "parquet" in self.formats:
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(self.parquet_path, table.schema)
+            self._parquet.write_table(table)
+        self.rows += len(frame)
+
+    def close(self):
+        if self._json is not None:
+            self._json.write("\n]\n")
+            self._json.close()
+        for writer in (self._csv, self._parquet):
+            if writer is not None:
+                writer.close()
+
+
+_CHUNKED = {
+    "MARKETING_CAMPAIGNS": lambda rng, n, start, rate, promos: make_campaigns(rng, n, start, rate, promos),
+    "FINANCIAL_TRANSACTIONS": lambda rng, n, start, rate, promos: make_transactions(rng, n, start, rate, promos),
+    "CUSTOMER_DEMOGRAPHICS": lambda rng, n, start, rate, promos: make_customers(rng, n, start, rate),
+    "CUSTOMER_SERVICE_INTERACTIONS": lambda rng, n, start, rate, promos: make_service(rng, n, start, rate),
+    "PRODUCT_REVIEWS": lambda rng, n, start, rate, promos: make_reviews(rng, n, start, rate),
+    "LOGISTICS_AND_SHIPPING": lambda rng, n, start, rate, promos: make_logistics(rng, n, start, rate),
+    "SUPPLIER_INFORMATION": lambda rng, n, start, rate, promos: make_suppliers(rng, n, start, rate),
+    "EMPLOYEE_RECORDS": lambda rng, n, start, rate, promos: make_employees(rng, n, start, rate),
+    "INVENTORY_RAW": lambda rng, n, start, rate, promos: make_inventory(rng, n, start, rate),
+    "STORE_LOCATIONS_RAW": lambda rng, n, start, rate, promos: make_stores(rng, n, start, rate),
+}
+
+
+def generate(out_dir, scale=1.0, tables=None, formats=("native",), chunk_rows=250_000, dirty_rate=0.03, seed=42, log=print):
+    """Write the BRONZE source files; returns {table: rows written}."""
+    os.makedirs(out_dir, exist_ok=True)
+    tables = [t.upper() for t in (tables or FILES)]
+    rows = {t: max(1, int(round(BASE_ROWS[t] * scale))) for t in FILES}
+    written = {}
+
+    # Promotions drive campaigns and sales uplift; the only table kept in memory (~6% of the sales rows)
+    promotions = make_promotions(np.random.default_rng([seed, 0]), rows["PROMOTIONS_DATA"], dirty_rate)
+    promos = _promo_windows(promotions)
+
+    for index, table in enumerate(FILES):
+        if table not in tables:
+            continue
+        file_name, kind = FILES[table]
+        writer = _TableWriter(out_dir, file_name, kind, formats)
+        try:
+            if table == "PROMOTIONS_DATA":
+                writer.write(promotions)
+            else:
+                for chunk, start in enumerate(range(0, rows[table], chunk_rows)):
+                    rng = np.random.default_rng([seed, index, chunk])
+                    n = min(chunk_rows, rows[table] - start)
+                    writer.write(_CHUNKED[table](rng, n, start, dirty_rate, promos))
+        finally:
+            writer.close()
+        written[table] = writer.rows
+        target = file_name if "native" in formats else os.path.basename(writer.parquet_path)
+        log(f"   ✓ {table:<32} {writer.rows:>12,} rows → {target}")
+
+    with open(os.path.join(out_dir, "_generator.json"), "w") as f:
+        json.dump({"scale": scale, "seed": seed, "dirty_rate": dirty_rate, "rows": written}, f, indent=2)
+    return written
@@ -33,6 +33,11 @@ QUALIFY ROW_NUMBER() OVER (
 ) = 1;
 
 -- Amount quality filter (apply after creation)
+-- Rejected winners stay as tombstones for the incremental MERGE (7_incremental_merge.sql)
+CREATE OR REPLACE TABLE SILVER.FINANCIAL_TRANSACTIONS_REJECTED AS
+SELECT * FROM SILVER.FINANCIAL_TRANSACTIONS_CLEAN
+WHERE amount IS NULL OR amount <= 0;
+
 DELETE FROM SILVER.FINANCIAL_TRANSACTIONS_CLEAN
 WHERE amount IS NULL OR amount <= 0;
 
@@ -137,6 +142,12 @@ QUALIFY ROW_NUMBER() OVER (
     TRY_TO_NUMBER(REPLACE(reach::VARCHAR, ' ', '')) DESC NULLS LAST
 ) = 1;
 
+-- Rejected winners stay as tombstones for the incremental MERGE (7_incremental_merge.sql)
+CREATE OR REPLACE TABLE SILVER.MARKETING_CAMPAIGNS_REJECTED AS
+SELECT * FROM SILVER.MARKETING_CAMPAIGNS_CLEAN
+WHERE budget IS NULL OR budget <= 0
+   OR reach IS NULL OR reach < 0;
+
 DELETE FROM SILVER.MARKETING_CAMPAIGNS_CLEAN
 WHERE budget IS NULL OR budget <= 0
    OR reach IS NULL OR reach < 0;
@@ -202,6 +213,12 @@ QUALIFY ROW_NUMBER() OVER (
     IFF(review_text IS NULL OR TRIM(review_text) = '', 0, 1) DESC
 ) = 1;
 
+-- Rejected winners stay as tombstones for the incremental MERGE (7_incremental_merge.sql)
+CREATE OR REPLACE TABLE SILVER.PRODUCT_REVIEWS_REJECTED AS
+SELECT * FROM SILVER.PRODUCT_REVIEWS_CLEAN
+WHERE rating < 1
+   OR rating > 5;
+
 DELETE FROM SILVER.PRODUCT_REVIEWS_CLEAN
 WHERE rating < 1
    OR rating > 5;
@@ -268,6 +285,11 @@ QUALIFY ROW_NUMBER() OVER (
 ) = 1;
 
 -- Post-creation quality rules (optional but clean) negative income → removed / 
+-- Rejected winners stay as tombstones for the incremental MERGE (7_incremental_merge.sql)
+CREATE OR REPLACE TABLE SILVER.CUSTOMER_DEMOGRAPHICS_REJECTED AS
+SELECT * FROM SILVER.CUSTOMER_DEMOGRAPHICS_CLEAN
+WHERE annual_income < 0;
+
 DELETE FROM SILVER.CUSTOMER_DEMOGRAPHICS_CLEAN
 WHERE annual_income < 0;
 
@@ -303,6 +325,11 @@ QUALIFY ROW_NUMBER() OVER (
 
 -- Post-creation quality rules
 -- Remove negative costs
+-- Rejected winners stay as tombstones for the incremental MERGE (7_incremental_merge.sql)
+CREATE OR REPLACE TABLE SILVER.LOGISTICS_AND_SHIPPING_REJECTED AS
+SELECT * FROM SILVER.LOGISTICS_AND_SHIPPING_CLEAN
+WHERE shipping_cost < 0;
+
 DELETE FROM SILVER.LOGISTICS_AND_SHIPPING_CLEAN
 WHERE shipping_cost < 0;
 
@@ -450,6 +477,11 @@ QUALIFY ROW_NUMBER() OVER (
 
 -- Post-creation quality rules
 -- Salary must be > 0:
+-- Rejected winners stay as tombstones for the incremental MERGE (7_incremental_merge.sql)
+CREATE OR REPLACE TABLE SILVER.EMPLOYEE_RECORDS_REJECTED AS
+SELECT * FROM SILVER.EMPLOYEE_RECORDS_CLEAN
+WHERE salary IS NULL OR salary <= 0;
+
 DELETE FROM SILVER.EMPLOYEE_RECORDS_CLEAN
 WHERE salary IS NULL OR salary <= 0;
 
@@ -0,0 +1,47 @@
+-- STEP 6 – Change tracking on BRONZE for incremental SILVER refresh
+
+-- Append-only streams record the rows loaded by COPY INTO since the last
+-- time they were consumed. CREATE OR REPLACE resets every offset to "now", so
+-- run this just BEFORE a full build (5_clean_data.sql): rows loaded while the
+-- full build runs are then merged again by 7_incremental_merge.sql, which is
+-- harmless because the MERGE keeps the same winning row.
+-- Re-creating a BRONZE table (2_create_tables.sql) makes its stream stale;
+-- run a full build again in that case (python -m pipeline.incremental --full).
+
+USE DATABASE ANYCOMPANY_LAB;
+USE SCHEMA BRONZE;
+
+CREATE OR REPLACE STREAM BRONZE.FINANCIAL_TRANSACTIONS_STREAM
+  ON TABLE BRONZE.FINANCIAL_TRANSACTIONS APPEND_ONLY = TRUE;
+
+CREATE OR REPLACE STREAM BRONZE.PROMOTIONS_DATA_STREAM
+  ON TABLE BRONZE.PROMOTIONS_DATA APPEND_ONLY = TRUE;
+
+CREATE OR REPLACE STREAM BRONZE.MARKETING_CAMPAIGNS_STREAM
+  ON TABLE BRONZE.MARKETING_CAMPAIGNS APPEND_ONLY = TRUE;
+
+CREATE OR REPLACE STREAM BRONZE.PRODUCT_REVIEWS_STREAM
+  ON TABLE BRONZE.PRODUCT_REVIEWS APPEND_ONLY = TRUE;
+
+CREATE OR REPLACE STREAM BRONZE.CUSTOMER_DEMOGRAPHICS_STREAM
+  ON TABLE BRONZE.CUSTOMER_DEMOGRAPHICS APPEND_ONLY = TRUE;
+
+CREATE OR REPLACE STREAM BRONZE.LOGISTICS_AND_SHIPPING_STREAM
+  ON TABLE BRONZE.LOGISTICS_AND_SHIPPING APPEND_ONLY = TRUE;
+
+CREATE OR REPLACE STREAM BRONZE.CUSTOMER_SERVICE_INTERACTIONS_STREAM
+  ON TABLE BRONZE.CUSTOMER_SERVICE_INTERACTIONS APPEND_ONLY = TRUE;
+
+CREATE OR REPLACE STREAM BRONZE.SUPPLIER_INFORMATION_STREAM
+  ON TABLE BRONZE.SUPPLIER_INFORMATION APPEND_ONLY = TRUE;
+
+CREATE OR REPLACE STREAM BRONZE.EMPLOYEE_RECORDS_STREAM
+  ON TABLE BRONZE.EMPLOYEE_RECORDS APPEND_ONLY = TRUE;
+
+CREATE OR REPLACE STREAM BRONZE.INVENTORY_RAW_STREAM
+  ON TABLE BRONZE.INVENTORY_RAW APPEND_ONLY = TRUE;
+
+CREATE OR REPLACE STREAM BRONZE.STORE_LOCATIONS_RAW_STREAM
+  ON TABLE BRONZE.STORE_LOCATIONS_RAW APPEND_ONLY = TRUE;
+
+SHOW STREAMS IN SCHEMA BRONZE;
@@ -0,0 +1,1054 @@
+-- STEP 7 – Incremental SILVER refresh (MERGE from BRONZE streams)
+
+-- Same cleaning rules as 5_clean_data.sql, applied only to the rows loaded
+-- since the last refresh (streams from 6_incremental_streams.sql):
+--   1. the delta is cleaned and deduplicated with the same QUALIFY as the full build,
+--   2. an incoming row replaces the SILVER row with the same key only if it
+--      would have won the full build's ROW_NUMBER() ordering,
+--   3. the post-creation quality rules (the DELETE/UPDATE after each full build)
+--      are folded into the MERGE: a winning row that fails them deletes the key,
+--      a new key that fails them is not inserted,
+--   4. a key whose winning row failed them keeps that row in SILVER.<T>_REJECTED
+--      (also written by the full build), so a later, older row for the key
+--      still loses against it instead of being inserted.
+-- Consuming a stream in a MERGE advances its offset in the same transaction;
+-- the six tables with tombstones are merged in an explicit transaction, so
+-- both of their MERGEs read the same stream rows and the offset advances at
+-- COMMIT. tests/test_incremental_merge.py checks the MERGEs against the full
+-- build on delta sequences.
+-- Run through python -m pipeline.incremental, which skips tables whose
+-- stream has no new rows.
+
+USE DATABASE ANYCOMPANY_LAB;
+
+-- Tombstones (filled by 5_clean_data.sql; on a SILVER built before they
+-- existed they start empty, run python -m pipeline.incremental --full once)
+CREATE TABLE IF NOT EXISTS SILVER.FINANCIAL_TRANSACTIONS_REJECTED LIKE SILVER.FINANCIAL_TRANSACTIONS_CLEAN;
+CREATE TABLE IF NOT EXISTS SILVER.MARKETING_CAMPAIGNS_REJECTED LIKE SILVER.MARKETING_CAMPAIGNS_CLEAN;
+CREATE TABLE IF NOT EXISTS SILVER.PRODUCT_REVIEWS_REJECTED LIKE SILVER.PRODUCT_REVIEWS_CLEAN;
+CREATE TABLE IF NOT EXISTS SILVER.CUSTOMER_DEMOGRAPHICS_REJECTED LIKE SILVER.CUSTOMER_DEMOGRAPHICS_CLEAN;
+CREATE TABLE IF NOT EXISTS SILVER.LOGISTICS_AND_SHIPPING_REJECTED LIKE SILVER.LOGISTICS_AND_SHIPPING_CLEAN;
+CREATE TABLE IF NOT EXISTS SILVER.EMPLOYEE_RECORDS_REJECTED LIKE SILVER.EMPLOYEE_RECORDS_CLEAN;
+
+-- ------------------------------------------------------------
+-- TABLE 1 — FINANCIAL_TRANSACTIONS → SILVER.FINANCIAL_TRANSACTIONS_CLEAN
+
+BEGIN;
+
+MERGE INTO SILVER.FINANCIAL_TRANSACTIONS_CLEAN t
+USING (
+  SELECT
+    d.*,
+    (r.transaction_id IS NULL
+      OR r.transaction_date IS NULL OR d.transaction_date >= r.transaction_date) AS beats_rejected
+  FROM (
+    SELECT
+      TRIM(transaction_id) AS transaction_id,
+      TRY_TO_DATE(transaction_date::VARCHAR) AS transaction_date,
+      TRIM(transaction_type) AS transaction_type,
+      TRY_TO_DECIMAL(REPLACE(amount::VARCHAR, ' ', ''), 18, 2) AS amount,
+      TRIM(payment_method) AS payment_method,
+      TRIM(entity) AS entity,
+      NULLIF(TRIM(region), '') AS region,
+      TRIM(account_code) AS account_code
+    FROM BRONZE.FINANCIAL_TRANSACTIONS_STREAM
+    WHERE transaction_id IS NOT NULL
+      AND TRIM(transaction_id) <> ''
+    QUALIFY ROW_NUMBER() OVER (
+      PARTITION BY TRIM(transaction_id)
+      ORDER BY TRY_TO_DATE(transaction_date::VARCHAR) DESC NULLS LAST
+    ) = 1
+  ) d
+  LEFT JOIN SILVER.FINANCIAL_TRANSACTIONS_REJECTED r
+    ON r.transaction_id = d.transaction_id
+) s
+ON t.transaction_id = s.transaction_id
+WHEN MATCHED
+  AND (t.transaction_date IS NULL OR s.transaction_date >= t.transaction_date)
+  AND (s.amount IS NULL OR s.amount <= 0)
+  THEN DELETE
+WHEN MATCHED
+  AND (t.transaction_date IS NULL OR s.transaction_date >= t.transaction_date)
+  THEN UPDATE SET
+    transaction_date = s.transaction_date,
+    transaction_type = s.transaction_type,
+    amount = s.amount,
+    payment_method = s.payment_method,
+    entity = s.entity,
+    region = s.region,
+    account_code = s.account_code
+WHEN NOT MATCHED AND s.beats_rejected AND s.amount > 0 THEN INSERT (
+  transaction_id, transaction_date, transaction_type, amount,
+  payment_method, entity, region, account_code
+) VALUES (
+  s.transaction_id, s.transaction_date, s.transaction_type, s.amount,
+  s.payment_method, s.entity, s.region, s.account_code
+);
+
+MERGE INTO SILVER.FINANCIAL_TRANSACTIONS_REJECTED r
+USING (
+  SELECT d.*, t.transaction_id IS NOT NULL AS in_silver
+  FROM (
+    SELECT
+      TRIM(transaction_id) AS transaction_id,
+      TRY_TO_DATE(transaction_date::VARCHAR) AS transaction_date,
+      TRIM(transaction_type) AS transaction_type,
+      TRY_TO_DECIMAL(REPLACE(amount::VARCHAR, ' ', ''), 18, 2) AS amount,
+      TRIM(payment_method) AS payment_method,
+      TRIM(entity) AS entity,
+      NULLIF(TRIM(region), '') AS region,
+      TRIM(account_code) AS account_code
+    FROM BRONZE.FINANCIAL_TRANSACTIONS_STREAM
+    WHERE transaction_id IS NOT NULL
+      AND TRIM(transaction_id) <> ''
+    QUALIFY ROW_NUMBER() OVER (
+      PARTITION BY TRIM(transaction_id)
+      ORDER BY TRY_TO_DATE(transaction_date::VARCHAR) DESC NULLS LAST
+    ) = 1
+  ) d
+  LEFT JOIN SILVER.FINANCIAL_TRANSACTIONS_CLEAN t
+    ON t.transaction_id = d.transaction_id
+) s
+ON r.transaction_id = s.transaction_id
+WHEN MATCHED AND s.in_silver THEN DELETE
+WHEN MATCHED
+  AND (r.transaction_date IS NULL OR s.transaction_date >= r.transaction_date)
+  THEN UPDATE SET
+    transaction_date = s.transaction_date,
+    transaction_type = s.transaction_type,
+    amount = s.amount,
+    payment_method = s.payment_method,
+    entity = s.entity,
+    region = s.region,
+    account_code = s.account_code
+WHEN NOT MATCHED AND NOT s.in_silver THEN INSERT (
+  transaction_id, transaction_date, transaction_type, amount,
+  payment_method, entity, region, account_code
+) VALUES (
+  s.transaction_id, s.transaction_date, s.transaction_type, s.amount,
+  s.payment_method, s.entity, s.region, s.account_code
+);
+
+COMMIT;
+
+-- ------------------------------------------------------------
+-- TABLE 2 — PROMOTIONS_DATA → SILVER.PROMOTIONS_CLEAN
+
+MERGE INTO SILVER.PROMOTIONS_CLEAN t
+USING (
+  SELECT
+    TRIM(promotion_id) AS promotion_id,
+    NULLIF(TRIM(product_category), '') AS product_category,
+    NULLIF(TRIM(promotion_type), '') AS promotion_type,
+    TRY_TO_DOUBLE(discount_percentage) AS discount_percentage,
+    TRY_TO_DATE(start_date::VARCHAR) AS start_date,
+    TRY_TO_DATE(end_date::VARCHAR) AS end_date,
+    NULLIF(TRIM(region), '') AS region
+  FROM BRONZE.PROMOTIONS_DATA_STREAM
+  WHERE promotion_id IS NOT NULL
+    AND TRIM(promotion_id) <> ''
+    AND TRY_TO_DATE(start_date::VARCHAR) IS NOT NULL
+    AND TRY_TO_DATE(end_date::VARCHAR) IS NOT NULL
+    AND TRY_TO_DATE(start_date::VARCHAR) <= TRY_TO_DATE(end_date::VARCHAR)
+    AND TRY_TO_DOUBLE(discount_percentage) BETWEEN 0 AND 1
+  QUALIFY ROW_NUMBER() OVER (
+    PARTITION BY TRIM(promotion_id)
+    ORDER BY TRY_TO_DATE(start_date::VARCHAR) DESC NULLS LAST
+  ) = 1
+) s
+ON t.promotion_id = s.promotion_id
+WHEN MATCHED AND s.start_date >= t.start_date THEN UPDATE SET
+  product_category = s.product_category,
+  promotion_type = s.promotion_type,
+  discount_percentage = s.discount_percentage,
+  start_date = s.start_date,
+  end_date = s.end_date,
+  region = s.region
+WHEN NOT MATCHED THEN INSERT (
+  promotion_id, product_category, promotion_type, discount_percentage,
+  start_date, end_date, region
+) VALUES (
+  s.promotion_id, s.product_category, s.promotion_type, s.discount_percentage,
+  s.start_date, s.end_date, s.region
+);
+
+-- ------------------------------------------------------------
+-- TABLE 3 — MARKETING_CAMPAIGNS → SILVER.MARKETING_CAMPAIGNS_CLEAN
+
+BEGIN;
+
+MERGE INTO SILVER.MARKETING_CAMPAIGNS_CLEAN t
+USING (
+  SELECT
+    d.*,
+    (r.campaign_id IS NULL
+      OR r.budget IS NULL OR d.budget > r.budget
+      OR (d.budget = r.budget AND (r.reach IS NULL OR d.reach >= r.reach))) AS beats_rejected
+  FROM (
+    SELECT
+      TRIM(campaign_id) AS campaign_id,
+      NULLIF(TRIM(campaign_name), '') AS campaign_name,
+      NULLIF(TRIM(campaign_type), '') AS campaign_type,
+      NULLIF(TRIM(product_category), '') AS product_category,
+      NULLIF(TRIM(target_audience), '') AS target_audience,
+      TRY_TO_DATE(start_date::VARCHAR) AS start_date,
+      TRY_TO_DATE(end_date::VARCHAR) AS end_date,
+      NULLIF(TRIM(region), '') AS region,
+      TRY_TO_DECIMAL(REPLACE(budget::VARCHAR, ' ', ''), 18, 2) AS budget,
+      TRY_TO_NUMBER(REPLACE(reach::VARCHAR, ' ', '')) AS reach,
+      IFF(TRY_TO_DOUBLE(conversion_rate) BETWEEN 0 AND 1, TRY_TO_DOUBLE(conversion_rate), NULL) AS conversion_rate
+    FROM BRONZE.MARKETING_CAMPAIGNS_STREAM
+    WHERE campaign_id IS NOT NULL
+      AND TRIM(campaign_id) <> ''
+      AND TRY_TO_DATE(start_date::VARCHAR) IS NOT NULL
+      AND TRY_TO_DATE(end_date::VARCHAR) IS NOT NULL
+      AND TRY_TO_DATE(start_date::VARCHAR) <= TRY_TO_DATE(end_date::VARCHAR)
+    QUALIFY ROW_NUMBER() OVER (
+      PARTITION BY
+        TRIM(campaign_id),
+        TRY_TO_DATE(start_date::VARCHAR),
+        TRY_TO_DATE(end_date::VARCHAR),
+        NULLIF(TRIM(region), ''),
+        NULLIF(TRIM(campaign_type), ''),
+        NULLIF(TRIM(product_category), ''),
+        NULLIF(TRIM(target_audience), '')
+      ORDER BY
+        TRY_TO_DECIMAL(REPLACE(budget::VARCHAR, ' ', ''), 18, 2) DESC NULLS LAST,
+        TRY_TO_NUMBER(REPLACE(reach::VARCHAR, ' ', '')) DESC NULLS LAST
+    ) = 1
+  ) d
+  LEFT JOIN SILVER.MARKETING_CAMPAIGNS_REJECTED r
+    ON r.campaign_id = d.campaign_id
+   AND r.start_date = d.start_date
+   AND r.end_date = d.end_date
+   AND EQUAL_NULL(r.region, d.region)
+   AND EQUAL_NULL(r.campaign_type, d.campaign_type)
+   AND EQUAL_NULL(r.product_category, d.product_category)
+   AND EQUAL_NULL(r.target_audience, d.target_audience)
+) s
+ON t.campaign_id = s.campaign_id
+ AND t.start_date = s.start_date
+ AND t.end_date = s.end_date
+ AND EQUAL_NULL(t.region, s.region)
+ AND EQUAL_NULL(t.campaign_type, s.campaign_type)
+ AND EQUAL_NULL(t.product_category, s.product_category)
+ AND EQUAL_NULL(t.target_audience, s.target_audience)
+WHEN MATCHED
+  AND (s.budget > t.budget OR (s.budget = t.budget AND s.reach >= t.reach))
+  AND (s.reach IS NULL OR s.reach < 0)
+  THEN DELETE
+WHEN MATCHED
+  AND (s.budget > t.budget OR (s.budget = t.budget AND s.reach >= t.reach))
+  THEN UPDATE SET
+    campaign_name = s.campaign_name,
+    budget = s.budget,
+    reach = s.reach,
+    conversion_rate = s.conversion_rate
+WHEN NOT MATCHED AND s.beats_rejected AND s.budget > 0 AND s.reach >= 0 THEN INSERT (
+  campaign_id, campaign_name, campaign_type, product_category, target_audience,
+  start_date, end_date, region, budget, reach, conversion_rate
+) VALUES (
+  s.campaign_id, s.campaign_name, s.campaign_type, s.product_category, s.target_audience,
+  s.start_date, s.end_date, s.region, s.budget, s.reach, s.conversion_rate
+);
+
+MERGE INTO SILVER.MARKETING_CAMPAIGNS_REJECTED r
+USING (
+  SELECT d.*, t.campaign_id IS NOT NULL AS in_silver
+  FROM (
+    SELECT
+      TRIM(campaign_id) AS campaign_id,
+      NULLIF(TRIM(campaign_name), '') AS campaign_name,
+      NULLIF(TRIM(campaign_type), '') AS campaign_type,
+      NULLIF(TRIM(product_category), '') AS product_category,
+      NULLIF(TRIM(target_audience), '') AS target_audience,
+      TRY_TO_DATE(start_date::VARCHAR) AS start_date,
+      TRY_TO_DATE(end_date::VARCHAR) AS end_date,
+      NULLIF(TRIM(region), '') AS region,
+      TRY_TO_DECIMAL(REPLACE(budget::VARCHAR, ' ', ''), 18, 2) AS budget,
+      TRY_TO_NUMBER(REPLACE(reach::VARCHAR, ' ', '')) AS reach,
+      IFF(TRY_TO_DOUBLE(conversion_rate) BETWEEN 0 AND 1, TRY_TO_DOUBLE(conversion_rate), NULL) AS conversion_rate
+    FROM BRONZE.MARKETING_CAMPAIGNS_STREAM
+    WHERE campaign_id IS NOT NULL
+      AND TRIM(campaign_id) <> ''
+      AND TRY_TO_DATE(start_date::VARCHAR) IS NOT NULL
+      AND TRY_TO_DATE(end_date::VARCHAR) IS NOT NULL
+      AND TRY_TO_DATE(start_date::VARCHAR) <= TRY_TO_DATE(end_date::VARCHAR)
+    QUALIFY ROW_NUMBER() OVER (
+      PARTITION BY
+        TRIM(campaign_id),
+        TRY_TO_DATE(start_date::VARCHAR),
+        TRY_TO_DATE(end_date::VARCHAR),
+        NULLIF(TRIM(region), ''),
+        NULLIF(TRIM(campaign_type), ''),
+        NULLIF(TRIM(product_category), ''),
+        NULLIF(TRIM(target_audience), '')
+      ORDER BY
+        TRY_TO_DECIMAL(REPLACE(budget::VARCHAR, ' ', ''), 18, 2) DESC NULLS LAST,
+        TRY_TO_NUMBER(REPLACE(reach::VARCHAR, ' ', '')) DESC NULLS LAST
+    ) = 1
+  ) d
+  LEFT JOIN SILVER.MARKETING_CAMPAIGNS_CLEAN t
+    ON t.campaign_id = d.campaign_id
+   AND t.start_date = d.start_date
+   AND t.end_date = d.end_date
+   AND EQUAL_NULL(t.region, d.region)
+   AND EQUAL_NULL(t.campaign_type, d.campaign_type)
+   AND EQUAL_NULL(t.product_category, d.product_category)
+   AND EQUAL_NULL(t.target_audience, d.target_audience)
+) s
+ON r.campaign_id = s.campaign_id
+ AND r.start_date = s.start_date
+ AND r.end_date = s.end_date
+ AND EQUAL_NULL(r.region, s.region)
+ AND EQUAL_NULL(r.campaign_type, s.campaign_type)
+ AND EQUAL_NULL(r.product_category, s.product_category)
+ AND EQUAL_NULL(r.target_audience, s.target_audience)
+WHEN MATCHED AND s.in_silver THEN DELETE
+WHEN MATCHED
+  AND (r.budget IS NULL OR s.budget > r.budget
+      OR (s.budget = r.budget AND (r.reach IS NULL OR s.reach >= r.reach)))
+  THEN UPDATE SET
+    campaign_name = s.campaign_name,
+    budget = s.budget,
+    reach = s.reach,
+    conversion_rate = s.conversion_rate
+WHEN NOT MATCHED AND NOT s.in_silver THEN INSERT (
+  campaign_id, campaign_name, campaign_type, product_category, target_audience,
+  start_date, end_date, region, budget, reach, conversion_rate
+) VALUES (
+  s.campaign_id, s.campaign_name, s.campaign_type, s.product_category, s.target_audience,
+  s.start_date, s.end_date, s.region, s.budget, s.reach, s.conversion_rate
+);
+
+COMMIT;
+
+-- ------------------------------------------------------------
+-- TABLE 4 — PRODUCT_REVIEWS → SILVER.PRODUCT_REVIEWS_CLEAN
+
+BEGIN;
+
+MERGE INTO SILVER.PRODUCT_REVIEWS_CLEAN t
+USING (
+  SELECT
+    d.*,
+    (r.product_id IS NULL
+      OR IFF(d.review_text IS NULL OR TRIM(d.review_text) = '', 0, 1)
+      >= IFF(r.review_text IS NULL OR TRIM(r.review_text) = '', 0, 1)) AS beats_rejected
+  FROM (
+    SELECT
+      TRY_TO_NUMBER(review_id::VARCHAR) AS review_id,
+      NULLIF(TRIM(product_id), '') AS product_id,
+      NULLIF(TRIM(reviewer_id), '') AS reviewer_id,
+      NULLIF(TRIM(reviewer_name), '') AS reviewer_name,
+      TRY_TO_NUMBER(rating::VARCHAR) AS rating,
+      COALESCE(
+        TRY_TO_DATE(review_date::VARCHAR),
+        TO_DATE(TRY_TO_TIMESTAMP_NTZ(review_date::VARCHAR))
+      ) AS review_date,
+      NULLIF(TRIM(review_title), '') AS review_title,
+      review_text AS review_text,
+      COALESCE(NULLIF(TRIM(product_category), ''), 'Unknown') AS product_category
+    FROM BRONZE.PRODUCT_REVIEWS_STREAM
+    WHERE NULLIF(TRIM(product_id), '') IS NOT NULL
+    QUALIFY ROW_NUMBER() OVER (
+      PARTITION BY
+        COALESCE(TRY_TO_NUMBER(review_id::VARCHAR)::VARCHAR, 'NA'),
+        NULLIF(TRIM(product_id), ''),
+        NULLIF(TRIM(reviewer_id), ''),
+        COALESCE(NULLIF(TRIM(review_title), ''), 'NA'),
+        COALESCE(
+          TRY_TO_DATE(review_date::VARCHAR)::VARCHAR,
+          TO_DATE(TRY_TO_TIMESTAMP_NTZ(review_date::VARCHAR))::VARCHAR,
+          'NA'
+        )
+      ORDER BY IFF(review_text IS NULL OR TRIM(review_text) = '', 0, 1) DESC
+    ) = 1
+  ) d
+  LEFT JOIN SILVER.PRODUCT_REVIEWS_REJECTED r
+    ON COALESCE(r.review_id::VARCHAR, 'NA') = COALESCE(d.review_id::VARCHAR, 'NA')
+   AND r.product_id = d.product_id
+   AND EQUAL_NULL(r.reviewer_id, d.reviewer_id)
+   AND COALESCE(r.review_title, 'NA') = COALESCE(d.review_title, 'NA')
+   AND COALESCE(r.review_date::VARCHAR, 'NA') = COALESCE(d.review_date::VARCHAR, 'NA')
+) s
+ON COALESCE(t.review_id::VARCHAR, 'NA') = COALESCE(s.review_id::VARCHAR, 'NA')
+ AND t.product_id = s.product_id
+ AND EQUAL_NULL(t.reviewer_id, s.reviewer_id)
+ AND COALESCE(t.review_title, 'NA') = COALESCE(s.review_title, 'NA')
+ AND COALESCE(t.review_date::VARCHAR, 'NA') = COALESCE(s.review_date::VARCHAR, 'NA')
+WHEN MATCHED
+  AND IFF(s.review_text IS NULL OR TRIM(s.review_text) = '', 0, 1)
+      >= IFF(t.review_text IS NULL OR TRIM(t.review_text) = '', 0, 1)
+  AND (s.rating < 1 OR s.rating > 5)
+  THEN DELETE
+WHEN MATCHED
+  AND IFF(s.review_text IS NULL OR TRIM(s.review_text) = '', 0, 1)
+      >= IFF(t.review_text IS NULL OR TRIM(t.review_text) = '', 0, 1)
+  THEN UPDATE SET
+    reviewer_name = s.reviewer_name,
+    rating = s.rating,
+    review_text = s.review_text,
+    product_category = s.product_category
+WHEN NOT MATCHED AND s.beats_rejected AND (s.rating IS NULL OR s.rating BETWEEN 1 AND 5) THEN INSERT (
+  review_id, product_id, reviewer_id, reviewer_name, rating,
+  review_date, review_title, review_text, product_category
+) VALUES (
+  s.review_id, s.product_id, s.reviewer_id, s.reviewer_name, s.rating,
+  s.review_date, s.review_title, s.review_text, s.product_category
+);
+
+MERGE INTO SILVER.PRODUCT_REVIEWS_REJECTED r
+USING (
+  SELECT d.*, t.product_id IS NOT NULL AS in_silver
+  FROM (
+    SELECT
+      TRY_TO_NUMBER(review_id::VARCHAR) AS review_id,
+      NULLIF(TRIM(product_id), '') AS product_id,
+      NULLIF(TRIM(reviewer_id), '') AS reviewer_id,
+      NULLIF(TRIM(reviewer_name), '') AS reviewer_name,
+      TRY_TO_NUMBER(rating::VARCHAR) AS rating,
+      COALESCE(
+        TRY_TO_DATE(review_date::VARCHAR),
+        TO_DATE(TRY_TO_TIMESTAMP_NTZ(review_date::VARCHAR))
+      ) AS review_date,
+      NULLIF(TRIM(review_title), '') AS review_title,
+      review_text AS review_text,
+      COALESCE(NULLIF(TRIM(product_category), ''), 'Unknown') AS product_category
+    FROM BRONZE.PRODUCT_REVIEWS_STREAM
+    WHERE NULLIF(TRIM(product_id), '') IS NOT NULL
+    QUALIFY ROW_NUMBER() OVER (
+      PARTITION BY
+        COALESCE(TRY_TO_NUMBER(review_id::VARCHAR)::VARCHAR, 'NA'),
+        NULLIF(TRIM(product_id), ''),
+        NULLIF(TRIM(reviewer_id), ''),
+        COALESCE(NULLIF(TRIM(review_title), ''), 'NA'),
+        COALESCE(
+          TRY_TO_DATE(review_date::VARCHAR)::VARCHAR,
+          TO_DATE(TRY_TO_TIMESTAMP_NTZ(review_date::VARCHAR))::VARCHAR,
+          'NA'
+        )
+      ORDER BY IFF(review_text IS NULL OR TRIM(review_text) = '', 0, 1) DESC
+    ) = 1
+  ) d
+  LEFT JOIN SILVER.PRODUCT_REVIEWS_CLEAN t
+    ON COALESCE(t.review_id::VARCHAR, 'NA') = COALESCE(d.review_id::VARCHAR, 'NA')
+   AND t.product_id = d.product_id
+   AND EQUAL_NULL(t.reviewer_id, d.reviewer_id)
+   AND COALESCE(t.review_title, 'NA') = COALESCE(d.review_title, 'NA')
+   AND COALESCE(t.review_date::VARCHAR, 'NA') = COALESCE(d.review_date::VARCHAR, 'NA')
+) s
+ON COALESCE(r.review_id::VARCHAR, 'NA') = COALESCE(s.review_id::VARCHAR, 'NA')
+ AND r.product_id = s.product_id
+ AND EQUAL_NULL(r.reviewer_id, s.reviewer_id)
+ AND COALESCE(r.review_title, 'NA') = COALESCE(s.review_title, 'NA')
+ AND COALESCE(r.review_date::VARCHAR, 'NA') = COALESCE(s.review_date::VARCHAR, 'NA')
+WHEN MATCHED AND s.in_silver THEN DELETE
+WHEN MATCHED
+  AND (IFF(s.review_text IS NULL OR TRIM(s.review_text) = '', 0, 1)
+      >= IFF(r.review_text IS NULL OR TRIM(r.review_text) = '', 0, 1))
+  THEN UPDATE SET
+    reviewer_name = s.reviewer_name,
+    rating = s.rating,
+    review_text = s.review_text,
+    product_category = s.product_category
+WHEN NOT MATCHED AND NOT s.in_silver THEN INSERT (
+  review_id, product_id, reviewer_id, reviewer_name, rating,
+  review_date, review_title, review_text, product_category
+) VALUES (
+  s.review_id, s.product_id, s.reviewer_id, s.reviewer_name, s.rating,
+  s.review_date, s.review_title, s.review_text, s.product_category
+);
+
+COMMIT;
+
+-- ------------------------------------------------------------
+-- TABLE 5 — CUSTOMER_DEMOGRAPHICS → SILVER.CUSTOMER_DEMOGRAPHICS_CLEAN
+
+BEGIN;
+
+MERGE INTO SILVER.CUSTOMER_DEMOGRAPHICS_CLEAN t
+USING (
+  SELECT
+    d.*,
+    (r.customer_id IS NULL
+      OR IFF(d.name IS NULL, 0, 1) + IFF(d.date_of_birth IS NULL, 0, 1) + IFF(d.country IS NULL, 0, 1)
+      + IFF(d.city IS NULL, 0, 1) + IFF(d.annual_income IS NULL, 0, 1)
+      >= IFF(r.name IS NULL, 0, 1) + IFF(r.date_of_birth IS NULL, 0, 1) + IFF(r.country IS NULL, 0, 1)
+      + IFF(r.city IS NULL, 0, 1) + IFF(r.annual_income IS NULL, 0, 1)) AS beats_rejected
+  FROM (
+    SELECT *
+    FROM (
+      SELECT
+        customer_id::NUMBER AS customer_id,
+        NULLIF(TRIM(name), '') AS name,
+        TRY_TO_DATE(date_of_birth::VARCHAR) AS date_of_birth,
+        NULLIF(TRIM(gender), '') AS gender,
+        NULLIF(TRIM(region), '') AS region,
+        NULLIF(TRIM(country), '') AS country,
+        NULLIF(TRIM(city), '') AS city,
+        NULLIF(TRIM(marital_status), '') AS marital_status,
+        TRY_TO_DECIMAL(REPLACE(annual_income::VARCHAR, ' ', ''), 18, 2) AS annual_income
+      FROM BRONZE.CUSTOMER_DEMOGRAPHICS_STREAM
+      WHERE customer_id IS NOT NULL
+    )
+    QUALIFY ROW_NUMBER() OVER (
+      PARTITION BY customer_id
+      ORDER BY
+        IFF(name IS NULL, 0, 1) + IFF(date_of_birth IS NULL, 0, 1) + IFF(country IS NULL, 0, 1)
+        + IFF(city IS NULL, 0, 1) + IFF(annual_income IS NULL, 0, 1) DESC
+    ) = 1
+  ) d
+  LEFT JOIN SILVER.CUSTOMER_DEMOGRAPHICS_REJECTED r
+    ON r.customer_id = d.customer_id
+) s
+ON t.customer_id = s.customer_id
+WHEN MATCHED
+  AND IFF(s.name IS NULL, 0, 1) + IFF(s.date_of_birth IS NULL, 0, 1) + IFF(s.country IS NULL, 0, 1)
+      + IFF(s.city IS NULL, 0, 1) + IFF(s.annual_income IS NULL, 0, 1)
+      >= IFF(t.name IS NULL, 0, 1) + IFF(t.date_of_birth IS NULL, 0, 1) + IFF(t.country IS NULL, 0, 1)
+      + IFF(t.city IS NULL, 0, 1) + IFF(t.annual_income IS NULL, 0, 1)
+  AND s.annual_income < 0
+  THEN DELETE
+WHEN MATCHED
+  AND IFF(s.name IS NULL, 0, 1) + IFF(s.date_of_birth IS NULL, 0, 1) + IFF(s.country IS NULL, 0, 1)
+      + IFF(s.city IS NULL, 0, 1) + IFF(s.annual_income IS NULL, 0, 1)
+      >= IFF(t.name IS NULL, 0, 1) + IFF(t.date_of_birth IS NULL, 0, 1) + IFF(t.country IS NULL, 0, 1)
+      + IFF(t.city IS NULL, 0, 1) + IFF(t.annual_income IS NULL, 0, 1)
+  THEN UPDATE SET
+    name = s.name,
+    date_of_birth = s.date_of_birth,
+    gender = s.gender,
+    region = s.region,
+    country = s.country,
+    city = s.city,
+    marital_status = s.marital_status,
+    annual_income = s.annual_income
+WHEN NOT MATCHED AND s.beats_rejected AND (s.annual_income IS NULL OR s.annual_income >= 0) THEN INSERT (
+  customer_id, name, date_of_birth, gender, region, country, city, marital_status, annual_income
+) VALUES (
+  s.customer_id, s.name, s.date_of_birth, s.gender, s.region, s.country, s.city,
+  s.marital_status, s.annual_income
+);
+
+MERGE INTO SILVER.CUSTOMER_DEMOGRAPHICS_REJECTED r
+USING (
+  SELECT d.*, t.customer_id IS NOT NULL AS in_silver
+  FROM (
+    SELECT *
+    FROM (
+      SELECT
+        customer_id::NUMBER AS customer_id,
+        NULLIF(TRIM(name), '') AS name,
+        TRY_TO_DATE(date_of_birth::VARCHAR) AS date_of_birth,
+        NULLIF(TRIM(gender), '') AS gender,
+        NULLIF(TRIM(region), '') AS region,
+        NULLIF(TRIM(country), '') AS country,
+        NULLIF(TRIM(city), '') AS city,
+        NULLIF(TRIM(marital_status), '') AS marital_status,
+        TRY_TO_DECIMAL(REPLACE(annual_income::VARCHAR, ' ', ''), 18, 2) AS annual_income
+      FROM BRONZE.CUSTOMER_DEMOGRAPHICS_STREAM
+      WHERE customer_id IS NOT NULL
+    )
+    QUALIFY ROW_NUMBER() OVER (
+      PARTITION BY customer_id
+      ORDER BY
+        IFF(name IS NULL, 0, 1) + IFF(date_of_birth IS NULL, 0, 1) + IFF(country IS NULL, 0, 1)
+        + IFF(city IS NULL, 0, 1) + IFF(annual_income IS NULL, 0, 1) DESC
+    ) = 1
+  ) d
+  LEFT JOIN SILVER.CUSTOMER_DEMOGRAPHICS_CLEAN t
+    ON t.customer_id = d.customer_id
+) s
+ON r.customer_id = s.customer_id
+WHEN MATCHED AND s.in_silver THEN DELETE
+WHEN MATCHED
+  AND (IFF(s.name IS NULL, 0, 1) + IFF(s.date_of_birth IS NULL, 0, 1) + IFF(s.country IS NULL, 0, 1)
+      + IFF(s.city IS NULL, 0, 1) + IFF(s.annual_income IS NULL, 0, 1)
+      >= IFF(r.name IS NULL, 0, 1) + IFF(r.date_of_birth IS NULL, 0, 1) + IFF(r.country IS NULL, 0, 1)
+      + IFF(r.city IS NULL, 0, 1) + IFF(r.annual_income IS NULL, 0, 1))
+  THEN UPDATE SET
+    name = s.name,
+    date_of_birth = s.date_of_birth,
+    gender = s.gender,
+    region = s.region,
+    country = s.country,
+    city = s.city,
+    marital_status = s.marital_status,
+    annual_income = s.annual_income
+WHEN NOT MATCHED AND NOT s.in_silver THEN INSERT (
+  customer_id, name, date_of_birth, gender, region, country, city, marital_status, annual_income
+) VALUES (
+  s.customer_id, s.name, s.date_of_birth, s.gender, s.region, s.country, s.city,
+  s.marital_status, s.annual_income
+);
+
+COMMIT;
+
+-- ------------------------------------------------------------
+-- TABLE 6 — LOGISTICS_AND_SHIPPING → SILVER.LOGISTICS_AND_SHIPPING_CLEAN
+
+BEGIN;
+
+MERGE INTO SILVER.LOGISTICS_AND_SHIPPING_CLEAN t
+USING (
+  SELECT
+    d.*,
+    (r.shipment_id IS NULL
+      OR r.ship_date IS NULL OR d.ship_date >= r.ship_date) AS beats_rejected
+  FROM (
+    SELECT
+      TRIM(shipment_id) AS shipment_id,
+      NULLIF(TRIM(order_id), '') AS order_id,
+      TRY_TO_DATE(ship_date::VARCHAR) AS ship_date,
+      /* delivery before shipment => NULL (UPDATE rule of the full build) */
+      IFF(
+        TRY_TO_DATE(estimated_delivery::VARCHAR) < TRY_TO_DATE(ship_date::VARCHAR),
+        NULL,
+        TRY_TO_DATE(estimated_delivery::VARCHAR)
+      ) AS estimated_delivery,
+      NULLIF(TRIM(shipping_method), '') AS shipping_method,
+      NULLIF(TRIM(status), '') AS status,
+      TRY_TO_DECIMAL(REPLACE(shipping_cost::VARCHAR, ' ', ''), 18, 2) AS shipping_cost,
+      NULLIF(TRIM(destination_region), '') AS destination_region,
+      NULLIF(TRIM(destination_country), '') AS destination_country,
+      NULLIF(TRIM(carrier), '') AS carrier
+    FROM BRONZE.LOGISTICS_AND_SHIPPING_STREAM
+    WHERE shipment_id IS NOT NULL
+      AND TRIM(shipment_id) <> ''
+    QUALIFY ROW_NUMBER() OVER (
+      PARTITION BY TRIM(shipment_id)
+      ORDER BY TRY_TO_DATE(ship_date::VARCHAR) DESC NULLS LAST
+    ) = 1
+  ) d
+  LEFT JOIN SILVER.LOGISTICS_AND_SHIPPING_REJECTED r
+    ON r.shipment_id = d.shipment_id
+) s
+ON t.shipment_id = s.shipment_id
+WHEN MATCHED
+  AND (t.ship_date IS NULL OR s.ship_date >= t.ship_date)
+  AND s.shipping_cost < 0
+  THEN DELETE
+WHEN MATCHED
+  AND (t.ship_date IS NULL OR s.ship_date >= t.ship_date)
+  THEN UPDATE SET
+    order_id = s.order_id,
+    ship_date = s.ship_date,
+    estimated_delivery = s.estimated_delivery,
+    shipping_method = s.shipping_method,
+    status = s.status,
+    shipping_cost = s.shipping_cost,
+    destination_region = s.destination_region,
+    destination_country = s.destination_country,
+    carrier = s.carrier
+WHEN NOT MATCHED AND s.beats_rejected AND (s.shipping_cost IS NULL OR s.shipping_cost >= 0) THEN INSERT (
+  shipment_id, order_id, ship_date, estimated_delivery, shipping_method, status,
+  shipping_cost, destination_region, destination_country, carrier
+) VALUES (
+  s.shipment_id, s.order_id, s.ship_date, s.estimated_delivery, s.shipping_method, s.status,
+  s.shipping_cost, s.destination_region, s.destination_country, s.carrier
+);
+
+MERGE INTO SILVER.LOGISTICS_AND_SHIPPING_REJECTED r
+USING (
+  SELECT d.*, t.shipment_id IS NOT NULL AS in_silver
+  FROM (
+    SELECT
+      TRIM(shipment_id) AS shipment_id,
+      NULLIF(TRIM(order_id), '') AS order_id,
+      TRY_TO_DATE(ship_date::VARCHAR) AS ship_date,
+      /* delivery before shipment => NULL (UPDATE rule of the full build) */
+      IFF(
+        TRY_TO_DATE(estimated_delivery::VARCHAR) < TRY_TO_DATE(ship_date::VARCHAR),
+        NULL,
+        TRY_TO_DATE(estimated_delivery::VARCHAR)
+      ) AS estimated_delivery,
+      NULLIF(TRIM(shipping_method), '') AS shipping_method,
+      NULLIF(TRIM(status), '') AS status,
+      TRY_TO_DECIMAL(REPLACE(shipping_cost::VARCHAR, ' ', ''), 18, 2) AS shipping_cost,
+      NULLIF(TRIM(destination_region), '') AS destination_region,
+      NULLIF(TRIM(destination_country), '') AS destination_country,
+      NULLIF(TRIM(carrier), '') AS carrier
+    FROM BRONZE.LOGISTICS_AND_SHIPPING_STREAM
+    WHERE shipment_id IS NOT NULL
+      AND TRIM(shipment_id) <> ''
+    QUALIFY ROW_NUMBER() OVER (
+      PARTITION BY TRIM(shipment_id)
+      ORDER BY TRY_TO_DATE(ship_date::VARCHAR) DESC NULLS LAST
+    ) = 1
+  ) d
+  LEFT JOIN SILVER.LOGISTICS_AND_SHIPPING_CLEAN t
+    ON t.shipment_id = d.shipment_id
+) s
+ON r.shipment_id = s.shipment_id
+WHEN MATCHED AND s.in_silver THEN DELETE
+WHEN MATCHED
+  AND (r.ship_date IS NULL OR s.ship_date >= r.ship_date)
+  THEN UPDATE SET
+    order_id = s.order_id,
+    ship_date = s.ship_date,
+    estimated_delivery = s.estimated_delivery,
+    shipping_method = s.shipping_method,
+    status = s.status,
+    shipping_cost = s.shipping_cost,
+    destination_region = s.destination_region,
+    destination_country = s.destination_country,
+    carrier = s.carrier
+WHEN NOT MATCHED AND NOT s.in_silver THEN INSERT (
+  shipment_id, order_id, ship_date, estimated_delivery, shipping_method, status,
+  shipping_cost, destination_region, destination_country, carrier
+) VALUES (
+  s.shipment_id, s.order_id, s.ship_date, s.estimated_delivery, s.shipping_method, s.status,
+  s.shipping_cost, s.destination_region, s.destination_country, s.carrier
+);
+
+COMMIT;
+
+-- ------------------------------------------------------------
+-- TABLE 7 — CUSTOMER_SERVICE_INTERACTIONS → SILVER.CUSTOMER_SERVICE_INTERACTIONS_CLEAN
+
+MERGE INTO SILVER.CUSTOMER_SERVICE_INTERACTIONS_CLEAN t
+USING (
+  SELECT
+    TRIM(interaction_id) AS interaction_id,
+    TRY_TO_DATE(interaction_date::VARCHAR) AS interaction_date,
+    NULLIF(TRIM(interaction_type), '') AS interaction_type,
+    NULLIF(TRIM(issue_category), '') AS issue_category,
+    description AS description,
+    IFF(duration_minutes BETWEEN 0 AND 600, duration_minutes, NULL) AS duration_minutes,
+    NULLIF(TRIM(resolution_status), '') AS resolution_status,
+    IFF(UPPER(TRIM(follow_up_required)) IN ('YES','Y','TRUE','1'), TRUE, FALSE) AS follow_up_required,
+    IFF(customer_satisfaction BETWEEN 1 AND 5, customer_satisfaction, NULL) AS customer_satisfaction
+  FROM BRONZE.CUSTOMER_SERVICE_INTERACTIONS_STREAM
+  WHERE interaction_id IS NOT NULL
+    AND TRIM(interaction_id) <> ''
+  QUALIFY ROW_NUMBER() OVER (
+    PARTITION BY TRIM(interaction_id)
+    ORDER BY TRY_TO_DATE(interaction_date::VARCHAR) DESC NULLS LAST
+  ) = 1
+) s
+ON t.interaction_id = s.interaction_id
+WHEN MATCHED
+  AND (t.interaction_date IS NULL OR s.interaction_date >= t.interaction_date)
+  THEN UPDATE SET
+    interaction_date = s.interaction_date,
+    interaction_type = s.interaction_type,
+    issue_category = s.issue_category,
+    description = s.description,
+    duration_minutes = s.duration_minutes,
+    resolution_status = s.resolution_status,
+    follow_up_required = s.follow_up_required,
+    customer_satisfaction = s.customer_satisfaction
+WHEN NOT MATCHED THEN INSERT (
+  interaction_id, interaction_date, interaction_type, issue_category, description,
+  duration_minutes, resolution_status, follow_up_required, customer_satisfaction
+) VALUES (
+  s.interaction_id, s.interaction_date, s.interaction_type, s.issue_category, s.description,
+  s.duration_minutes, s.resolution_status, s.follow_up_required, s.customer_satisfaction
+);
+
+-- ------------------------------------------------------------
+-- TABLE 8 — SUPPLIER_INFORMATION → SILVER.SUPPLIER_INFORMATION_CLEAN
+
+MERGE INTO SILVER.SUPPLIER_INFORMATION_CLEAN t
+USING (
+  SELECT *
+  FROM (
+    SELECT
+      TRIM(supplier_id) AS supplier_id,
+      NULLIF(TRIM(supplier_name), '') AS supplier_name,
+      NULLIF(TRIM(product_category), '') AS product_category,
+      NULLIF(TRIM(region), '') AS region,
+      NULLIF(TRIM(country), '') AS country,
+      NULLIF(TRIM(city), '') AS city,
+      IFF(lead_time BETWEEN 0 AND 365, lead_time, NULL) AS lead_time,
+      IFF(reliability_score BETWEEN 0 AND 1, reliability_score, NULL) AS reliability_score,
+      NULLIF(TRIM(quality_rating), '') AS quality_rating
+    FROM BRONZE.SUPPLIER_INFORMATION_STREAM
+    WHERE supplier_id IS NOT NULL
+      AND TRIM(supplier_id) <> ''
+  )
+  QUALIFY ROW_NUMBER() OVER (
+    PARTITION BY supplier_id
+    ORDER BY
+      IFF(supplier_name IS NULL, 0, 1) + IFF(product_category IS NULL, 0, 1) + IFF(lead_time IS NULL, 0, 1)
+      + IFF(reliability_score IS NULL, 0, 1) + IFF(quality_rating IS NULL, 0, 1) DESC
+  ) = 1
+) s
+ON t.supplier_id = s.supplier_id
+WHEN MATCHED
+  AND IFF(s.supplier_name IS NULL, 0, 1) + IFF(s.product_category IS NULL, 0, 1) + IFF(s.lead_time IS NULL, 0, 1)
+      + IFF(s.reliability_score IS NULL, 0, 1) + IFF(s.quality_rating IS NULL, 0, 1)
+      >= IFF(t.supplier_name IS NULL, 0, 1) + IFF(t.product_category IS NULL, 0, 1) + IFF(t.lead_time IS NULL, 0, 1)
+      + IFF(t.reliability_score IS NULL, 0, 1) + IFF(t.quality_rating IS NULL, 0, 1)
+  THEN UPDATE SET
+    supplier_name = s.supplier_name,
+    product_category = s.product_category,
+    region = s.region,
+    country = s.country,
+    city = s.city,
+    lead_time = s.lead_time,
+    reliability_score = s.reliability_score,
+    quality_rating = s.quality_rating
+WHEN NOT MATCHED THEN INSERT (
+  supplier_id, supplier_name, product_category, region, country, city,
+  lead_time, reliability_score, quality_rating
+) VALUES (
+  s.supplier_id, s.supplier_name, s.product_category, s.region, s.country, s.city,
+  s.lead_time, s.reliability_score, s.quality_rating
+);
+
+-- ------------------------------------------------------------
+-- TABLE 9 — EMPLOYEE_RECORDS → SILVER.EMPLOYEE_RECORDS_CLEAN
+
+BEGIN;
+
+MERGE INTO SILVER.EMPLOYEE_RECORDS_CLEAN t
+USING (
+  SELECT
+    d.*,
+    (r.employee_id IS NULL
+      OR IFF(d.name IS NULL, 0, 1) + IFF(d.hire_date IS NULL, 0, 1) + IFF(d.salary IS NULL, 0, 1) + IFF(d.email IS NULL, 0, 1)
+      > IFF(r.name IS NULL, 0, 1) + IFF(r.hire_date IS NULL, 0, 1) + IFF(r.salary IS NULL, 0, 1) + IFF(r.email IS NULL, 0, 1)
+      OR (
+        IFF(d.name IS NULL, 0, 1) + IFF(d.hire_date IS NULL, 0, 1) + IFF(d.salary IS NULL, 0, 1) + IFF(d.email IS NULL, 0, 1)
+        = IFF(r.name IS NULL, 0, 1) + IFF(r.hire_date IS NULL, 0, 1) + IFF(r.salary IS NULL, 0, 1) + IFF(r.email IS NULL, 0, 1)
+        AND (r.hire_date IS NULL OR d.hire_date >= r.hire_date)
+      )) AS beats_rejected
+  FROM (
+    SELECT *
+    FROM (
+      SELECT
+        TRIM(employee_id) AS employee_id,
+        NULLIF(TRIM(name), '') AS name,
+        TRY_TO_DATE(date_of_birth::VARCHAR) AS date_of_birth,
+        TRY_TO_DATE(hire_date::VARCHAR) AS hire_date,
+        NULLIF(TRIM(department), '') AS department,
+        NULLIF(TRIM(job_title), '') AS job_title,
+        TRY_TO_DECIMAL(REPLACE(salary::VARCHAR, ' ', ''), 18, 2) AS salary,
+        NULLIF(TRIM(region), '') AS region,
+        NULLIF(TRIM(country), '') AS country,
+        NULLIF(REPLACE(TRIM(email), 'mailto:', ''), '') AS email
+      FROM BRONZE.EMPLOYEE_RECORDS_STREAM
+      WHERE employee_id IS NOT NULL
+        AND TRIM(employee_id) <> ''
+    )
+    QUALIFY ROW_NUMBER() OVER (
+      PARTITION BY employee_id
+      ORDER BY
+        IFF(name IS NULL, 0, 1) + IFF(hire_date IS NULL, 0, 1) + IFF(salary IS NULL, 0, 1)
+        + IFF(email IS NULL, 0, 1) DESC,
+        hire_date DESC NULLS LAST
+    ) = 1
+  ) d
+  LEFT JOIN SILVER.EMPLOYEE_RECORDS_REJECTED r
+    ON r.employee_id = d.employee_id
+) s
+ON t.employee_id = s.employee_id
+WHEN MATCHED
+  AND (
+    IFF(s.name IS NULL, 0, 1) + IFF(s.hire_date IS NULL, 0, 1) + IFF(s.salary IS NULL, 0, 1) + IFF(s.email IS NULL, 0, 1)
+    > IFF(t.name IS NULL, 0, 1) + IFF(t.hire_date IS NULL, 0, 1) + IFF(t.salary IS NULL, 0, 1) + IFF(t.email IS NULL, 0, 1)
+    OR (
+      IFF(s.name IS NULL, 0, 1) + IFF(s.hire_date IS NULL, 0, 1) + IFF(s.salary IS NULL, 0, 1) + IFF(s.email IS NULL, 0, 1)
+      = IFF(t.name IS NULL, 0, 1) + IFF(t.hire_date IS NULL, 0, 1) + IFF(t.salary IS NULL, 0, 1) + IFF(t.email IS NULL, 0, 1)
+      AND (t.hire_date IS NULL OR s.hire_date >= t.hire_date)
+    )
+  )
+  AND (s.salary IS NULL OR s.salary <= 0)
+  THEN DELETE
+WHEN MATCHED
+  AND (
+    IFF(s.name IS NULL, 0, 1) + IFF(s.hire_date IS NULL, 0, 1) + IFF(s.salary IS NULL, 0, 1) + IFF(s.email IS NULL, 0, 1)
+    > IFF(t.name IS NULL, 0, 1) + IFF(t.hire_date IS NULL, 0, 1) + IFF(t.salary IS NULL, 0, 1) + IFF(t.email IS NULL, 0, 1)
+    OR (
+      IFF(s.name IS NULL, 0, 1) + IFF(s.hire_date IS NULL, 0, 1) + IFF(s.salary IS NULL, 0, 1) + IFF(s.email IS NULL, 0, 1)
+      = IFF(t.name IS NULL, 0, 1) + IFF(t.hire_date IS NULL, 0, 1) + IFF(t.salary IS NULL, 0, 1) + IFF(t.email IS NULL, 0, 1)
+      AND (t.hire_date IS NULL OR s.hire_date >= t.hire_date)
+    )
+  )
+  THEN UPDATE SET
+    name = s.name,
+    date_of_birth = s.date_of_birth,
+    hire_date = s.hire_date,
+    department = s.department,
+    job_title = s.job_title,
+    salary = s.salary,
+    region = s.region,
+    country = s.country,
+    email = s.email
+WHEN NOT MATCHED AND s.beats_rejected AND s.salary > 0 THEN INSERT (
+  employee_id, name, date_of_birth, hire_date, department, job_title,
+  salary, region, country, email
+) VALUES (
+  s.employee_id, s.name, s.date_of_birth, s.hire_date, s.department, s.job_title,
+  s.salary, s.region, s.country, s.email
+);
+
+MERGE INTO SILVER.EMPLOYEE_RECORDS_REJECTED r
+USING (
+  SELECT d.*, t.employee_id IS NOT NULL AS in_silver
+  FROM (
+    SELECT *
+    FROM (
+      SELECT
+        TRIM(employee_id) AS employee_id,
+        NULLIF(TRIM(name), '') AS name,
+        TRY_TO_DATE(date_of_birth::VARCHAR) AS date_of_birth,
+        TRY_TO_DATE(hire_date::VARCHAR) AS hire_date,
+        NULLIF(TRIM(department), '') AS department,
+        NULLIF(TRIM(job_title), '') AS job_title,
+        TRY_TO_DECIMAL(REPLACE(salary::VARCHAR, ' ', ''), 18, 2) AS salary,
+        NULLIF(TRIM(region), '') AS region,
+        NULLIF(TRIM(country), '') AS country,
+        NULLIF(REPLACE(TRIM(email), 'mailto:', ''), '') AS email
+      FROM BRONZE.EMPLOYEE_RECORDS_STREAM
+      WHERE employee_id IS NOT NULL
+        AND TRIM(employee_id) <> ''
+    )
+    QUALIFY ROW_NUMBER() OVER (
+      PARTITION BY employee_id
+      ORDER BY
+        IFF(name IS NULL, 0, 1) + IFF(hire_date IS NULL, 0, 1) + IFF(salary IS NULL, 0, 1)
+        + IFF(email IS NULL, 0, 1) DESC,
+        hire_date DESC NULLS LAST
+    ) = 1
+  ) d
+  LEFT JOIN SILVER.EMPLOYEE_RECORDS_CLEAN t
+    ON t.employee_id = d.employee_id
+) s
+ON r.employee_id = s.employee_id
+WHEN MATCHED AND s.in_silver THEN DELETE
+WHEN MATCHED
+  AND (IFF(s.name IS NULL, 0, 1) + IFF(s.hire_date IS NULL, 0, 1) + IFF(s.salary IS NULL, 0, 1) + IFF(s.email IS NULL, 0, 1)
+      > IFF(r.name IS NULL, 0, 1) + IFF(r.hire_date IS NULL, 0, 1) + IFF(r.salary IS NULL, 0, 1) + IFF(r.email IS NULL, 0, 1)
+      OR (
+        IFF(s.name IS NULL, 0, 1) + IFF(s.hire_date IS NULL, 0, 1) + IFF(s.salary IS NULL, 0, 1) + IFF(s.email IS NULL, 0, 1)
+        = IFF(r.name IS NULL, 0, 1) + IFF(r.hire_date IS NULL, 0, 1) + IFF(r.salary IS NULL, 0, 1) + IFF(r.email IS NULL, 0, 1)
+        AND (r.hire_date IS NULL OR s.hire_date >= r.hire_date)
+      ))
+  THEN UPDATE SET
+    name = s.name,
+    date_of_birth = s.date_of_birth,
+    hire_date = s.hire_date,
+    department = s.department,
+    job_title = s.job_title,
+    salary = s.salary,
+    region = s.region,
+    country = s.country,
+    email = s.email
+WHEN NOT MATCHED AND NOT s.in_silver THEN INSERT (
+  employee_id, name, date_of_birth, hire_date, department, job_title,
+  salary, region, country, email
+) VALUES (
+  s.employee_id, s.name, s.date_of_birth, s.hire_date, s.department, s.job_title,
+  s.salary, s.region, s.country, s.email
+);
+
+COMMIT;
+
+-- ------------------------------------------------------------
+-- TABLE 10 — INVENTORY_RAW (JSON) → SILVER.INVENTORY_CLEAN
+
+MERGE INTO SILVER.INVENTORY_CLEAN t
+USING (
+  WITH parsed AS (
+    SELECT
+      NULLIF(TRIM(raw:product_id::STRING), '') AS product_id,
+      NULLIF(TRIM(raw:product_category::STRING), '') AS product_category,
+      NULLIF(TRIM(raw:region::STRING), '') AS region,
+      NULLIF(TRIM(raw:country::STRING), '') AS country,
+      NULLIF(TRIM(raw:warehouse::STRING), '') AS warehouse,
+      TRY_TO_NUMBER(raw:current_stock::STRING) AS current_stock,
+      TRY_TO_NUMBER(raw:reorder_point::STRING) AS reorder_point,
+      TRY_TO_NUMBER(raw:lead_time::STRING) AS lead_time,
+      TRY_TO_DATE(raw:last_restock_date::STRING) AS last_restock_date
+    FROM BRONZE.INVENTORY_RAW_STREAM
+  )
+  SELECT *
+  FROM parsed
+  WHERE product_id IS NOT NULL
+    AND (current_stock IS NULL OR current_stock >= 0)
+    AND (reorder_point IS NULL OR reorder_point >= 0)
+    AND (lead_time IS NULL OR lead_time >= 0)
+  QUALIFY ROW_NUMBER() OVER (
+    PARTITION BY product_id, region, country, warehouse
+    ORDER BY last_restock_date DESC NULLS LAST
+  ) = 1
+) s
+ON t.product_id = s.product_id
+ AND EQUAL_NULL(t.region, s.region)
+ AND EQUAL_NULL(t.country, s.country)
+ AND EQUAL_NULL(t.warehouse, s.warehouse)
+WHEN MATCHED
+  AND (t.last_restock_date IS NULL OR s.last_restock_date >= t.last_restock_date)
+  THEN UPDATE SET
+    product_category = s.product_category,
+    current_stock = s.current_stock,
+    reorder_point = s.reorder_point,
+    lead_time = s.lead_time,
+    last_restock_date = s.last_restock_date
+WHEN NOT MATCHED THEN INSERT (
+  product_id, product_category, region, country, warehouse,
+  current_stock, reorder_point, lead_time, last_restock_date
+) VALUES (
+  s.product_id, s.product_category, s.region, s.country, s.warehouse,
+  s.current_stock, s.reorder_point, s.lead_time, s.last_restock_date
+);
+
+-- ------------------------------------------------------------
+-- TABLE 11 — STORE_LOCATIONS_RAW (JSON) → SILVER.STORE_LOCATIONS_CLEAN
+
+MERGE INTO SILVER.STORE_LOCATIONS_CLEAN t
+USING (
+  WITH parsed AS (
+    SELECT
+      NULLIF(TRIM(raw:store_id::STRING), '') AS store_id,
+      NULLIF(TRIM(raw:store_name::STRING), '') AS store_name,
+      NULLIF(TRIM(raw:store_type::STRING), '') AS store_type,
+      NULLIF(TRIM(raw:region::STRING), '') AS region,
+      NULLIF(TRIM(raw:country::STRING), '') AS country,
+      NULLIF(TRIM(raw:city::STRING), '') AS city,
+      NULLIF(TRIM(raw:address::STRING), '') AS address,
+      NULLIF(TRIM(raw:postal_code::STRING), '') AS postal_code,
+      IFF(TRY_TO_DOUBLE(raw:square_footage::STRING) > 0,
+          TRY_TO_DOUBLE(raw:square_footage::STRING),
+          NULL) AS square_footage,
+      IFF(TRY_TO_NUMBER(raw:employee_count::STRING) >= 0,
+          TRY_TO_NUMBER(raw:employee_count::STRING),
+          NULL) AS employee_count
+    FROM BRONZE.STORE_LOCATIONS_RAW_STREAM
+  )
+  SELECT *
+  FROM parsed
+  WHERE store_id IS NOT NULL
+  QUALIFY ROW_NUMBER() OVER (
+    PARTITION BY store_id
+    ORDER BY
+      IFF(store_name IS NULL, 0, 1) + IFF(country IS NULL, 0, 1) + IFF(city IS NULL, 0, 1)
+      + IFF(square_footage IS NULL, 0, 1) + IFF(employee_count IS NULL, 0, 1) DESC
+  ) = 1
+) s
+ON t.store_id = s.store_id
+WHEN MATCHED
+  AND IFF(s.store_name IS NULL, 0, 1) + IFF(s.country IS NULL, 0, 1) + IFF(s.city IS NULL, 0, 1)
+      + IFF(s.square_footage IS NULL, 0, 1) + IFF(s.employee_count IS NULL, 0, 1)
+      >= IFF(t.store_name IS NULL, 0, 1) + IFF(t.country IS NULL, 0, 1) + IFF(t.city IS NULL, 0, 1)
+      + IFF(t.square_footage IS NULL, 0, 1) + IFF(t.employee_count IS NULL, 0, 1)
+  THEN UPDATE SET
+    store_name = s.store_name,
+    store_type = s.store_type,
+    region = s.region,
+    country = s.country,
+    city = s.city,
+    address = s.address,
+    postal_code = s.postal_code,
+    square_footage = s.square_footage,
+    employee_count = s.employee_count
+WHEN NOT MATCHED THEN INSERT (
+  store_id, store_name, store_type, region, country, city,
+  address, postal_code, square_footage, employee_count
+) VALUES (
+  s.store_id, s.store_name, s.store_type, s.region, s.country, s.city,
+  s.address, s.postal_code, s.square_footage, s.employee_count
+);
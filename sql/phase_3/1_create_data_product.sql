@@ -4,6 +4,58 @@
 
 CREATE SCHEMA IF NOT EXISTS ANALYTICS;
 
+-- 🧱 TABLE 0 – ANALYTICS.PERIOD_CALENDAR (period_kind × region × covered day)
+
+-- Promotions and campaigns are turned into per-region calendars of covered
+-- days (overlapping periods merged first), so flagging a sale is an equi-join
+-- on (region, date) instead of a range join against every period. Built once
+-- here for SALES_ENRICHED and the dashboard's Overview page.
+
+CREATE OR REPLACE TABLE ANALYTICS.PERIOD_CALENDAR AS
+WITH periods AS (
+  SELECT 'PROMOTION' AS period_kind, region, start_date, end_date
+  FROM SILVER.PROMOTIONS_CLEAN
+  WHERE region IS NOT NULL
+  UNION ALL
+  SELECT 'CAMPAIGN' AS period_kind, region, start_date, end_date
+  FROM SILVER.MARKETING_CAMPAIGNS_CLEAN
+  WHERE region IS NOT NULL
+),
+
+islands AS (
+  SELECT
+    period_kind,
+    region,
+    start_date,
+    end_date,
+    SUM(IFF(prev_max_end IS NULL OR start_date > DATEADD(day, 1, prev_max_end), 1, 0)) OVER (
+      PARTITION BY period_kind, region ORDER BY start_date, end_date ROWS UNBOUNDED PRECEDING
+    ) AS island_id
+  FROM (
+    SELECT
+      period_kind,
+      region,
+      start_date,
+      end_date,
+      MAX(end_date) OVER (
+        PARTITION BY period_kind, region ORDER BY start_date, end_date
+        ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+      ) AS prev_max_end
+    FROM periods
+  )
+)
+
+SELECT
+  i.period_kind,
+  i.region,
+  DATEADD(day, d.value::INT, i.start_date) AS calendar_date
+FROM (
+  SELECT period_kind, region, MIN(start_date) AS start_date, MAX(end_date) AS end_date
+  FROM islands
+  GROUP BY period_kind, region, island_id
+) i,
+LATERAL FLATTEN(input => ARRAY_GENERATE_RANGE(0, DATEDIFF('day', i.start_date, i.end_date) + 1)) d;
+
 -- 🧱 TABLE 1 – ANALYTICS.SALES_ENRICHED
 
 CREATE OR REPLACE TABLE ANALYTICS.SALES_ENRICHED AS
@@ -15,28 +67,6 @@ WITH sales AS (
     amount
   FROM SILVER.FINANCIAL_TRANSACTIONS_CLEAN
   WHERE transaction_type = 'Sale'
-),
-
-promo_flag AS (
-  SELECT
-    s.transaction_id,
-    MAX(1) AS is_promo_period
-  FROM sales s
-  JOIN SILVER.PROMOTIONS_CLEAN p
-    ON s.region = p.region
-   AND s.transaction_date BETWEEN p.start_date AND p.end_date
-  GROUP BY s.transaction_id
-),
-
-campaign_flag AS (
-  SELECT
-    s.transaction_id,
-    MAX(1) AS is_campaign_period
-  FROM sales s
-  JOIN SILVER.MARKETING_CAMPAIGNS_CLEAN c
-    ON s.region = c.region
-   AND s.transaction_date BETWEEN c.start_date AND c.end_date
-  GROUP BY s.transaction_id
 )
 
 SELECT
@@ -45,14 +75,16 @@ SELECT
   s.region,
   s.amount,
 
-  COALESCE(p.is_promo_period, 0) AS is_promo_period,
-  COALESCE(c.is_campaign_period, 0) AS is_campaign_period,
+  IFF(p.calendar_date IS NULL, 0, 1) AS is_promo_period,
+  IFF(c.calendar_date IS NULL, 0, 1) AS is_campaign_period,
 
   DATE_TRUNC('month', s.transaction_date) AS sales_month,
   DAYOFWEEK(s.transaction_date) AS day_of_week
 FROM sales s
-LEFT JOIN promo_flag p ON s.transaction_id = p.transaction_id
-LEFT JOIN campaign_flag c ON s.transaction_id = c.transaction_id;
+LEFT JOIN ANALYTICS.PERIOD_CALENDAR p
+  ON p.period_kind = 'PROMOTION' AND p.region = s.region AND p.calendar_date = s.transaction_date
+LEFT JOIN ANALYTICS.PERIOD_CALENDAR c
+  ON c.period_kind = 'CAMPAIGN' AND c.region = s.region AND c.calendar_date = s.transaction_date;
 
 -- 🧱 TABLE 2 – ANALYTICS.ACTIVE_PROMOTIONS
 
@@ -143,6 +143,23 @@ LEFT JOIN campaign_overlap co ON ps.promotion_id = co.promotion_id
 LEFT JOIN seasonality s ON ps.promotion_id = s.promotion_id
 WHERE bs.baseline_daily_sales IS NOT NULL;  -- Only keep promos with baseline data
 
+-- ============================================================================
+-- Change tracking for the incremental refresh (3_ml_feature_incremental.sql)
+-- ============================================================================
+-- Standard (not append-only) streams: the SILVER MERGEs update and delete rows,
+-- and the old version of a row tells which promotions it used to feed.
+-- Created with the table so their offsets start at this full build.
+-- A full SILVER rebuild (5_clean_data.sql) makes them stale: rerun this script.
+
+CREATE OR REPLACE STREAM ANALYTICS.ML_TRANSACTIONS_STREAM
+  ON TABLE SILVER.FINANCIAL_TRANSACTIONS_CLEAN;
+
+CREATE OR REPLACE STREAM ANALYTICS.ML_PROMOTIONS_STREAM
+  ON TABLE SILVER.PROMOTIONS_CLEAN;
+
+CREATE OR REPLACE STREAM ANALYTICS.ML_CAMPAIGNS_STREAM
+  ON TABLE SILVER.MARKETING_CAMPAIGNS_CLEAN;
+
 -- ============================================================================
 -- Verification
 -- ============================================================================
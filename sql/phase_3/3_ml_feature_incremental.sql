@@ -0,0 +1,230 @@
+-- ============================================================================
+-- Phase 3.3 - Incremental refresh of ML_PROMO_EFFECTIVENESS
+-- Purpose: recompute only the promotions touched by SILVER changes
+-- ============================================================================
+-- Same features as 2_ml_feature_tables.sql, limited to the promotions whose
+-- inputs changed since the last refresh (streams created by that script):
+--   1. a changed Sale transaction touches the promotions of its region whose
+--      baseline or promo window contains its date: [start - 30 days, end],
+--   2. a changed campaign touches the promotions of its region it overlaps,
+--   3. a changed promotion touches itself.
+-- Old and new row versions are both read, so a row moving out of a window
+-- (new date, region or type) refreshes the promotions it used to feed.
+-- The touched ids are queued in ML_PROMO_DIRTY, consuming the streams. The
+-- MERGE then inserts, updates or deletes (no baseline any more, promotion
+-- removed) their rows and clears the queue in one transaction; if it fails,
+-- the queue is kept and the next run retries it.
+-- Run through python -m pipeline.incremental, after the SILVER MERGEs.
+
+USE DATABASE ANYCOMPANY_LAB;
+USE SCHEMA ANALYTICS;
+
+CREATE TRANSIENT TABLE IF NOT EXISTS ANALYTICS.ML_PROMO_DIRTY (
+    promotion_id VARCHAR
+);
+
+-- ------------------------------------------------------------
+-- 1. Queue the promotions touched by the delta
+
+INSERT INTO ANALYTICS.ML_PROMO_DIRTY (promotion_id)
+WITH sales_days AS (
+    SELECT DISTINCT region, transaction_date
+    FROM ANALYTICS.ML_TRANSACTIONS_STREAM
+    WHERE transaction_type = 'Sale'
+      AND region IS NOT NULL
+      AND transaction_date IS NOT NULL
+),
+campaign_periods AS (
+    SELECT DISTINCT region, start_date, end_date
+    FROM ANALYTICS.ML_CAMPAIGNS_STREAM
+    WHERE region IS NOT NULL
+)
+SELECT p.promotion_id
+FROM SILVER.PROMOTIONS_CLEAN p
+JOIN sales_days d
+    ON d.region = p.region
+    AND d.transaction_date BETWEEN DATEADD(day, -30, p.start_date) AND p.end_date
+UNION
+SELECT p.promotion_id
+FROM SILVER.PROMOTIONS_CLEAN p
+JOIN campaign_periods c
+    ON c.region = p.region
+    AND (c.start_date <= p.end_date AND c.end_date >= p.start_date)
+UNION
+SELECT promotion_id
+FROM ANALYTICS.ML_PROMOTIONS_STREAM
+WHERE promotion_id IS NOT NULL;
+
+-- ------------------------------------------------------------
+-- 2. Recompute the queued promotions and merge them in
+
+BEGIN;
+
+MERGE INTO ANALYTICS.ML_PROMO_EFFECTIVENESS t
+USING (
+    WITH dirty AS (
+        SELECT DISTINCT promotion_id FROM ANALYTICS.ML_PROMO_DIRTY
+    ),
+    promos AS (
+        SELECT p.*
+        FROM SILVER.PROMOTIONS_CLEAN p
+        JOIN dirty d ON d.promotion_id = p.promotion_id
+    ),
+    promo_sales AS (
+        SELECT
+            p.promotion_id,
+            p.product_category,
+            p.start_date,
+            p.end_date,
+            p.discount_percentage,
+            p.promotion_type,
+            p.region,
+            DATEDIFF(day, p.start_date, p.end_date) + 1 AS duration_days,
+            COUNT(DISTINCT t.transaction_id) AS transactions_count,
+            SUM(t.amount) AS total_sales,
+            AVG(t.amount) AS avg_transaction_value
+        FROM promos p
+        LEFT JOIN SILVER.FINANCIAL_TRANSACTIONS_CLEAN t
+            ON t.transaction_date BETWEEN p.start_date AND p.end_date
+            AND t.region = p.region
+            AND t.transaction_type = 'Sale'
+        GROUP BY 1,2,3,4,5,6,7,8
+    ),
+    baseline_sales AS (
+        SELECT
+            p.promotion_id,
+            AVG(t.amount) AS baseline_avg_transaction,
+            COUNT(DISTINCT t.transaction_id) / 30.0 AS baseline_daily_transactions,
+            SUM(t.amount) / 30.0 AS baseline_daily_sales
+        FROM promos p
+        LEFT JOIN SILVER.FINANCIAL_TRANSACTIONS_CLEAN t
+            ON t.transaction_date BETWEEN DATEADD(day, -30, p.start_date)
+                AND DATEADD(day, -1, p.start_date)
+            AND t.region = p.region
+            AND t.transaction_type = 'Sale'
+        GROUP BY p.promotion_id
+    ),
+    campaign_overlap AS (
+        SELECT
+            p.promotion_id,
+            MAX(CASE WHEN c.campaign_id IS NOT NULL THEN 1 ELSE 0 END) AS has_campaign_overlap,
+            COUNT(DISTINCT c.campaign_id) AS num_overlapping_campaigns
+        FROM promos p
+        LEFT JOIN SILVER.MARKETING_CAMPAIGNS_CLEAN c
+            ON c.region = p.region
+            AND (c.start_date <= p.end_date AND c.end_date >= p.start_date)
+        GROUP BY p.promotion_id
+    ),
+    seasonality AS (
+        SELECT
+            promotion_id,
+            EXTRACT(MONTH FROM start_date) AS start_month,
+            EXTRACT(QUARTER FROM start_date) AS start_quarter,
+            DAYOFWEEK(start_date) AS start_day_of_week,
+            CASE
+                WHEN EXTRACT(MONTH FROM start_date) IN (11, 12) THEN 1
+                ELSE 0
+            END AS is_holiday_season,
+            CASE
+                WHEN DAYOFWEEK(start_date) IN (0, 6) THEN 1
+                ELSE 0
+            END AS starts_on_weekend
+        FROM promos
+    ),
+    features AS (
+        SELECT
+            ps.promotion_id,
+            ps.product_category,
+            ps.promotion_type,
+            ps.region,
+            ps.discount_percentage,
+            ps.duration_days,
+            ps.start_date,
+            ps.end_date,
+            ps.transactions_count,
+            ps.total_sales,
+            ps.avg_transaction_value,
+            COALESCE(bs.baseline_avg_transaction, 0) AS baseline_avg_transaction,
+            COALESCE(bs.baseline_daily_transactions, 0) AS baseline_daily_transactions,
+            COALESCE(bs.baseline_daily_sales, 0) AS baseline_daily_sales,
+            COALESCE(co.has_campaign_overlap, 0) AS has_campaign_overlap,
+            COALESCE(co.num_overlapping_campaigns, 0) AS num_overlapping_campaigns,
+            s.start_month,
+            s.start_quarter,
+            s.start_day_of_week,
+            s.is_holiday_season,
+            s.starts_on_weekend,
+            CASE
+                WHEN bs.baseline_daily_sales > 0
+                THEN ((ps.total_sales / ps.duration_days) - bs.baseline_daily_sales) / bs.baseline_daily_sales
+                ELSE 0
+            END AS sales_lift_ratio,
+            CASE
+                WHEN ps.total_sales > bs.baseline_daily_sales * ps.duration_days
+                THEN 1
+                ELSE 0
+            END AS is_successful,
+            ps.total_sales * ps.discount_percentage AS estimated_promo_cost,
+            CASE
+                WHEN ps.total_sales * ps.discount_percentage > 0
+                THEN (ps.total_sales - (bs.baseline_daily_sales * ps.duration_days)) /
+                         (ps.total_sales * ps.discount_percentage)
+                ELSE 0
+            END AS roi_proxy
+        FROM promo_sales ps
+        LEFT JOIN baseline_sales bs ON ps.promotion_id = bs.promotion_id
+        LEFT JOIN campaign_overlap co ON ps.promotion_id = co.promotion_id
+        LEFT JOIN seasonality s ON ps.promotion_id = s.promotion_id
+        WHERE bs.baseline_daily_sales IS NOT NULL
+    )
+    -- One row per queued id; NULL features = the promotion no longer qualifies
+    SELECT d.promotion_id AS dirty_id, f.*
+    FROM dirty d
+    LEFT JOIN features f ON f.promotion_id = d.promotion_id
+) s
+ON t.promotion_id = s.dirty_id
+WHEN MATCHED AND s.promotion_id IS NULL THEN DELETE
+WHEN MATCHED THEN UPDATE SET
+    product_category = s.product_category,
+    promotion_type = s.promotion_type,
+    region = s.region,
+    discount_percentage = s.discount_percentage,
+    duration_days = s.duration_days,
+    start_date = s.start_date,
+    end_date = s.end_date,
+    transactions_count = s.transactions_count,
+    total_sales = s.total_sales,
+    avg_transaction_value = s.avg_transaction_value,
+    baseline_avg_transaction = s.baseline_avg_transaction,
+    baseline_daily_transactions = s.baseline_daily_transactions,
+    baseline_daily_sales = s.baseline_daily_sales,
+    has_campaign_overlap = s.has_campaign_overlap,
+    num_overlapping_campaigns = s.num_overlapping_campaigns,
+    start_month = s.start_month,
+    start_quarter = s.start_quarter,
+    start_day_of_week = s.start_day_of_week,
+    is_holiday_season = s.is_holiday_season,
+    starts_on_weekend = s.starts_on_weekend,
+    sales_lift_ratio = s.sales_lift_ratio,
+    is_successful = s.is_successful,
+    estimated_promo_cost = s.estimated_promo_cost,
+    roi_proxy = s.roi_proxy
+WHEN NOT MATCHED AND s.promotion_id IS NOT NULL THEN INSERT (
+    promotion_id, product_category, promotion_type, region, discount_percentage,
+    duration_days, start_date, end_date, transactions_count, total_sales,
+    avg_transaction_value, baseline_avg_transaction, baseline_daily_transactions,
+    baseline_daily_sales, has_campaign_overlap, num_overlapping_campaigns,
+    start_month, start_quarter, start_day_of_week, is_holiday_season,
+    starts_on_weekend, sales_lift_ratio, is_successful, estimated_promo_cost, roi_proxy
+) VALUES (
+    s.promotion_id, s.product_category, s.promotion_type, s.region, s.discount_percentage,
+    s.duration_days, s.start_date, s.end_date, s.transactions_count, s.total_sales,
+    s.avg_transaction_value, s.baseline_avg_transaction, s.baseline_daily_transactions,
+    s.baseline_daily_sales, s.has_campaign_overlap, s.num_overlapping_campaigns,
+    s.start_month, s.start_quarter, s.start_day_of_week, s.is_holiday_season,
+    s.starts_on_weekend, s.sales_lift_ratio, s.is_successful, s.estimated_promo_cost, s.roi_proxy
+);
+
+DELETE FROM ANALYTICS.ML_PROMO_DIRTY;
+
+COMMIT;
@@ -0,0 +1,47 @@
+-- 🚀 Phase 4 – GOLD rollups for the dashboards
+
+-- The Overview, Sales and Marketing ROI pages only need sales aggregated by
+-- day, region and transaction type. These rollups hold a few thousand rows
+-- instead of the full SILVER.FINANCIAL_TRANSACTIONS_CLEAN history.
+-- Re-run this script after every SILVER rebuild (phase_1/5_clean_data.sql):
+-- streamlit/_rollups.py only routes queries here while the rollup is at least
+-- as recent as its SILVER source.
+
+USE DATABASE ANYCOMPANY_LAB;
+
+CREATE SCHEMA IF NOT EXISTS GOLD;
+
+-- 🧱 TABLE 1 – GOLD.SALES_DAILY (day × region × transaction_type)
+
+CREATE OR REPLACE TABLE GOLD.SALES_DAILY
+CLUSTER BY (transaction_date)
+AS
+SELECT
+  transaction_date,
+  region,
+  transaction_type,
+  SUM(amount) AS total_amount,
+  COUNT(*) AS nb_transactions
+FROM SILVER.FINANCIAL_TRANSACTIONS_CLEAN
+GROUP BY transaction_date, region, transaction_type;
+
+-- ✅ Checks – the rollup must reconcile with SILVER
+
+SELECT COUNT(*) AS rollup_rows FROM GOLD.SALES_DAILY;
+
+SELECT
+  (SELECT SUM(amount) FROM SILVER.FINANCIAL_TRANSACTIONS_CLEAN) AS silver_amount,
+  (SELECT SUM(total_amount) FROM GOLD.SALES_DAILY) AS gold_amount,
+  (SELECT COUNT(*) FROM SILVER.FINANCIAL_TRANSACTIONS_CLEAN) AS silver_rows,
+  (SELECT SUM(nb_transactions) FROM GOLD.SALES_DAILY) AS gold_transactions;
+
+-- Same monthly series as the Sales page, read from the rollup
+
+SELECT
+  DATE_TRUNC('month', transaction_date) AS month,
+  SUM(total_amount) AS total_sales,
+  SUM(nb_transactions) AS nb_sales
+FROM GOLD.SALES_DAILY
+WHERE transaction_type = 'Sale'
+GROUP BY month
+ORDER BY month;
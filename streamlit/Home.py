@@ -2,6 +2,16 @@ import streamlit as st
 
 st.set_page_config(page_title="AnyCompany • Marketing Analytics", layout="wide")
 
+from _prewarm import start_prewarmer
+
+start_prewarmer()
+
+if "diagnostics" in st.query_params:
+    from _diagnostics import render
+
+    render()
+    st.stop()
+
 st.title("AnyCompany • Data-Driven Marketing Analytics")
 st.caption("Local execution • Snowflake via secrets.toml")
 
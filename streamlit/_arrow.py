@@ -0,0 +1,54 @@
+import pyarrow as pa
+
+# ------------------------------------------------------------
+# Arrow → pandas conversion at the fetch boundary
+# ------------------------------------------------------------
+# Results stay Arrow tables (backend, disk cache) until they reach a page,
+# where they are converted once with dashboard-friendly dtypes:
+#   NUMBER(p,0)        -> int64 (float64 when it holds NULLs or overflows)
+#   NUMBER(p,s>0)      -> float64 (no more Decimal objects to re-cast by hand)
+#   CATEGORICAL_COLUMNS -> pandas categorical (region, transaction type, ...)
+#   other VARCHAR      -> object
+#   DATE               -> datetime64
+# Categoricals are much smaller in st.cache_data and cheaper to group/plot.
+# Only the declared columns are converted, so a column's dtype never depends
+# on the rows a query happened to return.
+
+# Categorical when present (known small domains)
+CATEGORICAL_COLUMNS = {
+    "REGION",
+    "TRANSACTION_TYPE",
+    "PRODUCT_CATEGORY",
+    "PROMOTION_TYPE",
+    "STATUS",
+    "SHIPPING_METHOD",
+    "CARRIER",
+    "GENDER",
+    "MARITAL_STATUS",
+    "CAMPAIGN_TYPE",
+    "DESTINATION_REGION",
+    "INTERACTION_TYPE",
+    "ISSUE_CATEGORY",
+}
+
+
+def _convert_column(name: str, column: pa.ChunkedArray) -> pa.ChunkedArray:
+    kind = column.type
+    if pa.types.is_decimal(kind):
+        if kind.scale == 0 and column.null_count == 0:
+            try:
+                return column.cast(pa.int64())  # SUM(count) is NUMBER(38,0) but fits
+            except pa.ArrowInvalid:
+                pass
+        return column.cast(pa.float64())
+    if pa.types.is_string(kind) or pa.types.is_large_string(kind):
+        if name.upper() in CATEGORICAL_COLUMNS:
+            return column.dictionary_encode()
+    return column
+
+
+def to_frame(table: pa.Table):
+    """Arrow result -> pandas DataFrame with the dtypes above."""
+    columns = [_convert_column(name, table.column(name)) for name in table.column_names]
+    converted = pa.Table.from_arrays(columns, names=table.column_names)
+    return converted.to_pandas(date_as_object=False)
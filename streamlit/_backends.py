@@ -0,0 +1,231 @@
+import os
+import sys
+import threading
+import time
+
+import pyarrow as pa
+
+# ------------------------------------------------------------
+# Query backends
+# ------------------------------------------------------------
+# ANYCOMPANY_BACKEND=snowflake (default) runs the dashboards on the Snowflake
+# pool; ANYCOMPANY_BACKEND=duckdb serves them from a local DuckDB build
+# (python -m pipeline local-build) with the queries translated on the fly;
+# ANYCOMPANY_BACKEND=snowpark reuses the active Snowpark session (Streamlit in
+# Snowflake, see app_streamlit.py). All return Arrow tables and table
+# versions in the same shape.
+
+BACKEND = os.getenv("ANYCOMPANY_BACKEND", "snowflake").lower()
+# Snowpark only: build a page's base aggregate once with cache_result()
+SNOWPARK_PUSHDOWN = os.getenv("ANYCOMPANY_SNOWPARK_PUSHDOWN", "1") != "0"
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Derived queries of a page read its base aggregate through this placeholder
+# (see _dashboards.Page.base). Backends inline it as a subquery, except
+# Snowpark in pushdown mode, which materializes it once per batch.
+BASE = "$BASE"
+
+
+def expand_base(queries: dict, base=None) -> dict:
+    """Inline the base aggregate SQL in place of BASE."""
+    if base is None:
+        return queries
+    return {name: sql.replace(BASE, f"(\n{base}\n)") for name, sql in queries.items()}
+
+
+def _fetch_arrow(conn, queries: dict, stats=None) -> dict:
+    # stats, when given, receives {name: {query_id, exec_seconds, fetch_seconds}}
+    stats = {} if stats is None else stats
+    cur = conn.cursor()
+    try:
+        if len(queries) == 1:
+            ((name, sql),) = queries.items()
+            start = time.perf_counter()
+            cur.execute(sql)
+            executed = time.perf_counter()
+            table = cur.fetch_arrow_all(force_return_table=True)
+            stats[name] = {
+                "query_id": cur.sfqid,
+                "exec_seconds": executed - start,
+                "fetch_seconds": time.perf_counter() - executed,
+            }
+            return {name: table}
+
+        query_ids = {}
+        submitted = time.perf_counter()
+        for name, sql in queries.items():
+            cur.execute_async(sql)
+            query_ids[name] = cur.sfqid
+
+        results = {}
+        for name, query_id in query_ids.items():
+            cur.get_results_from_sfqid(query_id)
+            executed = time.perf_counter()
+            results[name] = cur.fetch_arrow_all(force_return_table=True)
+            # Queries run concurrently: exec time is measured from the common submission
+            stats[name] = {
+                "query_id": query_id,
+                "exec_seconds": executed - submitted,
+                "fetch_seconds": time.perf_counter() - executed,
+            }
+        return results
+    finally:
+        cur.close()
+
+
+def _probe_versions(conn, tables: tuple) -> dict:
+    # Probes the current database; DB.SCHEMA.TABLE references match on SCHEMA.TABLE.
+    # Versions are LAST_ALTERED in epoch nanoseconds: independent of the session
+    # timezone and output format, and ordered (see _rollups.rollup_ready)
+    by_name = {".".join(t.split(".")[-2:]): t for t in tables}
+    names = ", ".join(f"'{name}'" for name in by_name)
+    cur = conn.cursor()
+    try:
+        cur.execute(f"""
+        SELECT table_schema || '.' || table_name AS name,
+               TO_VARCHAR(DATE_PART(epoch_nanosecond, last_altered)) AS version
+        FROM INFORMATION_SCHEMA.TABLES
+        WHERE table_schema || '.' || table_name IN ({names})
+        """)
+        return {by_name[name]: version for name, version in cur.fetchall()}
+    finally:
+        cur.close()
+
+
+def _rebatch(batches, batch_rows):
+    """Re-chunk a stream of Arrow record batches into tables of batch_rows rows."""
+    pending, size = [], 0
+    for batch in batches:
+        while batch.num_rows:
+            take = min(batch.num_rows, batch_rows - size)
+            pending.append(batch.slice(0, take))
+            batch, size = batch.slice(take), size + take
+            if size == batch_rows:
+                yield pa.Table.from_batches(pending)
+                pending, size = [], 0
+    if pending:
+        yield pa.Table.from_batches(pending)
+
+
+class SnowflakeBackend:
+    name = "snowflake"
+
+    def __init__(self, pool, database=None, schema=None):
+        self.pool = pool
+        self.namespace = (database, schema)
+
+    def run(self, queries: dict, stats=None, base=None) -> dict:
+        """{name: sql} -> {name: Arrow table}, all submitted with execute_async.
+
+        `stats` (optional dict) is filled with the per-query ID, pool queue
+        wait, execution and fetch times. `base` is the SQL behind BASE.
+        """
+        stats = {} if stats is None else stats
+        queries = expand_base(queries, base)
+        requested = time.perf_counter()
+
+        def fetch(conn):
+            queue_wait = time.perf_counter() - requested
+            results = _fetch_arrow(conn, queries, stats)
+            for name in results:
+                stats[name]["queue_wait"] = queue_wait
+            return results
+
+        return self.pool.run(fetch)
+
+    def stream(self, sql: str, batch_rows: int):
+        """Yield Arrow tables of batch_rows rows; the pooled connection is held until exhausted."""
+        with self.pool.connection() as conn:
+            cur = conn.cursor()
+            try:
+                cur.execute(sql)
+                batches = (b for t in cur.fetch_arrow_batches() for b in t.to_batches())
+                yield from _rebatch(batches, batch_rows)
+            finally:
+                cur.close()
+
+    def table_versions(self, tables: tuple) -> dict:
+        return self.pool.run(lambda conn: _probe_versions(conn, tables))
+
+
+class SnowparkBackend:
+    """Runs on the connector connection behind a Snowpark session (no credentials needed)."""
+
+    name = "snowpark"
+
+    def __init__(self, session):
+        self.session = session
+        self.namespace = (session.get_current_database(), session.get_current_schema())
+        self._lock = threading.Lock()  # one connection shared by every script run
+
+    def run(self, queries: dict, stats=None, base=None) -> dict:
+        """Like SnowflakeBackend.run; in pushdown mode the base aggregate is
+        computed once into a temporary table (DataFrame.cache_result()) and
+        every derived query only reads that small table."""
+        stats = {} if stats is None else stats
+        pushdown = base is not None and SNOWPARK_PUSHDOWN
+        if not pushdown:
+            queries = expand_base(queries, base)
+        requested = time.perf_counter()
+        base_seconds = 0.0
+        with self._lock:
+            queue_wait = time.perf_counter() - requested
+            if not pushdown:
+                results = _fetch_arrow(self.session.connection, queries, stats)
+            else:
+                start = time.perf_counter()
+                cached = self.session.sql(base).cache_result()
+                base_seconds = time.perf_counter() - start
+                try:
+                    derived = {name: sql.replace(BASE, cached.table_name) for name, sql in queries.items()}
+                    results = _fetch_arrow(self.session.connection, derived, stats)
+                finally:
+                    cached.drop_table()
+        for name in results:
+            stats[name]["queue_wait"] = queue_wait
+            if pushdown:
+                stats[name]["base_seconds"] = base_seconds
+                stats[name]["exec_seconds"] += base_seconds
+        return results
+
+    def stream(self, sql: str, batch_rows: int):
+        # Own cursor, no lock: the connector allows concurrent cursors on one connection
+        cur = self.session.connection.cursor()
+        try:
+            cur.execute(sql)
+            batches = (b for t in cur.fetch_arrow_batches() for b in t.to_batches())
+            yield from _rebatch(batches, batch_rows)
+        finally:
+            cur.close()
+
+    def table_versions(self, tables: tuple) -> dict:
+        with self._lock:
+            return _probe_versions(self.session.connection, tables)
+
+
+class DuckDBBackend:
+    name = "duckdb"
+
+    def __init__(self, path=None):
+        if REPO_ROOT not in sys.path:
+            sys.path.insert(0, REPO_ROOT)
+        from pipeline.local_engine import LocalEngine
+
+        self.engine = LocalEngine(path)
+        self.namespace = ("duckdb", self.engine.path)
+
+    def run(self, queries: dict, stats=None, base=None) -> dict:
+        results = {}
+        for name, sql in expand_base(queries, base).items():
+            start = time.perf_counter()
+            results[name] = self.engine.query_arrow(sql)
+            if stats is not None:
+                stats[name] = {"query_id": None, "queue_wait": 0.0, "exec_seconds": time.perf_counter() - start}
+        return results
+
+    def stream(self, sql: str, batch_rows: int):
+        yield from _rebatch(self.engine.stream_arrow(sql, batch_rows), batch_rows)
+
+    def table_versions(self, tables: tuple) -> dict:
+        return self.engine.table_versions(tables)
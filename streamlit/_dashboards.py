@@ -0,0 +1,695 @@
+import time
+from dataclasses import dataclass, field
+from datetime import date
+
+import pandas as pd
+import streamlit as st
+
+from _backends import BASE
+from _paging import paginated_table
+from _rollups import sales_query
+from _scenarios import ScenarioGrid
+from _scoring import BASELINE_COLUMNS, candidate_grid, get_scorer
+from _utils import Filters, fmt_money, run_queries, safe_float, safe_int, sidebar_filters
+
+# ------------------------------------------------------------
+# Dashboard page definitions
+# ------------------------------------------------------------
+# Each page is a query spec (Filters -> {name: SQL}) and a render function
+# (data, filters). Charts cut from the same table read one base aggregate
+# (Page.base) through BASE: on Snowpark it is computed once per page with
+# cache_result(), elsewhere it is inlined. Both entry points draw pages
+# through render_page():
+#   pages/*.py          multipage app (connector pool or DuckDB backend)
+#   app_streamlit.py    single-script app for Streamlit in Snowflake (Snowpark session)
+# so caching, batching and pre-warming (_prewarm, which replays PAGES in the
+# background) are implemented once.
+
+
+@dataclass(frozen=True)
+class Page:
+    title: str
+    caption: str
+    queries: callable  # Filters -> {name: sql}, all run in one run_queries() batch
+    render: callable  # (data, filters) -> None
+    filters: dict = field(default_factory=dict)  # sidebar_filters() arguments
+    base: callable = None  # Filters -> SQL of the aggregate the queries read as BASE
+    prewarm: bool = True  # replayed by _prewarm (off for pages whose sources may not exist yet)
+
+
+# ------------------------------------------------------------
+# Overview
+# ------------------------------------------------------------
+def overview_base(filters: Filters) -> str:
+    return sales_query(
+        {"amount": "amount", "nb_transactions": "count"},
+        by=("month", "region", "transaction_type"),
+        filters=filters,
+    )
+
+
+def overview_queries(filters: Filters) -> dict:
+    return {
+        "kpi": f"""
+SELECT SUM(IFF(transaction_type='Sale', amount, 0)) AS total_sales,
+       SUM(IFF(transaction_type='Sale', nb_transactions, 0)) AS nb_sales,
+       COUNT(DISTINCT region) AS nb_regions
+FROM {BASE} b;
+""",
+        "promo_rate": f"""
+WITH sales AS (
+{sales_query({"nb_sales": "count"}, by=("transaction_date", "region"), transaction_type="Sale", filters=filters)}
+),
+flagged AS (
+  SELECT
+    s.*,
+    IFF(p.calendar_date IS NULL, 0, 1) AS is_promo
+  FROM sales s
+  LEFT JOIN ANALYTICS.PERIOD_CALENDAR p
+    ON p.period_kind = 'PROMOTION' AND p.region = s.region AND p.calendar_date = s.transaction_date
+)
+SELECT (SUM(nb_sales * is_promo) / NULLIF(SUM(nb_sales), 0))::FLOAT AS promo_rate
+FROM flagged;
+""",
+        "month": f"""
+SELECT month, SUM(amount) AS total_sales
+FROM {BASE} b
+WHERE transaction_type='Sale'
+GROUP BY month
+ORDER BY month;
+""",
+        "regions": f"""
+SELECT region, SUM(amount) AS total_sales
+FROM {BASE} b
+WHERE transaction_type='Sale'
+GROUP BY region
+ORDER BY total_sales DESC;
+""",
+    }
+
+
+def overview_render(data: dict, filters: Filters):
+    kpi = data["kpi"]
+    promo_rate_df = data["promo_rate"]
+    df_month = data["month"]
+    df_regions = data["regions"]
+
+    total_sales = safe_float(kpi.loc[0, "TOTAL_SALES"]) if not kpi.empty else 0.0
+    nb_sales = safe_int(kpi.loc[0, "NB_SALES"]) if not kpi.empty else 0
+    nb_regions = safe_int(kpi.loc[0, "NB_REGIONS"]) if not kpi.empty else 0
+
+    promo_rate = (
+        safe_float(promo_rate_df.loc[0, "PROMO_RATE"]) if not promo_rate_df.empty else 0.0
+    )
+
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Total Sales", fmt_money(total_sales))
+    c2.metric("Number of sales (Sale)", f"{nb_sales:,}".replace(",", " "))
+    c3.metric("Number of regions", f"{nb_regions:,}".replace(",", " "))
+    c4.metric("Share of sales during promo period", f"{promo_rate*100:.1f}%")
+
+    st.divider()
+
+    left, right = st.columns(2)
+
+    with left:
+        st.caption("Sales trend (monthly) — line chart")
+        if not df_month.empty:
+            df_month["MONTH"] = pd.to_datetime(df_month["MONTH"])
+            st.line_chart(df_month.set_index("MONTH")[["TOTAL_SALES"]])
+        else:
+            st.info("No sales data.")
+
+    with right:
+        st.caption("Sales by region — bar chart")
+        if not df_regions.empty:
+            st.bar_chart(df_regions.set_index("REGION")[["TOTAL_SALES"]])
+        else:
+            st.info("No regional data.")
+
+    with st.expander("View the data"):
+        st.dataframe(df_month, use_container_width=True)
+        st.dataframe(df_regions, use_container_width=True)
+
+
+# ------------------------------------------------------------
+# Sales
+# ------------------------------------------------------------
+def sales_base(filters: Filters) -> str:
+    return sales_query(
+        {"amount": "amount", "nb_transactions": "count"},
+        by=("month", "transaction_type"),
+        filters=filters,
+    )
+
+
+def sales_queries(filters: Filters) -> dict:
+    return {
+        "month": f"""
+SELECT month, SUM(amount) AS total_sales, SUM(nb_transactions) AS nb_sales
+FROM {BASE} b
+WHERE transaction_type='Sale'
+GROUP BY month
+ORDER BY month;
+""",
+        "types": f"""
+SELECT transaction_type, SUM(amount) AS total_amount
+FROM {BASE} b
+GROUP BY transaction_type
+ORDER BY total_amount DESC;
+""",
+    }
+
+
+def sales_render(data: dict, filters: Filters):
+    df_month = data["month"]
+    df_types = data["types"]
+
+    if not df_month.empty:
+        df_month["MONTH"] = pd.to_datetime(df_month["MONTH"])
+        st.caption("Total Sales (monthly) — line chart")
+        st.line_chart(df_month.set_index("MONTH")[["TOTAL_SALES"]])
+
+        st.caption("Number of sales (monthly) — line chart")
+        st.line_chart(df_month.set_index("MONTH")[["NB_SALES"]])
+    else:
+        st.info("No sales data.")
+
+    st.divider()
+
+    st.caption("Total amount by transaction type — bar chart")
+    if not df_types.empty:
+        st.bar_chart(df_types.set_index("TRANSACTION_TYPE")[["TOTAL_AMOUNT"]])
+    else:
+        st.info("No transaction type data.")
+
+    with st.expander("View tables"):
+        st.dataframe(df_month, use_container_width=True)
+        st.dataframe(df_types, use_container_width=True)
+
+    with st.expander("Transactions (detail)"):
+        paginated_table(
+            "SELECT transaction_id, transaction_date, transaction_type, amount, payment_method, entity, region "
+            "FROM SILVER.FINANCIAL_TRANSACTIONS_CLEAN "
+            + filters.where(date="transaction_date", region="region"),
+            key="transaction_id",
+            name="sales_transactions",
+        )
+
+
+# ------------------------------------------------------------
+# Promotions
+# ------------------------------------------------------------
+def _promotions_where(filters: Filters) -> str:
+    return filters.where(period=("start_date", "end_date"), region="region", category="product_category")
+
+
+def promotions_base(filters: Filters) -> str:
+    return f"""
+SELECT
+  product_category,
+  region,
+  COUNT(*) AS nb_promos,
+  SUM(discount_percentage) AS sum_discount,
+  COUNT(discount_percentage) AS nb_discounts
+FROM SILVER.PROMOTIONS_CLEAN
+{_promotions_where(filters)}
+GROUP BY product_category, region
+"""
+
+
+def promotions_queries(filters: Filters) -> dict:
+    return {
+        "category": f"""
+SELECT
+  product_category,
+  SUM(nb_promos) AS nb_promos,
+  SUM(sum_discount) / NULLIF(SUM(nb_discounts), 0) AS avg_discount
+FROM {BASE} b
+GROUP BY product_category
+ORDER BY nb_promos DESC;
+""",
+        "region": f"""
+SELECT region, SUM(nb_promos) AS nb_promos
+FROM {BASE} b
+GROUP BY region
+ORDER BY nb_promos DESC;
+""",
+    }
+
+
+def promotions_render(data: dict, filters: Filters):
+    df_cat = data["category"]
+    df_region = data["region"]
+
+    c1, c2 = st.columns(2)
+
+    with c1:
+        st.caption("Number of promotions by category — bar chart")
+        if not df_cat.empty:
+            st.bar_chart(df_cat.set_index("PRODUCT_CATEGORY")[["NB_PROMOS"]])
+        else:
+            st.info("No promotion data by category.")
+
+    with c2:
+        st.caption("Average discount by category — bar chart")
+        if not df_cat.empty:
+            # avg_discount is between 0 and 1 in the cleaning rules
+            st.bar_chart(df_cat.set_index("PRODUCT_CATEGORY")[["AVG_DISCOUNT"]])
+        else:
+            st.info("No discount data.")
+
+    st.divider()
+
+    st.caption("Number of promotions by region — bar chart")
+    if not df_region.empty:
+        st.bar_chart(df_region.set_index("REGION")[["NB_PROMOS"]])
+
+    with st.expander("View tables"):
+        st.dataframe(df_cat, use_container_width=True)
+        st.dataframe(df_region, use_container_width=True)
+
+    with st.expander("Promotions (detail)"):
+        paginated_table(
+            "SELECT promotion_id, product_category, promotion_type, discount_percentage, start_date, end_date, region "
+            "FROM SILVER.PROMOTIONS_CLEAN " + _promotions_where(filters),
+            key="promotion_id",
+            name="promotions",
+        )
+
+
+# ------------------------------------------------------------
+# Marketing ROI
+# ------------------------------------------------------------
+def _campaigns_where(filters: Filters, alias="") -> str:
+    return filters.where(
+        period=(f"{alias}start_date", f"{alias}end_date"),
+        region=f"{alias}region",
+        category=f"{alias}product_category",
+    )
+
+
+def roi_queries(filters: Filters) -> dict:
+    return {
+        "roi": f"""
+SELECT
+  campaign_name,
+  region,
+  product_category,
+  budget,
+  reach,
+  conversion_rate,
+  (reach * conversion_rate) AS estimated_conversions,
+  (reach * conversion_rate) / NULLIF(budget, 0) AS roi_proxy
+FROM SILVER.MARKETING_CAMPAIGNS_CLEAN
+{_campaigns_where(filters)}
+ORDER BY roi_proxy DESC
+LIMIT 50;
+""",
+        "campaign_sales": f"""
+WITH sales_daily AS (
+{sales_query({"daily_sales": "amount"}, by=("transaction_date", "region"), transaction_type="Sale", filters=filters)}
+)
+SELECT
+  c.campaign_name,
+  c.region,
+  CAST(SUM(s.daily_sales) AS NUMBER(18,2)) AS sales_during_campaign
+FROM SILVER.MARKETING_CAMPAIGNS_CLEAN c
+LEFT JOIN sales_daily s
+  ON s.region = c.region
+ AND s.transaction_date BETWEEN c.start_date AND c.end_date
+{_campaigns_where(filters, "c.")}
+GROUP BY c.campaign_name, c.region
+ORDER BY sales_during_campaign DESC NULLS LAST
+LIMIT 50;
+""",
+    }
+
+
+def roi_render(data: dict, filters: Filters):
+    df_roi = data["roi"]
+    df_campaign_sales = data["campaign_sales"]
+
+    st.caption("Top campaigns by proxy ROI — bar chart")
+    if not df_roi.empty:
+        st.bar_chart(df_roi.head(20).set_index("CAMPAIGN_NAME")[["ROI_PROXY"]])
+    else:
+        st.info("No campaign data.")
+
+    st.divider()
+
+    st.caption("Top campaign sales during promotion — bar chart")
+    if not df_campaign_sales.empty:
+        st.bar_chart(
+            df_campaign_sales.head(20).set_index("CAMPAIGN_NAME")[["SALES_DURING_CAMPAIGN"]]
+        )
+    else:
+        st.info("No campaign sales data.")
+
+    with st.expander("View tables"):
+        st.dataframe(df_roi, use_container_width=True)
+        st.dataframe(df_campaign_sales, use_container_width=True)
+
+    with st.expander("Campaigns (detail)"):
+        paginated_table(
+            "SELECT campaign_id, campaign_name, campaign_type, product_category, start_date, end_date, region, budget, reach, conversion_rate "
+            "FROM SILVER.MARKETING_CAMPAIGNS_CLEAN " + _campaigns_where(filters),
+            key="campaign_id",
+            name="campaigns",
+        )
+
+
+# ------------------------------------------------------------
+# Customers
+# ------------------------------------------------------------
+def customers_base(filters: Filters) -> str:
+    return f"""
+SELECT
+  region,
+  gender,
+  marital_status,
+  COUNT(*) AS nb_clients,
+  SUM(annual_income) AS sum_income,
+  COUNT(annual_income) AS nb_incomes
+FROM SILVER.CUSTOMER_DEMOGRAPHICS_CLEAN
+{filters.where(region="region")}
+GROUP BY region, gender, marital_status
+"""
+
+
+def customers_queries(filters: Filters) -> dict:
+    return {
+        "region": f"""
+SELECT region, SUM(nb_clients) AS nb_clients, SUM(sum_income) / NULLIF(SUM(nb_incomes), 0) AS avg_income
+FROM {BASE} b
+GROUP BY region
+ORDER BY nb_clients DESC;
+""",
+        "gender": f"""
+SELECT gender, SUM(nb_clients) AS nb_clients
+FROM {BASE} b
+GROUP BY gender
+ORDER BY nb_clients DESC;
+""",
+        "marital": f"""
+SELECT marital_status, SUM(nb_clients) AS nb_clients
+FROM {BASE} b
+GROUP BY marital_status
+ORDER BY nb_clients DESC;
+""",
+        "service": f"""
+SELECT issue_category,
+       AVG(customer_satisfaction) AS avg_satisfaction,
+       COUNT(*) AS nb_interactions
+FROM SILVER.CUSTOMER_SERVICE_INTERACTIONS_CLEAN
+{filters.where(date="interaction_date")}
+GROUP BY issue_category
+ORDER BY avg_satisfaction ASC;
+""",
+        "reviews": f"""
+SELECT product_category,
+       AVG(rating) AS avg_rating,
+       COUNT(*) AS nb_reviews
+FROM SILVER.PRODUCT_REVIEWS_CLEAN
+{filters.where(date="review_date")}
+GROUP BY product_category
+ORDER BY avg_rating DESC;
+""",
+    }
+
+
+def customers_render(data: dict, filters: Filters):
+    df_region = data["region"]
+    df_gender = data["gender"]
+    df_marital = data["marital"]
+    df_service = data["service"]
+    df_reviews = data["reviews"]
+
+    left, right = st.columns(2)
+
+    with left:
+        st.caption("Customers by region — bar chart")
+        if not df_region.empty:
+            st.bar_chart(df_region.set_index("REGION")[["NB_CLIENTS"]])
+
+        st.caption("Customers by gender — bar chart")
+        if not df_gender.empty:
+            st.bar_chart(df_gender.set_index("GENDER")[["NB_CLIENTS"]])
+
+    with right:
+        st.caption("Customers by marital status — bar chart")
+        if not df_marital.empty:
+            st.bar_chart(df_marital.set_index("MARITAL_STATUS")[["NB_CLIENTS"]])
+
+        st.caption("Average satisfaction by issue category — bar chart")
+        if not df_service.empty:
+            st.bar_chart(df_service.set_index("ISSUE_CATEGORY")[["AVG_SATISFACTION"]])
+
+    st.divider()
+
+    st.caption("Product reviews: average rating by category — bar chart")
+    if not df_reviews.empty:
+        st.bar_chart(df_reviews.set_index("PRODUCT_CATEGORY")[["AVG_RATING"]])
+
+    with st.expander("View tables"):
+        st.dataframe(df_region, use_container_width=True)
+        st.dataframe(df_gender, use_container_width=True)
+        st.dataframe(df_marital, use_container_width=True)
+        st.dataframe(df_service, use_container_width=True)
+        st.dataframe(df_reviews, use_container_width=True)
+
+    with st.expander("Customers (detail)"):
+        paginated_table(
+            "SELECT customer_id, gender, region, country, city, marital_status, annual_income "
+            "FROM SILVER.CUSTOMER_DEMOGRAPHICS_CLEAN " + filters.where(region="region"),
+            key="customer_id",
+            name="customers",
+        )
+
+
+# ------------------------------------------------------------
+# Ops & Logistics
+# ------------------------------------------------------------
+def ops_queries(filters: Filters) -> dict:
+    return {
+        "stock_alerts": f"""
+SELECT product_category, COUNT(*) AS nb_stock_alerts
+FROM SILVER.INVENTORY_CLEAN
+WHERE current_stock IS NOT NULL
+  AND reorder_point IS NOT NULL
+  AND current_stock <= reorder_point
+  {filters.where("AND", region="region", category="product_category")}
+GROUP BY product_category
+ORDER BY nb_stock_alerts DESC;
+""",
+        "delivery": f"""
+SELECT status,
+       AVG(DATEDIFF('day', ship_date, estimated_delivery)) AS avg_delivery_days,
+       COUNT(*) AS nb_shipments
+FROM SILVER.LOGISTICS_AND_SHIPPING_CLEAN
+WHERE ship_date IS NOT NULL
+  AND estimated_delivery IS NOT NULL
+  {filters.where("AND", date="ship_date", region="destination_region")}
+GROUP BY status
+ORDER BY avg_delivery_days DESC;
+""",
+    }
+
+
+def ops_render(data: dict, filters: Filters):
+    df_stock_cat = data["stock_alerts"]
+    df_delivery = data["delivery"]
+
+    left, right = st.columns(2)
+
+    with left:
+        st.caption("Stock alerts by category — bar chart")
+        if not df_stock_cat.empty:
+            st.bar_chart(df_stock_cat.set_index("PRODUCT_CATEGORY")[["NB_STOCK_ALERTS"]])
+        else:
+            st.info("No stock alerts detected.")
+
+    with right:
+        st.caption("Average delivery days by status — bar chart")
+        if not df_delivery.empty:
+            st.bar_chart(df_delivery.set_index("STATUS")[["AVG_DELIVERY_DAYS"]])
+        else:
+            st.info("No delivery data.")
+
+    with st.expander("View tables"):
+        st.dataframe(df_stock_cat, use_container_width=True)
+        st.dataframe(df_delivery, use_container_width=True)
+
+    with st.expander("Shipments (detail)"):
+        paginated_table(
+            "SELECT shipment_id, order_id, ship_date, estimated_delivery, shipping_method, status, shipping_cost, destination_region, carrier "
+            "FROM SILVER.LOGISTICS_AND_SHIPPING_CLEAN "
+            + filters.where(date="ship_date", region="destination_region"),
+            key="shipment_id",
+            name="shipments",
+        )
+
+
+# ------------------------------------------------------------
+# Promo Planner (models from ml_models/promo_optimizer.py, see _scoring.py)
+# ------------------------------------------------------------
+PLANNER_DISCOUNTS = [d / 100 for d in range(5, 55, 5)]
+PLANNER_DURATIONS = [7, 14, 21, 30, 45]
+
+
+def planner_queries(filters: Filters) -> dict:
+    return {
+        "baselines": f"""
+SELECT
+    region,
+    MEDIAN(baseline_avg_transaction) AS baseline_avg_transaction,
+    MEDIAN(baseline_daily_transactions) AS baseline_daily_transactions,
+    MEDIAN(baseline_daily_sales) AS baseline_daily_sales,
+    MEDIAN(num_overlapping_campaigns) AS num_overlapping_campaigns
+FROM ANALYTICS.ML_PROMO_EFFECTIVENESS
+WHERE region IS NOT NULL
+{filters.where("AND", region="region")}
+GROUP BY region
+ORDER BY region;
+"""
+    }
+
+
+def _expected_sales(scored: pd.DataFrame) -> pd.Series:
+    return scored["BASELINE_DAILY_SALES"] * scored["DURATION_DAYS"] * (1 + scored["PREDICTED_LIFT"])
+
+
+def planner_render(data: dict, filters: Filters):
+    try:
+        scorer = get_scorer()
+    except FileNotFoundError as exc:
+        st.warning(str(exc))
+        return
+
+    baselines = data["baselines"]
+    baselines = baselines[baselines["REGION"].isin(scorer.categories("REGION"))].reset_index(drop=True)
+    if baselines.empty:
+        st.info("No baseline data: build ANALYTICS.ML_PROMO_EFFECTIVENESS (sql/phase_3/2_ml_feature_tables.sql).")
+        return
+    for column in BASELINE_COLUMNS:
+        baselines[column] = baselines[column].astype(float)
+
+    st.caption("Simulate a promotion — baselines are the region's historical medians")
+    c1, c2, c3 = st.columns(3)
+    category = c1.selectbox("Product category", scorer.categories("PRODUCT_CATEGORY"))
+    promotion_type = c2.selectbox("Promotion type", scorer.categories("PROMOTION_TYPE"))
+    region = c3.selectbox("Region", list(baselines["REGION"]))
+    c1, c2, c3 = st.columns(3)
+    discount = c1.slider("Discount (%)", 5, 50, 20, step=5) / 100
+    duration = c2.slider("Duration (days)", 3, 45, 14)
+    start_date = c3.date_input("Start date", value=date.today())
+
+    single = candidate_grid(
+        baselines[baselines["REGION"] == region], start_date, [category], [promotion_type], [discount], [duration]
+    )
+    single = single.join(scorer.score(single))
+    row = single.iloc[0]
+    k1, k2, k3 = st.columns(3)
+    k1.metric("Success probability", f"{row['SUCCESS_PROBABILITY']:.1%}")
+    k2.metric("Predicted sales lift", f"{row['PREDICTED_LIFT']:+.1%}")
+    k3.metric("Expected sales", fmt_money(_expected_sales(single).iloc[0]))
+
+    st.divider()
+
+    st.caption("Best candidates — every category × type × region × discount × duration for this start date")
+    start = time.perf_counter()
+    grid = candidate_grid(
+        baselines,
+        start_date,
+        scorer.categories("PRODUCT_CATEGORY"),
+        scorer.categories("PROMOTION_TYPE"),
+        PLANNER_DISCOUNTS,
+        PLANNER_DURATIONS,
+    )
+    grid = grid.join(scorer.score(grid))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    grid["EXPECTED_SALES"] = _expected_sales(grid)
+    best = grid.sort_values(["SUCCESS_PROBABILITY", "PREDICTED_LIFT"], ascending=False).head(25)
+    st.dataframe(
+        best[
+            [
+                "REGION",
+                "PRODUCT_CATEGORY",
+                "PROMOTION_TYPE",
+                "DISCOUNT_PERCENTAGE",
+                "DURATION_DAYS",
+                "SUCCESS_PROBABILITY",
+                "PREDICTED_LIFT",
+                "EXPECTED_SALES",
+            ]
+        ],
+        use_container_width=True,
+        hide_index=True,
+    )
+    st.caption(f"{len(grid):,} candidates scored in {elapsed_ms:.0f} ms")
+
+    st.divider()
+
+    st.caption(
+        f"Best trade-offs for {category} in {region} — any type, discount, duration, start month & weekday, "
+        "with or without overlapping campaigns (Pareto front: success probability vs. sales lift)"
+    )
+    start = time.perf_counter()
+    scenarios = ScenarioGrid(scorer, region, category, baselines[baselines["REGION"] == region].iloc[0].to_dict())
+    front = scenarios.optimize()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if len(front) > 1:
+        st.scatter_chart(front, x="SUCCESS_PROBABILITY", y="PREDICTED_LIFT")
+    st.dataframe(front, use_container_width=True, hide_index=True)
+    st.caption(f"{scenarios.size:,} scenarios ({front.attrs['scored']:,} distinct for the models) in {elapsed_ms:.0f} ms")
+
+
+# ------------------------------------------------------------
+# Registry
+# ------------------------------------------------------------
+PAGES = {
+    "overview": Page(
+        "🏠 Overview", "KPIs & visualisations rapides", overview_queries, overview_render, base=overview_base
+    ),
+    "sales": Page("📈 Sales", "Trends & sanity checks", sales_queries, sales_render, base=sales_base),
+    "promotions": Page(
+        "🏷️ Promotions",
+        "Volume & discount",
+        promotions_queries,
+        promotions_render,
+        {"categories": True},
+        base=promotions_base,
+    ),
+    "roi": Page("💰 Marketing ROI", "Campaign analysis (proxy)", roi_queries, roi_render, {"categories": True}),
+    "customers": Page(
+        "👥 Customers",
+        "Descriptive segmentation & customer experience",
+        customers_queries,
+        customers_render,
+        base=customers_base,
+    ),
+    "ops": Page(
+        "🚚 Ops & Logistics", "Stock alerts & delivery performance", ops_queries, ops_render, {"categories": True}
+    ),
+    "planner": Page(
+        "🎯 Promo Planner",
+        "Predict promotion success & sales lift before launch",
+        planner_queries,
+        planner_render,
+        {"dates": False},
+        prewarm=False,  # ML_PROMO_EFFECTIVENESS and the models are optional (phase 3)
+    ),
+}
+
+
+def render_page(key: str, heading=None):
+    """Draw PAGES[key]: heading (st.title by default), sidebar filters, one run_queries() batch, charts."""
+    from _prewarm import start_prewarmer  # imports this module
+
+    start_prewarmer()
+    page = PAGES[key]
+    (heading or st.title)(page.title)
+    st.caption(page.caption)
+    filters = sidebar_filters(**page.filters)
+    base = page.base(filters) if page.base else None
+    page.render(run_queries(page.queries(filters), base=base), filters)
@@ -0,0 +1,62 @@
+import pandas as pd
+import streamlit as st
+
+from _backends import BACKEND
+from _prewarm import start_prewarmer
+from _utils import get_telemetry, pool_stats
+
+# ------------------------------------------------------------
+# Diagnostics view (hidden: Home.py?diagnostics)
+# ------------------------------------------------------------
+# Query telemetry of this Streamlit process: cache hit rates, slowest
+# queries by page, slow-query log and the Prometheus counters.
+
+
+def render():
+    telemetry = get_telemetry()
+    st.title("🩺 Diagnostics")
+    st.caption(
+        f"Queries seen by this process (last {telemetry.history} kept) • "
+        f"slow-query threshold {telemetry.slow_seconds * 1000:.0f} ms"
+    )
+
+    events = pd.DataFrame(telemetry.recent())
+    if events.empty:
+        st.info("No query recorded yet. Open a dashboard page, then come back.")
+        return
+
+    backend = events[events["cache"] == "backend"]
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Queries", f"{len(events):,}")
+    c2.metric("Cache hit rate", f"{(events['cache'] != 'backend').mean():.0%}")
+    c3.metric("Slow queries", f"{len(telemetry.slow()):,}")
+    c4.metric("Backend time", f"{backend['seconds'].sum():.1f} s")
+
+    st.subheader("Top offenders")
+    st.dataframe(pd.DataFrame(telemetry.offenders()), use_container_width=True, hide_index=True)
+
+    st.subheader("Slow queries")
+    slow = pd.DataFrame(telemetry.slow())
+    if slow.empty:
+        st.caption("None above the threshold.")
+    else:
+        st.dataframe(slow.iloc[::-1], use_container_width=True, hide_index=True)
+
+    with st.expander("Recent queries"):
+        st.dataframe(events.iloc[::-1], use_container_width=True, hide_index=True)
+
+    if BACKEND == "snowflake":
+        with st.expander("Connection pool"):
+            st.json(pool_stats())
+
+    with st.expander("Cache pre-warming"):
+        st.json(start_prewarmer().stats())
+
+    with st.expander("Prometheus counters"):
+        text = telemetry.prometheus()
+        st.code(text, language="text")
+        st.download_button("Download metrics", text, file_name="anycompany_metrics.prom")
+
+    if st.button("Reset counters"):
+        telemetry.reset()
+        st.rerun()
@@ -0,0 +1,45 @@
+import streamlit as st
+
+from _utils import run_query, sql_literal
+
+# ------------------------------------------------------------
+# Server-side paginated detail tables
+# ------------------------------------------------------------
+# Only the visible page is fetched and sent to the browser. Pages are read
+# with keyset pagination on a unique column (WHERE key > last key ORDER BY
+# key LIMIT n), so page 500 costs the same as page 1, unlike OFFSET. Every
+# page goes through run_query and is cached like any other query.
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def page_sql(base_sql: str, key: str, page_size: int, after=None) -> str:
+    """SQL of the page that follows key value `after` (first page when None)."""
+    where = "" if after is None else f"WHERE q.{key} > {sql_literal(after)}"
+    return f"SELECT * FROM ({base_sql}) q {where} ORDER BY q.{key} LIMIT {int(page_size)}"
+
+
+def paginated_table(base_sql: str, key: str, name: str, page_size: int = DEFAULT_PAGE_SIZE):
+    """Render `base_sql` one page at a time; `key` must be unique and non-NULL."""
+    state = st.session_state.setdefault(f"paging:{name}", {"starts": [None], "last": None, "sql": base_sql})
+    if state.get("sql") != base_sql:  # filters changed: back to the first page
+        state.update(starts=[None], last=None, sql=base_sql)
+
+    def previous():
+        if len(state["starts"]) > 1:
+            state["starts"].pop()
+
+    def following():
+        if state["last"] is not None:
+            state["starts"].append(state["last"])
+
+    total = int(run_query(f"SELECT COUNT(*) AS n FROM ({base_sql}) q")["N"].iloc[0])
+    df = run_query(page_sql(base_sql, key, page_size, state["starts"][-1]))
+    first = (len(state["starts"]) - 1) * page_size
+    state["last"] = df[key.upper()].iloc[-1] if len(df) and first + len(df) < total else None
+
+    st.dataframe(df, use_container_width=True, hide_index=True)
+    left, middle, right = st.columns([1, 4, 1])
+    left.button("◀ Previous", key=f"{name}:prev", on_click=previous, disabled=len(state["starts"]) == 1)
+    middle.caption(f"Rows {first + 1 if len(df) else 0:,}–{first + len(df):,} of {total:,}")
+    right.button("Next ▶", key=f"{name}:next", on_click=following, disabled=state["last"] is None)
@@ -0,0 +1,198 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from snowflake.connector.errors import DatabaseError
+
+# ------------------------------------------------------------
+# Bounded Snowflake connection pool
+# ------------------------------------------------------------
+
+# Snowflake error codes raised when the session or its token has expired
+SESSION_EXPIRED_ERRNOS = {390111, 390112, 390114}
+
+
+def is_session_expired(exc: Exception) -> bool:
+    return isinstance(exc, DatabaseError) and getattr(exc, "errno", None) in SESSION_EXPIRED_ERRNOS
+
+
+class ConnectionPool:
+    """Thread-safe pool of Snowflake connections shared by all Streamlit sessions.
+
+    `connect` is a zero-argument factory returning a new connection. Idle
+    connections older than `idle_timeout` seconds are closed (the pool never
+    shrinks below `min_size`), and a connection idle for more than
+    `ping_interval` seconds is checked with `SELECT 1` before it is handed out.
+    """
+
+    def __init__(
+        self,
+        connect,
+        min_size=1,
+        max_size=8,
+        idle_timeout=600,
+        ping_interval=60,
+        checkout_timeout=30,
+    ):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"Invalid pool size: min={min_size}, max={max_size}")
+
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.ping_interval = ping_interval
+        self.checkout_timeout = checkout_timeout
+
+        self._cond = threading.Condition()
+        self._idle = deque()  # (conn, last_used)
+        self._size = 0
+        self._metrics = {
+            "checkouts": 0,
+            "wait_time_total": 0.0,
+            "wait_time_max": 0.0,
+            "timeouts": 0,
+            "created": 0,
+            "reconnects": 0,
+            "evicted": 0,
+        }
+
+        for _ in range(min_size):
+            self._idle.append((self._open(), time.monotonic()))
+            self._size += 1
+
+    # -- internals -------------------------------------------------
+    def _open(self):
+        conn = self._connect()
+        with self._cond:
+            self._metrics["created"] += 1
+        return conn
+
+    @staticmethod
+    def _close(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_alive(conn) -> bool:
+        if conn.is_closed():
+            return False
+        cur = conn.cursor()
+        try:
+            cur.execute("SELECT 1")
+            return True
+        except Exception:
+            return False
+        finally:
+            cur.close()
+
+    def _evict_idle(self, now):
+        keep = deque()
+        while self._idle:
+            conn, last_used = self._idle.popleft()
+            if now - last_used > self.idle_timeout and self._size > self.min_size:
+                self._close(conn)
+                self._size -= 1
+                self._metrics["evicted"] += 1
+            else:
+                keep.append((conn, last_used))
+        self._idle = keep
+
+    def _acquire(self):
+        start = time.monotonic()
+        deadline = start + self.checkout_timeout
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._evict_idle(now)
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    conn, last_used = None, now
+                    break
+                remaining = deadline - now
+                if remaining <= 0:
+                    self._metrics["timeouts"] += 1
+                    raise TimeoutError(
+                        f"No Snowflake connection available after {self.checkout_timeout}s "
+                        f"(pool max_size={self.max_size})"
+                    )
+                self._cond.wait(remaining)
+
+            waited = time.monotonic() - start
+            self._metrics["checkouts"] += 1
+            self._metrics["wait_time_total"] += waited
+            self._metrics["wait_time_max"] = max(self._metrics["wait_time_max"], waited)
+
+        # Network work happens outside the lock
+        try:
+            if conn is None:
+                conn = self._open()
+            elif time.monotonic() - last_used > self.ping_interval and not self._is_alive(conn):
+                self._close(conn)
+                conn = self._open()
+                with self._cond:
+                    self._metrics["reconnects"] += 1
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        return conn
+
+    def _release(self, conn, broken=False):
+        with self._cond:
+            if broken or conn.is_closed():
+                self._close(conn)
+                self._size -= 1
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    # -- public API ------------------------------------------------
+    @contextmanager
+    def connection(self):
+        conn = self._acquire()
+        broken = False
+        try:
+            yield conn
+        except Exception as e:
+            broken = is_session_expired(e)
+            raise
+        finally:
+            self._release(conn, broken=broken)
+
+    def run(self, fn):
+        """Call fn(conn) on a pooled connection, retrying once on an expired session."""
+        try:
+            with self.connection() as conn:
+                return fn(conn)
+        except DatabaseError as e:
+            if not is_session_expired(e):
+                raise
+            with self._cond:
+                self._metrics["reconnects"] += 1
+            with self.connection() as conn:
+                return fn(conn)
+
+    def stats(self) -> dict:
+        with self._cond:
+            stats = dict(self._metrics)
+            stats["size"] = self._size
+            stats["idle"] = len(self._idle)
+            stats["in_use"] = self._size - len(self._idle)
+        checkouts = stats["checkouts"]
+        stats["wait_time_avg"] = stats["wait_time_total"] / checkouts if checkouts else 0.0
+        return stats
+
+    def close(self):
+        with self._cond:
+            while self._idle:
+                conn, _ = self._idle.popleft()
+                self._close(conn)
+                self._size -= 1
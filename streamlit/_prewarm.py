@@ -0,0 +1,159 @@
+import argparse
+import logging
+import os
+import threading
+import time
+
+import streamlit as st
+
+from _backends import expand_base
+from _dashboards import PAGES
+from _telemetry import collecting
+from _utils import FILTER_OPTION_QUERIES, Filters, _cache_token, _run_queries_cached, _versions_for
+
+# ------------------------------------------------------------
+# Background cache pre-warming
+# ------------------------------------------------------------
+# A daemon thread replays the query batch of every registered page with
+# Page.prewarm set (default filters, see _dashboards.PAGES) so users hit warm
+# caches:
+#   - a changed table version (SILVER rebuild) is fetched on the next cycle
+#     instead of by the next visitor;
+#   - results of tables without a version are fetched for the next TTL bucket
+#     LEAD seconds before the current one rolls over;
+#   - st.cache_data entries dropped by their own TTL are refilled from disk.
+# A batch already in st.cache_data costs nothing; batches that reach the disk
+# cache or the warehouse are spaced by STAGGER seconds to avoid load spikes.
+# Results land in the shared disk cache, so one warmer serves every process
+# on the machine; it can also run alone: python _prewarm.py [--once].
+
+PREWARM = os.getenv("ANYCOMPANY_PREWARM", "1") != "0"
+INTERVAL = float(os.getenv("ANYCOMPANY_PREWARM_INTERVAL", "60"))
+STAGGER = float(os.getenv("ANYCOMPANY_PREWARM_STAGGER", "2"))
+LEAD = float(os.getenv("ANYCOMPANY_PREWARM_LEAD", "30"))
+HOURS = os.getenv("ANYCOMPANY_PREWARM_HOURS", "")  # e.g. "7-20" (local time); empty = always
+
+log = logging.getLogger("anycompany.prewarm")
+
+
+def _parse_hours(spec: str):
+    if not spec:
+        return None
+    start, end = (int(h) for h in spec.split("-"))
+    return start, end
+
+
+class Prewarmer:
+    def __init__(self, interval=INTERVAL, stagger=STAGGER, lead=LEAD, hours=HOURS):
+        self.interval = interval
+        self.stagger = stagger
+        self.lead = lead
+        self.hours_spec = hours
+        self.hours = _parse_hours(hours)
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stats = {"cycles": 0, "refreshed": 0, "errors": 0, "last_cycle": None, "last_error": None}
+
+    def batches(self) -> dict:
+        """{batch name: (queries, base)} exactly as the pages submit them with no filter selected."""
+        batches = {"filters": (FILTER_OPTION_QUERIES, None)}
+        for key, page in PAGES.items():
+            if not page.prewarm:
+                continue
+            filters = Filters()
+            batches[key] = (page.queries(filters), page.base(filters) if page.base else None)
+        return batches
+
+    def in_hours(self, now=None) -> bool:
+        if self.hours is None:
+            return True
+        start, end = self.hours
+        return start <= time.localtime(now).tm_hour < end
+
+    def warm_once(self) -> int:
+        """One pass over every batch; returns how many were fetched (not already in memory)."""
+        refreshed = errors = 0
+        batches = self.batches()
+        for name, (queries, base) in batches.items():
+            if self._stop.is_set():
+                break
+            expanded = expand_base(queries, base).values()
+            versions = _versions_for(expanded)
+            tokens = [_cache_token(expanded, versions)]
+            ahead = _cache_token(expanded, versions, at=time.time() + self.lead)
+            if ahead != tokens[0]:
+                tokens.append(ahead)
+            for token in tokens:
+                with collecting() as records:
+                    try:
+                        _run_queries_cached(queries, token, base)
+                    except Exception as exc:
+                        errors += 1
+                        log.warning("prewarm %s failed: %s", name, exc)
+                        with self._lock:
+                            self._stats["last_error"] = f"{name}: {exc}"
+                if records:  # _execute ran: the batch was not in st.cache_data
+                    refreshed += 1
+                    self._stop.wait(self.stagger)
+        with self._lock:
+            self._stats["cycles"] += 1
+            self._stats["refreshed"] += refreshed
+            self._stats["errors"] += errors
+            self._stats["last_cycle"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        log.info("prewarm cycle: %d/%d batches fetched, %d errors", refreshed, len(batches), errors)
+        return refreshed
+
+    def run(self):
+        # First pass after one stagger delay: the page that started us is loading its own queries
+        while not self._stop.wait(self.stagger):
+            if self.in_hours():
+                try:
+                    self.warm_once()
+                except Exception:
+                    log.exception("prewarm cycle failed")
+            if self._stop.wait(max(0.0, self.interval - self.stagger)):
+                break
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, name="prewarm", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update(
+            running=self._thread is not None and self._thread.is_alive(),
+            interval_s=self.interval,
+            stagger_s=self.stagger,
+            lead_s=self.lead,
+            hours=self.hours_spec or "always",
+        )
+        return stats
+
+
+@st.cache_resource
+def start_prewarmer() -> Prewarmer:
+    """The process-wide warmer, started on first use unless ANYCOMPANY_PREWARM=0."""
+    prewarmer = Prewarmer()
+    if PREWARM:
+        prewarmer.start()
+    return prewarmer
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-warm the dashboard query caches")
+    parser.add_argument("--once", action="store_true", help="Run one pass and exit")
+    parser.add_argument("--interval", type=float, default=INTERVAL, help="Seconds between passes")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    warmer = Prewarmer(interval=args.interval)
+    if args.once:
+        warmer.warm_once()
+    else:
+        warmer.run()
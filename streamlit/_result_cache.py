@@ -0,0 +1,150 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# ------------------------------------------------------------
+# Persistent query result cache (Parquet files on local disk)
+# ------------------------------------------------------------
+# Second tier behind st.cache_data: survives restarts and is shared by every
+# Streamlit process on the same machine. Files are written atomically
+# (temp file + os.replace), so concurrent writers never expose partial files.
+
+DEFAULT_TTL = 300
+
+# Upper bounds in seconds for results whose source tables have a known
+# LAST_ALTERED version. A changed version invalidates the entry immediately, so
+# these only matter as a safety net; SILVER only changes on batch loads.
+# Tables without a version fall back to DEFAULT_TTL.
+TABLE_TTLS = {
+    "SILVER.FINANCIAL_TRANSACTIONS_CLEAN": 7 * 24 * 3600,
+    "SILVER.PROMOTIONS_CLEAN": 7 * 24 * 3600,
+    "SILVER.MARKETING_CAMPAIGNS_CLEAN": 7 * 24 * 3600,
+    "SILVER.CUSTOMER_DEMOGRAPHICS_CLEAN": 7 * 24 * 3600,
+    "SILVER.CUSTOMER_SERVICE_INTERACTIONS_CLEAN": 7 * 24 * 3600,
+    "SILVER.PRODUCT_REVIEWS_CLEAN": 7 * 24 * 3600,
+    "SILVER.INVENTORY_CLEAN": 24 * 3600,
+    "SILVER.LOGISTICS_AND_SHIPPING_CLEAN": 24 * 3600,
+    "GOLD.SALES_DAILY": 7 * 24 * 3600,
+}
+
+_STRING_COMMENT_OR_SPACE = re.compile(r"('(?:[^']|'')*')|(?:--[^\n]*|\s)+")
+_TABLE_REF = re.compile(r"\b(?:FROM|JOIN)\s+([A-Za-z_][\w$]*(?:\.[A-Za-z_][\w$]*){1,2})", re.I)
+
+
+def normalize_sql(sql: str) -> str:
+    """Drop comments, collapse whitespace and the trailing ';' (string literals are kept as-is)."""
+    sql = _STRING_COMMENT_OR_SPACE.sub(lambda m: m.group(1) or " ", sql)
+    return sql.strip().rstrip(";").strip()
+
+
+def referenced_tables(sql: str) -> list:
+    """Qualified SCHEMA.TABLE names read by a query (upper-cased, sorted)."""
+    return sorted({name.upper() for name in _TABLE_REF.findall(normalize_sql(sql))})
+
+
+class ResultCache:
+    def __init__(self, directory, max_bytes=512 * 1024 * 1024, default_ttl=DEFAULT_TTL, table_ttls=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.table_ttls = TABLE_TTLS if table_ttls is None else table_ttls
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, sql: str, database=None, schema=None) -> str:
+        raw = "\x1f".join([(database or "").upper(), (schema or "").upper(), normalize_sql(sql)])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def ttl(self, sql: str, versions=None) -> float:
+        versions = versions or {}
+        ttls = [
+            self.table_ttls.get(t, self.default_ttl) if t in versions else self.default_ttl
+            for t in referenced_tables(sql)
+        ]
+        return min(ttls) if ttls else self.default_ttl
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".parquet")
+
+    def get(self, key: str, versions=None):
+        """Return the cached pyarrow.Table, or None if missing, expired or built
+        from a different version of one of `versions` ({table: LAST_ALTERED})."""
+        path = self._path(key)
+        try:
+            meta = pq.read_schema(path).metadata or {}
+        except (FileNotFoundError, OSError, pa.ArrowInvalid):
+            return None
+
+        info = json.loads(meta.get(b"anycompany", b"{}"))
+        if time.time() - info.get("created_at", 0) > info.get("ttl", self.default_ttl):
+            self._remove(path)
+            return None
+        stored = info.get("versions", {})
+        if any(stored.get(table) != version for table, version in (versions or {}).items()):
+            self._remove(path)
+            return None
+
+        try:
+            table = pq.read_table(path)
+        except (FileNotFoundError, OSError, pa.ArrowInvalid):
+            return None
+
+        # Touch the file so eviction is least-recently-used, not least-recently-written
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return table.replace_schema_metadata({k: v for k, v in meta.items() if k != b"anycompany"})
+
+    def put(self, key: str, table: pa.Table, ttl: float, versions=None):
+        meta = dict(table.schema.metadata or {})
+        info = {"created_at": time.time(), "ttl": ttl, "versions": versions or {}}
+        meta[b"anycompany"] = json.dumps(info).encode()
+        table = table.replace_schema_metadata(meta)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, self._path(key))
+        finally:
+            self._remove(tmp_path)
+        self._evict()
+
+    def invalidate(self, key: str):
+        self._remove(self._path(key))
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith(".parquet"):
+                self._remove(os.path.join(self.directory, name))
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".parquet"):
+                continue
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(os.path.join(self.directory, name))
+            total -= size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
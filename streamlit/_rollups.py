@@ -0,0 +1,91 @@
+import pandas as pd
+
+from _utils import table_versions
+
+# ------------------------------------------------------------
+# Sales query layer: GOLD rollup when the grain allows it
+# ------------------------------------------------------------
+# Dashboard sales queries are described as (measures, dimensions, filter)
+# and compiled against GOLD.SALES_DAILY (sql/phase_4/1_gold_rollups.sql)
+# whenever every dimension is at day grain or coarser. Otherwise, or while
+# the rollup is missing or older than SILVER, they scan SILVER directly.
+
+SOURCE_TABLE = "SILVER.FINANCIAL_TRANSACTIONS_CLEAN"
+ROLLUP_TABLE = "GOLD.SALES_DAILY"
+
+# name -> SQL expression (identical on both tables)
+DIMENSIONS = {
+    "transaction_date": "transaction_date",
+    "month": "DATE_TRUNC('month', transaction_date)",
+    "region": "region",
+    "transaction_type": "transaction_type",
+}
+
+# kind -> (expression on SILVER, expression on the rollup)
+MEASURES = {
+    "amount": ("SUM(amount)", "SUM(total_amount)"),
+    "count": ("COUNT(*)", "COALESCE(SUM(nb_transactions), 0)"),
+    "sale_amount": (
+        "SUM(IFF(transaction_type='Sale', amount, 0))",
+        "SUM(IFF(transaction_type='Sale', total_amount, 0))",
+    ),
+    "sale_count": (
+        "COUNT_IF(transaction_type='Sale')",
+        "COALESCE(SUM(IFF(transaction_type='Sale', nb_transactions, 0)), 0)",
+    ),
+    "distinct_regions": ("COUNT(DISTINCT region)", "COUNT(DISTINCT region)"),
+}
+
+
+def _version_ns(version: str) -> int:
+    """Epoch nanoseconds of a table version: the Snowflake probe returns them
+    directly, the local build an ISO timestamp with its UTC offset."""
+    if version.isdigit():
+        return int(version)
+    stamp = pd.Timestamp(version)
+    return (stamp if stamp.tzinfo else stamp.tz_localize("UTC")).value
+
+
+def rollup_ready() -> bool:
+    """True when the rollup exists and was built after the last SILVER change."""
+    versions = table_versions(tuple(sorted((ROLLUP_TABLE, SOURCE_TABLE))))
+    rollup, source = versions.get(ROLLUP_TABLE), versions.get(SOURCE_TABLE)
+    if rollup is None:
+        return False
+    return source is None or _version_ns(rollup) >= _version_ns(source)
+
+
+def sales_query(measures: dict, by=(), transaction_type=None, order_by=None, use_rollup=None, filters=None) -> str:
+    """Build an aggregate over sales transactions.
+
+    measures: {output_alias: kind}, kind being a key of MEASURES
+    by: dimension names from DIMENSIONS, returned under the same alias
+    order_by: raw ORDER BY clause using the output aliases, e.g. "total_sales DESC"
+    use_rollup: force the source table; by default the rollup is used when ready
+    filters: _utils.Filters applied on transaction_date and region (both tables have them)
+    """
+    unknown = [d for d in by if d not in DIMENSIONS] + [m for m in measures.values() if m not in MEASURES]
+    if unknown:
+        raise ValueError(f"Unsupported sales dimensions/measures: {unknown}")
+
+    if use_rollup is None:
+        use_rollup = rollup_ready()
+    table = ROLLUP_TABLE if use_rollup else SOURCE_TABLE
+
+    select = [f"{DIMENSIONS[d]} AS {d}" for d in by]
+    select += [f"{MEASURES[kind][1 if use_rollup else 0]} AS {alias}" for alias, kind in measures.items()]
+
+    sql = "SELECT " + ",\n       ".join(select) + f"\nFROM {table}"
+    where = []
+    if transaction_type is not None:
+        value = str(transaction_type).replace("'", "''")
+        where.append(f"transaction_type='{value}'")
+    if filters is not None:
+        where += filters.clauses(date="transaction_date", region="region")
+    if where:
+        sql += "\nWHERE " + "\n  AND ".join(where)
+    if by:
+        sql += "\nGROUP BY " + ", ".join(by)
+    if order_by:
+        sql += f"\nORDER BY {order_by}"
+    return sql
@@ -0,0 +1,228 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from _scoring import PromoScorer
+
+# ------------------------------------------------------------
+# Promo scenario optimizer (Pareto front over a Cartesian grid)
+# ------------------------------------------------------------
+# For one region and product category, every combination of promotion type,
+# discount, duration, start month, start weekday and campaign overlap is laid
+# out as one float32 feature matrix (GradientBoosting trees compare in float32),
+# scored in chunks by PromoScorer's classifier and regressor, and reduced to
+# the Pareto front of success probability vs. predicted SALES_LIFT_RATIO.
+#
+# Pruning (prune=True) is exact: a tree ensemble only sees which side of each
+# split threshold a feature falls on, so values of a dimension that land in
+# the same threshold buckets of both models give identical predictions. Each
+# such class is scored once through its first (smallest) value; the front
+# reports that value and how many grid scenarios it stands for.
+
+CHUNK_ROWS = 250_000
+
+DEFAULT_DISCOUNTS = np.round(np.arange(0.05, 0.5001, 0.01), 2)
+DEFAULT_DURATIONS = np.arange(3, 46)
+DEFAULT_MONTHS = np.arange(1, 13)
+DEFAULT_WEEKDAYS = np.arange(7)  # Snowflake DAYOFWEEK: Sunday = 0
+
+# Grid dimensions -> the model features each one drives
+DIMENSIONS = {
+    "PROMOTION_TYPE": lambda v: {"PROMOTION_TYPE_ENCODED": v},
+    "DISCOUNT_PERCENTAGE": lambda v: {"DISCOUNT_PERCENTAGE": v},
+    "DURATION_DAYS": lambda v: {"DURATION_DAYS": v},
+    "START_MONTH": lambda v: {
+        "START_MONTH": v,
+        "START_QUARTER": (v - 1) // 3 + 1,
+        "IS_HOLIDAY_SEASON": np.isin(v, (11, 12)).astype(float),
+    },
+    "START_DAY_OF_WEEK": lambda v: {
+        "START_DAY_OF_WEEK": v,
+        "STARTS_ON_WEEKEND": np.isin(v, (0, 6)).astype(float),
+    },
+    "NUM_OVERLAPPING_CAMPAIGNS": lambda v: {
+        "NUM_OVERLAPPING_CAMPAIGNS": v,
+        "HAS_CAMPAIGN_OVERLAP": (v > 0).astype(float),
+    },
+}
+
+
+def _splits(model):
+    """(feature indices, thresholds) of every split node of a TreeEnsemble, GradientBoosting* or HistGradientBoosting* model."""
+    if hasattr(model, "splits"):
+        yield model.splits()
+    elif hasattr(model, "estimators_"):
+        for estimator in np.ravel(model.estimators_):
+            tree = estimator.tree_
+            used = tree.feature >= 0
+            yield tree.feature[used], tree.threshold[used]
+    else:
+        for predictors in model._predictors:
+            for predictor in predictors:
+                nodes = predictor.nodes
+                used = nodes["is_leaf"] == 0
+                yield nodes["feature_idx"][used], nodes["num_threshold"][used]
+
+
+def split_thresholds(*models) -> dict:
+    """{feature index: sorted split thresholds} over every tree of the given ensembles."""
+    collected = {}
+    for model in models:
+        for features, thresholds in _splits(model):
+            for feature, threshold in zip(features, thresholds):
+                collected.setdefault(int(feature), set()).add(float(threshold))
+    return {feature: np.array(sorted(values)) for feature, values in collected.items()}
+
+
+def _equivalence_classes(columns: dict, thresholds: dict, features: list) -> np.ndarray:
+    """Class id of each dimension value: equal ids fall in the same bucket of every split."""
+    n = len(next(iter(columns.values())))
+    signature = np.zeros((n, 0), dtype=np.int64)
+    for name, values in columns.items():
+        cuts = thresholds.get(features.index(name))
+        if cuts is None:
+            continue
+        # Trees go left when x <= threshold, comparing the float32 input
+        x = np.asarray(values, dtype=np.float32).astype(np.float64)
+        signature = np.column_stack([signature, np.searchsorted(cuts, x, side="left")])
+    if signature.shape[1] == 0:
+        return np.zeros(n, dtype=np.int64)
+    _, classes = np.unique(signature, axis=0, return_inverse=True)
+    return classes.reshape(-1)
+
+
+def pareto_front(probability: np.ndarray, lift: np.ndarray) -> np.ndarray:
+    """Indices of the non-dominated points (higher is better on both), by decreasing probability.
+
+    Among identical points the first index is kept.
+    """
+    order = np.lexsort((np.arange(len(probability)), -lift, -probability))
+    best_before = np.maximum.accumulate(np.r_[-np.inf, lift[order]])[:-1]
+    return order[lift[order] > best_before]
+
+
+class ScenarioGrid:
+    """Cartesian grid of promotion scenarios for one region and product category."""
+
+    def __init__(self, scorer: PromoScorer, region: str, category: str, baseline: dict, **values):
+        self.scorer = scorer
+        self.region = region
+        self.category = category
+        self.baseline = baseline  # BASELINE_AVG_TRANSACTION / _DAILY_TRANSACTIONS / _DAILY_SALES
+        defaults = {
+            "PROMOTION_TYPE": scorer.categories("PROMOTION_TYPE"),
+            "DISCOUNT_PERCENTAGE": DEFAULT_DISCOUNTS,
+            "DURATION_DAYS": DEFAULT_DURATIONS,
+            "START_MONTH": DEFAULT_MONTHS,
+            "START_DAY_OF_WEEK": DEFAULT_WEEKDAYS,
+            "NUM_OVERLAPPING_CAMPAIGNS": [0, round(baseline.get("NUM_OVERLAPPING_CAMPAIGNS", 0))],
+        }
+        unknown = set(values) - set(defaults)
+        if unknown:
+            raise ValueError(f"Unknown grid dimension(s): {sorted(unknown)}")
+        # Sorted and deduplicated: ties on the front keep the smallest values
+        self.values = {name: np.unique(values.get(name, default)) for name, default in defaults.items()}
+
+    @property
+    def size(self) -> int:
+        return int(np.prod([len(v) for v in self.values.values()]))
+
+    def _encoded(self, name: str, values: np.ndarray) -> np.ndarray:
+        if name == "PROMOTION_TYPE":
+            codes = pd.Index(self.scorer.categories(name)).get_indexer(values.astype(str))
+            if (codes < 0).any():
+                raise ValueError(f"{name}: unknown value(s) {sorted(set(values[codes < 0]))}")
+            return codes.astype(float)
+        return values.astype(float)
+
+    def matrix(self, values: dict) -> np.ndarray:
+        """float32 feature matrix of the full product of `values` (last dimension varies fastest)."""
+        features = self.scorer.features
+        shape = [len(v) for v in values.values()]
+        X = np.empty((int(np.prod(shape)), len(features)), dtype=np.float32)
+
+        fixed = dict(self.baseline)
+        for column, value in (("PRODUCT_CATEGORY", self.category), ("REGION", self.region)):
+            known = self.scorer.categories(column)
+            if value not in known:
+                raise ValueError(f"{column}: unknown value(s) {[value]}")
+            fixed[f"{column}_ENCODED"] = known.index(value)
+        for name, value in fixed.items():
+            if name in features:
+                X[:, features.index(name)] = value
+
+        for axis, (name, dim_values) in enumerate(values.items()):
+            index_shape = [1] * len(shape)
+            index_shape[axis] = shape[axis]
+            for feature, column in DIMENSIONS[name](self._encoded(name, dim_values)).items():
+                X[:, features.index(feature)] = np.broadcast_to(
+                    np.asarray(column, dtype=np.float32).reshape(index_shape), shape
+                ).reshape(-1)
+        return X
+
+    def optimize(self, prune=True, chunk_rows=CHUNK_ROWS) -> pd.DataFrame:
+        """Pareto front of SUCCESS_PROBABILITY vs. PREDICTED_LIFT over the grid."""
+        values, counts = self.values, {name: np.ones(len(v), dtype=np.int64) for name, v in self.values.items()}
+        if prune:
+            thresholds = split_thresholds(self.scorer.classifier, self.scorer.regressor)
+            values, counts = {}, {}
+            for name, dim_values in self.values.items():
+                columns = DIMENSIONS[name](self._encoded(name, dim_values))
+                classes = _equivalence_classes(columns, thresholds, self.scorer.features)
+                _, first, sizes = np.unique(classes, return_index=True, return_counts=True)
+                keep = np.argsort(first)  # values are sorted: the first of a class is its smallest
+                values[name] = dim_values[first[keep]]
+                counts[name] = sizes[keep]
+
+        X = self.matrix(values)
+        probability = np.empty(len(X))
+        lift = np.empty(len(X))
+        positive = list(self.scorer.classifier.classes_).index(1)
+        for start in range(0, len(X), chunk_rows):
+            chunk = pd.DataFrame(X[start : start + chunk_rows], columns=self.scorer.features, copy=False)
+            probability[start : start + len(chunk)] = self.scorer.classifier.predict_proba(chunk)[:, positive]
+            lift[start : start + len(chunk)] = self.scorer.regressor.predict(chunk)
+
+        front = pareto_front(probability, lift)
+        shape = [len(v) for v in values.values()]
+        positions = np.unravel_index(front, shape)
+        out = pd.DataFrame({name: values[name][pos] for name, pos in zip(values, positions)})
+        out["SUCCESS_PROBABILITY"] = probability[front]
+        out["PREDICTED_LIFT"] = lift[front]
+        out["SCENARIOS"] = np.prod([counts[name][pos] for name, pos in zip(values, positions)], axis=0)
+        out.attrs.update(grid_size=self.size, scored=len(X))
+        return out
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pareto-optimal promotions for one region and category")
+    parser.add_argument("--region", default="Europe")
+    parser.add_argument("--category", default="Organic Beverages")
+    parser.add_argument("--baseline-sales", type=float, default=3000.0, help="BASELINE_DAILY_SALES")
+    parser.add_argument("--baseline-transactions", type=float, default=0.7, help="BASELINE_DAILY_TRANSACTIONS")
+    parser.add_argument("--baseline-avg", type=float, default=4300.0, help="BASELINE_AVG_TRANSACTION")
+    parser.add_argument("--overlaps", type=float, default=50, help="typical NUM_OVERLAPPING_CAMPAIGNS")
+    parser.add_argument("--no-prune", action="store_true", help="score every scenario")
+    args = parser.parse_args()
+
+    scorer = PromoScorer()
+    grid = ScenarioGrid(
+        scorer,
+        args.region,
+        args.category,
+        {
+            "BASELINE_AVG_TRANSACTION": args.baseline_avg,
+            "BASELINE_DAILY_TRANSACTIONS": args.baseline_transactions,
+            "BASELINE_DAILY_SALES": args.baseline_sales,
+            "NUM_OVERLAPPING_CAMPAIGNS": args.overlaps,
+        },
+    )
+    start = time.perf_counter()
+    front = grid.optimize(prune=not args.no_prune)
+    print(
+        f"{grid.size:,} scenarios ({front.attrs['scored']:,} scored) → {len(front)} on the front "
+        f"in {time.perf_counter() - start:.2f}s"
+    )
+    print(front.to_string(index=False))
@@ -0,0 +1,220 @@
+import json
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from _trees import TreeEnsemble
+
+# ------------------------------------------------------------
+# Promo scoring (models trained by ml_models/promo_optimizer.py)
+# ------------------------------------------------------------
+# PromoScorer loads the models once per process (get_scorer,
+# st.cache_resource) and scores a whole DataFrame of candidate promotions
+# with one predict_proba() and one predict() call:
+#   - the models are read from the flat exports (promo_classifier.npz,
+#     promo_regressor.npz, label_encoders.json) and evaluated by _trees,
+#     bit-identical to sklearn without importing it; the .pkl files are only
+#     used when the exports are missing (older model directories);
+#   - categoricals are encoded with pandas Index lookups built from the
+#     LabelEncoder classes: same codes as LabelEncoder.transform, vectorized;
+#   - predictions for recently seen feature vectors are kept in an LRU
+#     (CACHE_SIZE rows), so a rerun of the planner only scores new rows.
+
+MODEL_DIR = os.getenv(
+    "ANYCOMPANY_MODEL_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "ml_models", "saved_models"),
+)
+CACHE_SIZE = int(os.getenv("ANYCOMPANY_SCORER_CACHE", "100000"))
+
+CATEGORICAL = ("PRODUCT_CATEGORY", "PROMOTION_TYPE", "REGION")
+
+# promo_optimizer.prepare_features() order, used when a model has no feature_names_in_
+FEATURES = [
+    "PRODUCT_CATEGORY_ENCODED",
+    "DISCOUNT_PERCENTAGE",
+    "PROMOTION_TYPE_ENCODED",
+    "REGION_ENCODED",
+    "DURATION_DAYS",
+    "BASELINE_AVG_TRANSACTION",
+    "BASELINE_DAILY_TRANSACTIONS",
+    "BASELINE_DAILY_SALES",
+    "HAS_CAMPAIGN_OVERLAP",
+    "NUM_OVERLAPPING_CAMPAIGNS",
+    "START_MONTH",
+    "START_QUARTER",
+    "START_DAY_OF_WEEK",
+    "IS_HOLIDAY_SEASON",
+    "STARTS_ON_WEEKEND",
+]
+
+# Per-region context a planned promotion inherits (ML_PROMO_EFFECTIVENESS medians)
+BASELINE_COLUMNS = [
+    "BASELINE_AVG_TRANSACTION",
+    "BASELINE_DAILY_TRANSACTIONS",
+    "BASELINE_DAILY_SALES",
+    "NUM_OVERLAPPING_CAMPAIGNS",
+]
+
+
+def calendar_features(start_dates) -> pd.DataFrame:
+    """START_* columns exactly as 2_ml_feature_tables.sql computes them (DAYOFWEEK: Sunday = 0)."""
+    started = pd.DatetimeIndex(pd.to_datetime(start_dates))
+    day_of_week = (started.dayofweek.to_numpy() + 1) % 7
+    month = started.month.to_numpy()
+    return pd.DataFrame(
+        {
+            "START_MONTH": month,
+            "START_QUARTER": started.quarter.to_numpy(),
+            "START_DAY_OF_WEEK": day_of_week,
+            "IS_HOLIDAY_SEASON": np.isin(month, (11, 12)).astype(int),
+            "STARTS_ON_WEEKEND": np.isin(day_of_week, (0, 6)).astype(int),
+        }
+    )
+
+
+def candidate_grid(baselines: pd.DataFrame, start_date, categories, promotion_types, discounts, durations) -> pd.DataFrame:
+    """Every (region, category, type, discount, duration) combination starting on start_date.
+
+    baselines: one row per region with REGION + BASELINE_COLUMNS.
+    """
+    grid = pd.MultiIndex.from_product(
+        [baselines["REGION"], categories, promotion_types, discounts, durations],
+        names=["REGION", "PRODUCT_CATEGORY", "PROMOTION_TYPE", "DISCOUNT_PERCENTAGE", "DURATION_DAYS"],
+    ).to_frame(index=False)
+    grid = grid.merge(baselines[["REGION"] + BASELINE_COLUMNS], on="REGION", how="left")
+    grid["HAS_CAMPAIGN_OVERLAP"] = (grid["NUM_OVERLAPPING_CAMPAIGNS"] > 0).astype(int)
+    calendar = calendar_features([start_date])
+    for column in calendar.columns:
+        grid[column] = calendar[column].iloc[0]
+    return grid
+
+
+class PromoScorer:
+    """Success probability and sales-lift predictions for batches of promotions.
+
+    Thread-safe: one instance is shared by every Streamlit session.
+    """
+
+    def __init__(self, model_dir=MODEL_DIR, cache_size=CACHE_SIZE):
+        self.model_dir = model_dir
+        self.cache_size = cache_size
+        exported = {
+            "promo_classifier": os.path.join(model_dir, "promo_classifier.npz"),
+            "promo_regressor": os.path.join(model_dir, "promo_regressor.npz"),
+            "label_encoders": os.path.join(model_dir, "label_encoders.json"),
+        }
+        pickled = {name: os.path.join(model_dir, f"{name}.pkl") for name in exported}
+        if all(os.path.exists(p) for p in exported.values()):
+            self.source = "npz"
+        elif all(os.path.exists(p) for p in pickled.values()):
+            self.source = "pickle"
+        else:
+            missing = [p for p in pickled.values() if not os.path.exists(p)]
+            raise FileNotFoundError(
+                f"Missing model file(s): {', '.join(missing)}. "
+                "Train them with: python streamlit/ml_models/promo_optimizer.py"
+            )
+        start = time.perf_counter()
+        if self.source == "npz":
+            self.classifier = TreeEnsemble.load(exported["promo_classifier"])
+            self.regressor = TreeEnsemble.load(exported["promo_regressor"])
+            with open(exported["label_encoders"]) as f:
+                classes = json.load(f)
+        else:
+            with open(pickled["promo_classifier"], "rb") as f:
+                self.classifier = pickle.load(f)
+            with open(pickled["promo_regressor"], "rb") as f:
+                self.regressor = pickle.load(f)
+            with open(pickled["label_encoders"], "rb") as f:
+                classes = {column: encoder.classes_ for column, encoder in pickle.load(f).items()}
+        self.load_seconds = time.perf_counter() - start
+
+        self.features = list(getattr(self.classifier, "feature_names_in_", FEATURES))
+        self._lookups = {column: pd.Index(values) for column, values in classes.items()}
+        self._positive = list(self.classifier.classes_).index(1)
+
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()  # feature vector bytes -> (probability, lift)
+        self._stats = {"rows": 0, "scored": 0, "hits": 0, "calls": 0, "last_ms": None}
+
+    def categories(self, column: str) -> list:
+        """Values the models were trained on (anything else cannot be encoded)."""
+        return list(self._lookups[column])
+
+    def encode(self, frame: pd.DataFrame) -> np.ndarray:
+        """Model input matrix (float64, self.features order); raises ValueError on unseen categories."""
+        columns = []
+        for name in self.features:
+            source = name[: -len("_ENCODED")] if name.endswith("_ENCODED") else None
+            if source in self._lookups:
+                values = frame[source].astype(str)
+                codes = self._lookups[source].get_indexer(values)
+                if (codes < 0).any():
+                    unknown = sorted(set(values[codes < 0]))
+                    raise ValueError(f"{source}: unknown value(s) {unknown}")
+                columns.append(codes)
+            else:
+                columns.append(frame[name].to_numpy(dtype=float))
+        return np.column_stack(columns).astype(float)
+
+    def score(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """SUCCESS_PROBABILITY and PREDICTED_LIFT for each row of frame (same index)."""
+        start = time.perf_counter()
+        X = self.encode(frame)
+        unique, inverse = np.unique(X, axis=0, return_inverse=True)
+        keys = [row.tobytes() for row in unique]
+        probability = np.empty(len(unique))
+        lift = np.empty(len(unique))
+
+        misses = []
+        with self._lock:
+            for i, key in enumerate(keys):
+                hit = self._cache.get(key)
+                if hit is None:
+                    misses.append(i)
+                else:
+                    self._cache.move_to_end(key)
+                    probability[i], lift[i] = hit
+
+        if misses:
+            batch = pd.DataFrame(unique[misses], columns=self.features)
+            probability[misses] = self.classifier.predict_proba(batch)[:, self._positive]
+            lift[misses] = self.regressor.predict(batch)
+            with self._lock:
+                for i in misses:
+                    self._cache[keys[i]] = (probability[i], lift[i])
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        inverse = inverse.reshape(-1)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self._stats["rows"] += len(frame)
+            self._stats["scored"] += len(misses)
+            self._stats["hits"] += len(unique) - len(misses)
+            self._stats["calls"] += 1
+            self._stats["last_ms"] = elapsed_ms
+        return pd.DataFrame(
+            {"SUCCESS_PROBABILITY": probability[inverse], "PREDICTED_LIFT": lift[inverse]},
+            index=frame.index,
+        )
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["cached"] = len(self._cache)
+        stats["load_s"] = self.load_seconds
+        stats["source"] = self.source
+        return stats
+
+
+@st.cache_resource
+def get_scorer() -> PromoScorer:
+    """The process-wide scorer: the models are loaded once, not on every rerun."""
+    return PromoScorer()
@@ -0,0 +1,241 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ------------------------------------------------------------
+# Per-query instrumentation
+# ------------------------------------------------------------
+# Every query that goes through _utils.run_query / run_queries yields one
+# event: calling page, cache tier that answered it (memory = st.cache_data,
+# disk = ResultCache, backend), pool queue wait, execution and fetch time,
+# rows/bytes and the Snowflake query ID. Events are logged as JSON on the
+# "anycompany.queries" logger, aggregated into Prometheus-style counters and
+# kept in a short in-memory history for the Diagnostics view (Home.py?diagnostics).
+
+SLOW_QUERY_SECONDS = float(os.getenv("ANYCOMPANY_SLOW_QUERY_MS", "1000")) / 1000
+SLOW_QUERY_LOG = os.getenv("ANYCOMPANY_SLOW_QUERY_LOG")  # JSON lines file, optional
+QUERY_LOG = os.getenv("ANYCOMPANY_QUERY_LOG")  # "stderr" or a file path, optional
+METRICS_PORT = os.getenv("ANYCOMPANY_METRICS_PORT")  # serves /metrics when set
+HISTORY_SIZE = 2000
+
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+query_log = logging.getLogger("anycompany.queries")
+slow_log = logging.getLogger("anycompany.slow_queries")
+
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+_local = threading.local()
+
+
+def calling_page() -> str:
+    """The app script (Home.py, pages/2_Sales.py...) up the call stack, '-' outside one."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        path = frame.f_code.co_filename
+        if path.startswith(_APP_DIR) and not os.path.basename(path).startswith("_"):
+            return os.path.relpath(path, _APP_DIR)
+        frame = frame.f_back
+    return "-"
+
+
+@contextmanager
+def collecting():
+    """Collect the note() calls made by this thread into {query name: fields}."""
+    previous = getattr(_local, "records", None)
+    _local.records = {}
+    try:
+        yield _local.records
+    finally:
+        _local.records = previous
+
+
+def note(name, **fields):
+    records = getattr(_local, "records", None)
+    if records is not None:
+        records.setdefault(name, {}).update(fields)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+class QueryTelemetry:
+    def __init__(self, slow_seconds=SLOW_QUERY_SECONDS, slow_log_path=SLOW_QUERY_LOG, history=HISTORY_SIZE):
+        self.slow_seconds = slow_seconds
+        self.slow_log_path = slow_log_path
+        self.history = history
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=history)
+        self._slow = deque(maxlen=history)
+        self._counters = defaultdict(float)  # (metric, labels tuple) -> value
+        self._buckets = defaultdict(int)  # (page, le) -> count
+        self._durations = defaultdict(float)  # page -> seconds
+        self._server = None
+
+    # -- recording -------------------------------------------------
+    def record_call(self, page, queries: dict, results, records: dict, seconds: float, error=None):
+        """One event per query of a run_queries call; names without a record came from st.cache_data."""
+        for name, sql in queries.items():
+            event = {
+                "ts": time.time(),
+                "page": page,
+                "name": name,
+                "cache": "memory",
+                "query_id": None,
+                "queue_wait": 0.0,
+                "exec_seconds": 0.0,
+                "fetch_seconds": 0.0,
+                "seconds": seconds / max(1, len(queries)),
+                "rows": None,
+                "bytes": None,
+            }
+            event.update(records.get(name, {}))
+            frame = results.get(name) if results else None
+            if frame is not None and event["rows"] is None:
+                event["rows"] = len(frame)
+                event["bytes"] = int(frame.memory_usage(index=False).sum())
+            if error is not None:
+                event["error"] = error
+            event["sql"] = " ".join(sql.split())[:500]
+            self.record(event)
+
+    def record_stream(self, page, sql: str, seconds: float, rows: int, nbytes: int, error=None):
+        """One event for a whole stream_query() iteration (never cached)."""
+        event = {
+            "ts": time.time(), "page": page, "name": "stream", "cache": "backend", "query_id": None,
+            "queue_wait": 0.0, "exec_seconds": seconds, "fetch_seconds": 0.0, "seconds": seconds,
+            "rows": rows, "bytes": nbytes,
+        }
+        if error is not None:
+            event["error"] = error
+        event["sql"] = " ".join(sql.split())[:500]
+        self.record(event)
+
+    def record(self, event: dict):
+        page, cache = event["page"], event["cache"]
+        slow = event["cache"] != "memory" and event["seconds"] >= self.slow_seconds
+        with self._lock:
+            self._recent.append(event)
+            self._counters[("anycompany_queries_total", (("page", page), ("cache", cache)))] += 1
+            for phase in ("queue_wait", "exec_seconds", "fetch_seconds"):
+                key = ("anycompany_query_seconds_total", (("page", page), ("phase", phase.split("_")[0])))
+                self._counters[key] += event[phase] or 0.0
+            self._counters[("anycompany_query_rows_total", (("page", page),))] += event["rows"] or 0
+            self._counters[("anycompany_query_bytes_total", (("page", page),))] += event["bytes"] or 0
+            if "error" in event:
+                self._counters[("anycompany_query_errors_total", (("page", page),))] += 1
+            for le in DURATION_BUCKETS + ("+Inf",):
+                if le == "+Inf" or event["seconds"] <= le:
+                    self._buckets[(page, le)] += 1
+            self._durations[page] += event["seconds"]
+            if slow:
+                self._slow.append(event)
+                self._counters[("anycompany_slow_queries_total", (("page", page),))] += 1
+
+        message = json.dumps(event, default=str)
+        query_log.info(message)
+        if slow:
+            slow_log.warning(message)
+            if self.slow_log_path:
+                with self._lock, open(self.slow_log_path, "a") as f:
+                    f.write(message + "\n")
+
+    # -- reading ---------------------------------------------------
+    def recent(self) -> list:
+        with self._lock:
+            return list(self._recent)
+
+    def slow(self) -> list:
+        with self._lock:
+            return list(self._slow)
+
+    def offenders(self, limit=20) -> list:
+        """Queries aggregated by (page, name), most total time first."""
+        groups = {}
+        for event in self.recent():
+            g = groups.setdefault(
+                (event["page"], event["name"]),
+                {"page": event["page"], "name": event["name"], "calls": 0, "backend": 0, "disk": 0,
+                 "memory": 0, "errors": 0, "total_s": 0.0, "max_s": 0.0, "queue_s": 0.0, "rows": 0,
+                 "bytes": 0, "last_query_id": None},
+            )
+            g["calls"] += 1
+            g[event["cache"]] += 1
+            g["errors"] += "error" in event
+            g["total_s"] += event["seconds"]
+            g["max_s"] = max(g["max_s"], event["seconds"])
+            g["queue_s"] += event["queue_wait"] or 0.0
+            g["rows"] = event["rows"] if event["rows"] is not None else g["rows"]
+            g["bytes"] = event["bytes"] if event["bytes"] is not None else g["bytes"]
+            g["last_query_id"] = event["query_id"] or g["last_query_id"]
+        for g in groups.values():
+            g["avg_s"] = g["total_s"] / g["calls"]
+            g["hit_rate"] = (g["memory"] + g["disk"]) / g["calls"]
+        return sorted(groups.values(), key=lambda g: g["total_s"], reverse=True)[:limit]
+
+    def prometheus(self) -> str:
+        """Counters in the Prometheus text exposition format."""
+        with self._lock:
+            counters = dict(self._counters)
+            buckets = dict(self._buckets)
+            durations = dict(self._durations)
+        lines, typed = [], set()
+        for (metric, labels), value in sorted(counters.items()):
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} counter")
+                typed.add(metric)
+            rendered = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+            lines.append(f"{metric}{{{rendered}}} {value:g}")
+        if durations:
+            lines.append("# TYPE anycompany_query_duration_seconds histogram")
+        for page, total in sorted(durations.items()):
+            label = f'page="{_escape(page)}"'
+            for le in DURATION_BUCKETS + ("+Inf",):
+                lines.append(f'anycompany_query_duration_seconds_bucket{{{label},le="{le}"}} {buckets.get((page, le), 0)}')
+            lines.append(f"anycompany_query_duration_seconds_sum{{{label}}} {total:g}")
+            lines.append(f"anycompany_query_duration_seconds_count{{{label}}} {buckets.get((page, '+Inf'), 0)}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._recent.clear()
+            self._slow.clear()
+            self._counters.clear()
+            self._buckets.clear()
+            self._durations.clear()
+
+    # -- export ----------------------------------------------------
+    def serve(self, port: int):
+        """Serve prometheus() on http://0.0.0.0:<port>/metrics from a daemon thread."""
+        telemetry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = telemetry.prometheus().encode()
+                self.send_response(200 if self.path.startswith("/metrics") else 404)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("0.0.0.0", port), Handler)
+        threading.Thread(target=self._server.serve_forever, name="metrics", daemon=True).start()
+
+
+def configure_query_log(target=QUERY_LOG):
+    """Send the JSON query events to stderr or a file (they only propagate to the root logger otherwise)."""
+    if not target or query_log.handlers:
+        return
+    handler = logging.StreamHandler() if target == "stderr" else logging.FileHandler(target)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    query_log.addHandler(handler)
+    query_log.setLevel(logging.INFO)
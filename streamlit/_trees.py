@@ -0,0 +1,163 @@
+import math
+
+import numpy as np
+
+# ------------------------------------------------------------
+# Flat tree-ensemble evaluator (no sklearn)
+# ------------------------------------------------------------
+# Reads the .npz files written by ml_models/promo_optimizer.py
+# (flatten_tree_ensemble: one set of node arrays for all the trees) and
+# predicts in NumPy only, QuickScorer style:
+#   - a tree's leaves are numbered left to right; a split that fails
+#     (x > threshold) rules out every leaf of its left subtree, and the leaf
+#     reached is the leftmost one left standing;
+#   - per feature, the split thresholds cut the axis into buckets, and
+#     _tables() precomputes the (bucket × tree) bitmask of surviving leaves,
+#     so a batch costs one searchsorted() and one row gather + AND per used
+#     feature instead of a node walk per row, tree and level;
+#   - leaf values are added tree by tree after the init score, the order
+#     sklearn uses, and inputs are compared in the model's own dtype, so
+#     decision_function() / predict() are bit-identical to the estimator;
+#   - probabilities use libm exp (math.exp) like scipy's expit; NumPy's
+#     vectorized exp can differ in the last bit.
+# Trees with more than 64 leaves do not fit a mask: they are walked level by
+# level instead (same results, slower).
+
+BATCH_ROWS = 16_384  # rows per batch: bounds the (rows × trees) work arrays
+MAX_MASK_LEAVES = 64
+
+# Index of the lowest set bit of every uint8 mask
+LOWEST_BIT = np.array([0] + [(m & -m).bit_length() - 1 for m in range(1, 256)])
+
+
+class TreeEnsemble:
+    """Binary classifier or regressor loaded from flat node arrays."""
+
+    def __init__(self, arrays: dict):
+        if int(arrays["format_version"]) != 1:
+            raise ValueError(f"Unsupported model format {arrays['format_version']}")
+        self.kind = str(arrays["kind"])
+        self.classes_ = arrays["classes"]
+        self.feature_names_in_ = arrays["feature_names"]
+        self.n_features_in_ = len(self.feature_names_in_)
+        self.init = float(arrays["init"])
+        self.depth = int(arrays["depth"])
+        self.roots = arrays["roots"]
+        self.feature = arrays["feature"]
+        self.threshold = arrays["threshold"]
+        self.left = arrays["left"]
+        self.right = arrays["right"]
+        self.value = arrays["value"]
+        self.missing_left = arrays["missing_left"]
+        self.allow_nan = bool(arrays["allow_nan"])
+        self._dtype = np.dtype(str(arrays["compare_dtype"]))
+        self._internal = self.left != np.arange(len(self.left))
+        self._leaf_values, self._masks = self._tables()
+        # uint8 masks: the value reached for each of the 256 possible masks, per tree
+        self._exit_values = None
+        if self._masks is not None and self._leaf_values.shape[1] == 8:
+            self._exit_values = self._leaf_values[:, LOWEST_BIT]
+
+    @classmethod
+    def load(cls, path: str) -> "TreeEnsemble":
+        with np.load(path, allow_pickle=False) as data:
+            return cls({name: data[name] for name in data.files})
+
+    def splits(self):
+        """(feature, threshold) of every split node."""
+        return self.feature[self._internal], self.threshold[self._internal]
+
+    def _tables(self):
+        """(trees × leaves) leaf values and {feature: (thresholds, bucket × tree masks)}, or (None, None)."""
+        leaves, left_masks = [], {}  # left_masks: split node -> (tree, bits of its left subtree's leaves)
+        for tree, root in enumerate(self.roots):
+            order = []
+
+            def visit(node):
+                if not self._internal[node]:
+                    order.append(node)
+                    return 1 << (len(order) - 1)
+                left = visit(self.left[node])
+                left_masks[node] = (tree, left)
+                return left | visit(self.right[node])
+
+            visit(root)
+            if len(order) > MAX_MASK_LEAVES:
+                return None, None
+            leaves.append(order)
+
+        width = max(len(order) for order in leaves)
+        mask_dtype = np.dtype(f"uint{next(bits for bits in (8, 16, 32, 64) if width <= bits)}")
+        self._mask_dtype = mask_dtype
+        leaf_values = np.zeros((len(leaves), 8 * mask_dtype.itemsize))  # one column per mask bit
+        for tree, order in enumerate(leaves):
+            leaf_values[tree, : len(order)] = self.value[order]
+
+        masks = {}
+        everything = np.iinfo(mask_dtype).max
+        for feature in np.unique(self.feature[self._internal]):
+            nodes = [node for node in left_masks if self.feature[node] == feature]
+            cuts = np.unique(self.threshold[nodes])
+            # buckets: 0..len(cuts) = number of thresholds below x, last row = NaN
+            table = np.full((len(cuts) + 2, len(leaves)), everything, dtype=mask_dtype)
+            for node in nodes:
+                tree, bits = left_masks[node]
+                below = np.searchsorted(cuts, self.threshold[node])
+                table[below + 1 : len(cuts) + 1, tree] &= mask_dtype.type(~bits & everything)
+                if not self.missing_left[node]:
+                    table[-1, tree] &= mask_dtype.type(~bits & everything)
+            masks[int(feature)] = (cuts, table)
+        return leaf_values, masks
+
+    def _leaves(self, X: np.ndarray):
+        """Values of the leaves reached, tree by tree (rows each), from the bucket masks."""
+        if not self._masks:  # no split at all: every tree is a single leaf
+            return np.repeat(self._leaf_values[:, :1], len(X), axis=1)
+        alive = np.full((len(X), len(self._leaf_values)), np.iinfo(self._mask_dtype).max, dtype=self._mask_dtype)
+        for feature, (cuts, table) in self._masks.items():
+            x = X[:, feature].astype(np.float64)
+            buckets = np.searchsorted(cuts, x, side="left")
+            buckets[np.isnan(x)] = len(cuts) + 1
+            if (buckets == buckets[0]).all():  # constant column (fixed context): one row for the batch
+                buckets = buckets[:1]
+            alive &= table[buckets]
+        alive = np.ascontiguousarray(alive.T)
+        if self._exit_values is not None:
+            return map(np.take, self._exit_values, alive)
+        lowest = (alive & (~alive + alive.dtype.type(1))).astype(np.float64)
+        return map(np.take, self._leaf_values, np.frexp(lowest)[1] - 1)
+
+    def _walk(self, X: np.ndarray) -> np.ndarray:
+        """Values of the leaves reached, tree by tree (rows each), following the nodes level by level."""
+        rows = np.arange(len(X))
+        nodes = np.repeat(self.roots[:, None], len(X), axis=1)
+        for _ in range(self.depth):
+            x = X[rows, self.feature[nodes]]
+            go_left = (x <= self.threshold[nodes]) | (np.isnan(x) & self.missing_left[nodes])
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return self.value[nodes]
+
+    def decision_function(self, X) -> np.ndarray:
+        """Raw scores (log-odds for the classifier)."""
+        X = np.asarray(X, dtype=self._dtype)
+        if not self.allow_nan and np.isnan(X).any():
+            raise ValueError("Input X contains NaN")
+        out = np.empty(len(X))
+        for start in range(0, len(X), BATCH_ROWS):
+            batch = X[start : start + BATCH_ROWS]
+            values = self._walk(batch) if self._masks is None else self._leaves(batch)
+            total = np.full(len(batch), self.init)
+            for tree_values in values:  # ((init + tree 0) + tree 1) + ...
+                total += tree_values
+            out[start : start + len(batch)] = total
+        return out
+
+    def predict_proba(self, X) -> np.ndarray:
+        raw = self.decision_function(X)
+        positive = 1.0 / (1.0 + np.fromiter(map(math.exp, (-raw).tolist()), dtype=float, count=len(raw)))
+        return np.column_stack([1.0 - positive, positive])
+
+    def predict(self, X) -> np.ndarray:
+        if self.kind == "classifier":
+            return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+        return self.decision_function(X)
@@ -1,12 +1,25 @@
+import datetime
 import os
+import time
+from dataclasses import dataclass
+
 import streamlit as st
 import pandas as pd
 import snowflake.connector
 
+from _arrow import to_frame
+from _backends import BACKEND, DuckDBBackend, SnowflakeBackend, SnowparkBackend, expand_base
+from _pool import ConnectionPool
+from _result_cache import DEFAULT_TTL, ResultCache, referenced_tables
+from _telemetry import METRICS_PORT, QueryTelemetry, calling_page, collecting, configure_query_log, note
+
 # ------------------------------------------------------------
 # Snowflake connection configuration
 # ------------------------------------------------------------
 
+# How long a table's LAST_ALTERED is trusted before being probed again
+VERSION_PROBE_TTL = int(os.getenv("ANYCOMPANY_VERSION_PROBE_TTL", "60"))
+
 
 def load_snowflake_config():
     if "snowflake" in st.secrets:
@@ -32,8 +45,7 @@ def load_snowflake_config():
     )
 
 
-@st.cache_resource
-def get_conn():
+def _connect():
     cfg = load_snowflake_config()
     conn = snowflake.connector.connect(
         account=cfg["account"],
@@ -47,18 +59,366 @@ def get_conn():
     return conn
 
 
+def load_pool_config():
+    return {
+        "min_size": int(os.getenv("SNOWFLAKE_POOL_MIN_SIZE", "1")),
+        "max_size": int(os.getenv("SNOWFLAKE_POOL_MAX_SIZE", "8")),
+        "idle_timeout": float(os.getenv("SNOWFLAKE_POOL_IDLE_TIMEOUT", "600")),
+        "ping_interval": float(os.getenv("SNOWFLAKE_POOL_PING_INTERVAL", "60")),
+        "checkout_timeout": float(os.getenv("SNOWFLAKE_POOL_CHECKOUT_TIMEOUT", "30")),
+    }
+
+
+@st.cache_resource
+def get_pool() -> ConnectionPool:
+    return ConnectionPool(_connect, **load_pool_config())
+
+
+def pool_stats() -> dict:
+    return get_pool().stats()
+
+
+@st.cache_resource
+def get_result_cache():
+    # Off by default inside Snowflake, where the app container is short-lived
+    if os.getenv("ANYCOMPANY_DISK_CACHE", "0" if BACKEND == "snowpark" else "1") == "0":
+        return None
+    directory = os.getenv(
+        "ANYCOMPANY_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "anycompany", "query_results"),
+    )
+    max_mb = float(os.getenv("ANYCOMPANY_CACHE_MAX_MB", "512"))
+    return ResultCache(directory, max_bytes=int(max_mb * 1024 * 1024))
+
+
+@st.cache_resource
+def get_telemetry() -> QueryTelemetry:
+    configure_query_log()
+    telemetry = QueryTelemetry()
+    if METRICS_PORT:
+        telemetry.serve(int(METRICS_PORT))
+    return telemetry
+
+
+@st.cache_resource
+def get_backend():
+    if BACKEND == "duckdb":
+        return DuckDBBackend(os.getenv("ANYCOMPANY_DUCKDB_PATH"))
+    if BACKEND == "snowpark":
+        from snowflake.snowpark.context import get_active_session
+
+        return SnowparkBackend(get_active_session())
+    cfg = load_snowflake_config()
+    return SnowflakeBackend(get_pool(), cfg.get("database"), cfg.get("schema"))
+
+
 # ------------------------------------------------------------
 # Helper SQL
 # ------------------------------------------------------------
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=VERSION_PROBE_TTL, show_spinner=False)
+def table_versions(tables: tuple) -> dict:
+    """LAST_ALTERED of each SCHEMA.TABLE, fetched in one INFORMATION_SCHEMA probe.
+
+    Tables missing from the result (or all of them if the probe fails) are
+    simply absent, and queries reading them fall back to time-based expiry.
+    """
+    if not tables:
+        return {}
+    try:
+        return get_backend().table_versions(tables)
+    except Exception:
+        return {}
+
+
+def _cache_token(sql_list, versions: dict, at=None) -> tuple:
+    # Identifies the data a set of queries would read: a table version when
+    # known, otherwise the DEFAULT_TTL time bucket of `at` (now by default)
+    bucket = int((time.time() if at is None else at) // DEFAULT_TTL)
+    tables = sorted({t for sql in sql_list for t in referenced_tables(sql)})
+    return tuple((t, versions.get(t, f"ttl:{bucket}")) for t in tables)
+
+
+def _execute(queries: dict, versions: dict, base=None) -> dict:
+    """Serve queries from the on-disk cache and send only the misses to the backend."""
+    cache = get_result_cache()
+    expanded = expand_base(queries, base)  # cache keys and TTLs use the full SQL
+    tables, keys, query_versions = {}, {}, {}
+    if cache is not None:
+        database, schema = get_backend().namespace
+        for name, sql in expanded.items():
+            keys[name] = cache.key(sql, database, schema)
+            query_versions[name] = {
+                t: versions[t] for t in referenced_tables(sql) if t in versions
+            }
+            start = time.perf_counter()
+            table = cache.get(keys[name], query_versions[name])
+            if table is not None:
+                tables[name] = table
+                note(name, cache="disk", fetch_seconds=time.perf_counter() - start)
+
+    misses = {name: sql for name, sql in queries.items() if name not in tables}
+    if misses:
+        stats = {}
+        fetched = get_backend().run(misses, stats=stats, base=base)
+        for name, table in fetched.items():
+            if cache is not None:
+                ttl = cache.ttl(expanded[name], query_versions[name])
+                cache.put(keys[name], table, ttl, query_versions[name])
+            tables[name] = table
+            note(name, cache="backend", **stats.get(name, {}))
+
+    frames = {}
+    for name in queries:
+        start = time.perf_counter()
+        frames[name] = to_frame(tables[name])
+        note(name, rows=tables[name].num_rows, bytes=tables[name].nbytes, to_pandas_seconds=time.perf_counter() - start)
+    return frames
+
+
+# Results are keyed by the versions of the tables they read, so they never go
+# stale; the TTL only bounds how long superseded entries occupy memory.
+@st.cache_data(ttl=24 * 3600, max_entries=512, show_spinner=False)
+def _run_queries_cached(queries: dict, token: tuple, base=None) -> dict:
+    versions = {t: v for t, v in token if not v.startswith("ttl:")}
+    return _execute(queries, versions, base)
+
+
+def _versions_for(sql_list) -> dict:
+    tables = tuple(sorted({t for sql in sql_list for t in referenced_tables(sql)}))
+    return table_versions(tables)
+
+
+def _run_instrumented(queries: dict, base=None) -> dict:
+    # One telemetry event per query (see _telemetry); names _execute did not
+    # note were answered by st.cache_data without running it
+    page, start = calling_page(), time.perf_counter()
+    expanded = expand_base(queries, base)
+    with collecting() as records:
+        try:
+            token = _cache_token(expanded.values(), _versions_for(expanded.values()))
+            results = _run_queries_cached(queries, token, base)
+        except Exception as exc:
+            get_telemetry().record_call(page, expanded, None, records, time.perf_counter() - start, error=str(exc))
+            raise
+    seconds = time.perf_counter() - start
+    for name, fields in records.items():
+        fields["seconds"] = sum(
+            fields.get(k) or 0.0 for k in ("queue_wait", "exec_seconds", "fetch_seconds", "to_pandas_seconds")
+        )
+    get_telemetry().record_call(page, expanded, results, records, seconds)
+    return results
+
+
 def run_query(sql: str) -> pd.DataFrame:
-    conn = get_conn()
-    cur = conn.cursor()
+    return _run_instrumented({"result": sql})["result"]
+
+
+def run_queries(queries: dict, base: str = None) -> dict:
+    """Run a page's queries concurrently and return {name: DataFrame}.
+
+    Every statement is submitted with execute_async first, so Snowflake works on
+    all of them at once; results are then collected by query ID. Page latency
+    is roughly the slowest query instead of the sum of all round-trips.
+    Results are re-fetched only when the LAST_ALTERED of a table they read
+    changes (checked with one INFORMATION_SCHEMA probe per page).
+    With ANYCOMPANY_BACKEND=duckdb the same queries run on the local build.
+    Every query is recorded by the telemetry (Home.py?diagnostics).
+
+    `base`: SQL of an aggregate the queries read as $BASE (_backends.BASE).
+    It is inlined as a subquery, or materialized once with cache_result()
+    on the Snowpark backend (ANYCOMPANY_SNOWPARK_PUSHDOWN).
+    """
+    return _run_instrumented(queries, base)
+
+
+def stream_query(sql: str, batch_rows: int = 50_000):
+    """Yield the result of `sql` as DataFrames of at most `batch_rows` rows.
+
+    For detail extracts too large for one DataFrame: batches come straight
+    from the backend (Arrow batches, no st.cache_data / disk cache), so peak
+    memory is one batch whatever the table size. Categorical columns are
+    built per batch, so their categories can differ between batches.
+    """
+    page, start = calling_page(), time.perf_counter()
+    rows = nbytes = 0
+    error = None
     try:
-        cur.execute(sql)
-        return cur.fetch_pandas_all()
+        for table in get_backend().stream(sql, batch_rows):
+            rows, nbytes = rows + table.num_rows, nbytes + table.nbytes
+            yield to_frame(table)
+    except Exception as exc:
+        error = str(exc)
+        raise
     finally:
-        cur.close()
+        get_telemetry().record_stream(page, sql, time.perf_counter() - start, rows, nbytes, error)
+
+
+# ------------------------------------------------------------
+# Dashboard filters (pushed down to the warehouse)
+# ------------------------------------------------------------
+# Sidebar selections become WHERE clauses of the dashboard SQL, so filtered
+# views only transfer matching rows. Values are normalized (sorted, deduped,
+# "everything selected" == no filter) and rendered as typed, escaped
+# literals: equal selections always produce the same SQL text, hence the same
+# st.cache_data / disk cache / Snowflake result cache entry for every user.
+
+FILTER_STATE_KEY = "filters"
+
+
+def sql_literal(value) -> str:
+    """Escaped SQL literal of a filter or key value (DATE '...' for dates, TIMESTAMP '...' for datetimes)."""
+    if hasattr(value, "item") and not isinstance(value, datetime.date):
+        value = pd.Timestamp(value) if str(getattr(value, "dtype", "")).startswith("datetime64") else value.item()
+    if isinstance(value, datetime.datetime):
+        return f"TIMESTAMP '{value.isoformat(sep=' ')}'"
+    if isinstance(value, datetime.date):
+        return f"DATE '{value.isoformat()}'"
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return repr(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _as_date(value):
+    if value is None:
+        return None
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return pd.Timestamp(value).date()
+
+
+@dataclass(frozen=True)
+class Filters:
+    """A normalized sidebar selection; empty fields do not filter."""
+
+    start: datetime.date = None
+    end: datetime.date = None
+    regions: tuple = ()
+    categories: tuple = ()
+
+    @classmethod
+    def of(cls, start=None, end=None, regions=(), categories=()):
+        return cls(
+            _as_date(start),
+            _as_date(end),
+            tuple(sorted({str(r) for r in regions or ()})),
+            tuple(sorted({str(c) for c in categories or ()})),
+        )
+
+    def clauses(self, date=None, period=None, region=None, category=None) -> list:
+        """Predicates on the given columns.
+
+        date: a date column within [start, end]
+        period: (start column, end column) of rows whose period overlaps [start, end]
+        region / category: columns matched against the selected values
+        """
+        out = []
+        if date:
+            if self.start:
+                out.append(f"{date} >= {sql_literal(self.start)}")
+            if self.end:
+                out.append(f"{date} <= {sql_literal(self.end)}")
+        if period:
+            first, last = period
+            if self.start:
+                out.append(f"{last} >= {sql_literal(self.start)}")
+            if self.end:
+                out.append(f"{first} <= {sql_literal(self.end)}")
+        if region and self.regions:
+            out.append(f"{region} IN ({', '.join(map(sql_literal, self.regions))})")
+        if category and self.categories:
+            out.append(f"{category} IN ({', '.join(map(sql_literal, self.categories))})")
+        return out
+
+    def where(self, keyword="WHERE", **columns) -> str:
+        """`keyword` + the clauses() joined with AND, or "" when nothing applies.
+
+        Use keyword="AND" to extend a query that already has a WHERE.
+        """
+        clauses = self.clauses(**columns)
+        return f"{keyword} " + "\n  AND ".join(clauses) if clauses else ""
+
+
+FILTER_OPTION_QUERIES = {
+    "regions": """
+SELECT DISTINCT region FROM SILVER.FINANCIAL_TRANSACTIONS_CLEAN
+WHERE region IS NOT NULL ORDER BY region;
+""",
+    "categories": """
+SELECT DISTINCT product_category FROM SILVER.PROMOTIONS_CLEAN
+WHERE product_category IS NOT NULL ORDER BY product_category;
+""",
+    "dates": """
+SELECT MIN(transaction_date) AS first_date, MAX(transaction_date) AS last_date
+FROM SILVER.FINANCIAL_TRANSACTIONS_CLEAN;
+""",
+}
+
+
+def filter_options() -> dict:
+    """Values offered by the sidebar: regions, categories and the sales date range."""
+    data = run_queries(FILTER_OPTION_QUERIES)
+    dates = data["dates"]
+    first = dates["FIRST_DATE"].iloc[0] if not dates.empty else None
+    last = dates["LAST_DATE"].iloc[0] if not dates.empty else None
+    return {
+        "regions": [str(r) for r in data["regions"]["REGION"]],
+        "categories": [str(c) for c in data["categories"]["PRODUCT_CATEGORY"]],
+        "first_date": None if pd.isna(first) else _as_date(first),
+        "last_date": None if pd.isna(last) else _as_date(last),
+    }
+
+
+def sidebar_filters(dates=True, regions=True, categories=False) -> Filters:
+    """Render the filter widgets in the sidebar and return the selection.
+
+    The selection is kept in st.session_state, so it follows the user from
+    page to page; a page only applies the filters it shows.
+    """
+    options = filter_options()
+    saved = st.session_state.get(FILTER_STATE_KEY, Filters())
+    start, end, region_values, category_values = saved.start, saved.end, saved.regions, saved.categories
+    first, last = options["first_date"], options["last_date"]
+
+    with st.sidebar:
+        st.header("Filters")
+        if dates and first and last:
+            picked = st.date_input(
+                "Period",
+                value=(max(start or first, first), min(end or last, last)),
+                min_value=first,
+                max_value=last,
+            )
+            if isinstance(picked, (tuple, list)) and len(picked) == 2:  # one date while picking the range
+                start = None if picked[0] <= first else picked[0]
+                end = None if picked[1] >= last else picked[1]
+        if regions and options["regions"]:
+            region_values = st.multiselect(
+                "Regions",
+                options["regions"],
+                default=[r for r in region_values if r in options["regions"]],
+                placeholder="All regions",
+            )
+            if set(region_values) >= set(options["regions"]):
+                region_values = ()
+        if categories and options["categories"]:
+            category_values = st.multiselect(
+                "Product categories",
+                options["categories"],
+                default=[c for c in category_values if c in options["categories"]],
+                placeholder="All categories",
+            )
+            if set(category_values) >= set(options["categories"]):
+                category_values = ()
+
+    st.session_state[FILTER_STATE_KEY] = Filters.of(start, end, region_values, category_values)
+    return Filters.of(
+        start if dates else None,
+        end if dates else None,
+        region_values if regions else (),
+        category_values if categories else (),
+    )
 
 
 # ------------------------------------------------------------
@@ -7,15 +7,100 @@ Created: 2026-01-31
 import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.ensemble import GradientBoostingClassifier, GradientBoostingRegressor
+from sklearn.ensemble import (
+    GradientBoostingClassifier,
+    GradientBoostingRegressor,
+    HistGradientBoostingClassifier,
+    HistGradientBoostingRegressor,
+)
 from sklearn.preprocessing import LabelEncoder
 from sklearn.metrics import classification_report, mean_absolute_error, r2_score
+from concurrent.futures import ThreadPoolExecutor
+from scipy.stats import loguniform
+import argparse
+import json
 import pickle
 import sys
 import os
+import time
 import snowflake.connector
 import toml
 
+MODEL_DIR = os.path.join(os.path.dirname(__file__), "saved_models")
+
+# Workers for the cross-validation folds (-1 = all cores)
+N_JOBS = int(os.getenv("ANYCOMPANY_TRAIN_JOBS", "-1"))
+
+# Model families: "gb" is the original GradientBoosting*, "hist" the histogram-based
+# HistGradientBoosting* (multi-threaded, stops once the validation score stalls)
+BACKENDS = {
+    "gb": (
+        GradientBoostingClassifier,
+        GradientBoostingRegressor,
+        dict(n_estimators=100, learning_rate=0.1, max_depth=4, random_state=42),
+    ),
+    "hist": (
+        HistGradientBoostingClassifier,
+        HistGradientBoostingRegressor,
+        dict(
+            max_iter=500,
+            learning_rate=0.1,
+            max_depth=4,
+            early_stopping=True,
+            validation_fraction=0.1,
+            n_iter_no_change=10,
+            random_state=42,
+        ),
+    ),
+}
+
+
+# --tune: successive halving over the boosting iterations (the "resource"), so
+# weak configurations are dropped after a few trees; search space per backend
+TUNING_SPACES = {
+    "gb": (
+        "n_estimators",
+        dict(
+            learning_rate=loguniform(0.01, 0.3),
+            max_depth=[2, 3, 4, 5, 6],
+            min_samples_leaf=[1, 5, 10, 20, 50],
+            subsample=[0.6, 0.8, 1.0],
+            max_features=[None, "sqrt", 0.5],
+        ),
+    ),
+    "hist": (
+        "max_iter",
+        dict(
+            learning_rate=loguniform(0.01, 0.3),
+            max_depth=[3, 4, 5, 6, 8, None],
+            max_leaf_nodes=[15, 31, 63],
+            min_samples_leaf=[5, 10, 20, 50],
+            l2_regularization=loguniform(1e-4, 10),
+        ),
+    ),
+}
+TUNING_SCORING = {"classifier": "accuracy", "regressor": "r2"}  # same metrics as the training report
+TUNED_PARAMS_FILE = "best_params.json"
+LEADERBOARD_FILE = "tuning_leaderboard.csv"
+
+
+def make_model(kind, backend="gb", params=None):
+    """New unfitted model; kind is "classifier" or "regressor", params override the defaults."""
+    classifier, regressor, defaults = BACKENDS[backend]
+    return (classifier if kind == "classifier" else regressor)(**{**defaults, **(params or {})})
+
+
+def print_feature_importance(model, columns, log=print):
+    # HistGradientBoosting* has no impurity-based importances
+    if not hasattr(model, "feature_importances_"):
+        return
+    feature_importance = pd.DataFrame(
+        {"feature": columns, "importance": model.feature_importances_}
+    ).sort_values("importance", ascending=False)
+
+    log("\nTop 5 Most Important Features:")
+    log(feature_importance.head())
+
 
 def load_snowflake_config():
     if (
@@ -67,6 +152,17 @@ def get_snowflake_connection():
 
 def run_query_standalone(query):
     """Run query without Streamlit caching"""
+    if os.getenv("ANYCOMPANY_BACKEND", "snowflake").lower() == "duckdb":
+        # Local DuckDB build (python -m pipeline local-build)
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+        from pipeline.local_engine import LocalEngine
+
+        engine = LocalEngine()
+        try:
+            return engine.query_arrow(query).to_pandas()
+        finally:
+            engine.close()
+
     conn = get_snowflake_connection()
     try:
         df = pd.read_sql(query, conn)
@@ -185,76 +281,79 @@ def prepare_features(df):
     return X, y_classification, y_regression, label_encoders
 
 
-def train_classification_model(X, y):
+def train_classification_model(X, y, backend="gb", n_jobs=N_JOBS, log=print, timings=None, params=None):
     """Train binary classifier: Will promo be successful?"""
+    timings = {} if timings is None else timings
 
     # Split data
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=0.2, random_state=42, stratify=y
     )
 
-    print("\n=== Training Classification Model (Success Prediction) ===")
-    print(f"Training set: {len(X_train)} samples")
-    print(f"Test set: {len(X_test)} samples")
-    print(f"Positive class (successful): {y_train.sum()} ({y_train.mean():.1%})")
+    log("\n=== Training Classification Model (Success Prediction) ===")
+    log(f"Training set: {len(X_train)} samples")
+    log(f"Test set: {len(X_test)} samples")
+    log(f"Positive class (successful): {y_train.sum()} ({y_train.mean():.1%})")
 
     # Train Gradient Boosting Classifier
-    clf = GradientBoostingClassifier(
-        n_estimators=100, learning_rate=0.1, max_depth=4, random_state=42
-    )
+    clf = make_model("classifier", backend, params)
 
+    start = time.perf_counter()
     clf.fit(X_train, y_train)
+    timings["classifier fit"] = time.perf_counter() - start
+    if hasattr(clf, "n_iter_"):
+        log(f"Boosting iterations: {clf.n_iter_} of {clf.max_iter}")
 
     # Evaluate
     train_score = clf.score(X_train, y_train)
     test_score = clf.score(X_test, y_test)
 
-    print(f"\nTrain Accuracy: {train_score:.3f}")
-    print(f"Test Accuracy: {test_score:.3f}")
+    log(f"\nTrain Accuracy: {train_score:.3f}")
+    log(f"Test Accuracy: {test_score:.3f}")
 
-    # Cross-validation
-    cv_scores = cross_val_score(clf, X_train, y_train, cv=5)
-    print(f"Cross-Val Accuracy: {cv_scores.mean():.3f} (+/- {cv_scores.std():.3f})")
+    # Cross-validation (folds in parallel)
+    start = time.perf_counter()
+    cv_scores = cross_val_score(make_model("classifier", backend, params), X_train, y_train, cv=5, n_jobs=n_jobs)
+    timings["classifier cv"] = time.perf_counter() - start
+    log(f"Cross-Val Accuracy: {cv_scores.mean():.3f} (+/- {cv_scores.std():.3f})")
 
     # Detailed test set metrics
     y_pred = clf.predict(X_test)
-    print("\nClassification Report:")
-    print(
+    log("\nClassification Report:")
+    log(
         classification_report(
             y_test, y_pred, target_names=["Unsuccessful", "Successful"]
         )
     )
 
     # Feature importance
-    feature_importance = pd.DataFrame(
-        {"feature": X.columns, "importance": clf.feature_importances_}
-    ).sort_values("importance", ascending=False)
-
-    print("\nTop 5 Most Important Features:")
-    print(feature_importance.head())
+    print_feature_importance(clf, X.columns, log)
 
     return clf, X_test, y_test
 
 
-def train_regression_model(X, y):
+def train_regression_model(X, y, backend="gb", n_jobs=N_JOBS, log=print, timings=None, params=None):
     """Train regressor: Predict sales lift ratio"""
+    timings = {} if timings is None else timings
 
     # Split data
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=0.2, random_state=42
     )
 
-    print("\n\n=== Training Regression Model (Sales Lift Prediction) ===")
-    print(f"Training set: {len(X_train)} samples")
-    print(f"Test set: {len(X_test)} samples")
-    print(f"Mean sales lift: {y_train.mean():.3f}")
+    log("\n\n=== Training Regression Model (Sales Lift Prediction) ===")
+    log(f"Training set: {len(X_train)} samples")
+    log(f"Test set: {len(X_test)} samples")
+    log(f"Mean sales lift: {y_train.mean():.3f}")
 
     # Train Gradient Boosting Regressor
-    reg = GradientBoostingRegressor(
-        n_estimators=100, learning_rate=0.1, max_depth=4, random_state=42
-    )
+    reg = make_model("regressor", backend, params)
 
+    start = time.perf_counter()
     reg.fit(X_train, y_train)
+    timings["regressor fit"] = time.perf_counter() - start
+    if hasattr(reg, "n_iter_"):
+        log(f"Boosting iterations: {reg.n_iter_} of {reg.max_iter}")
 
     # Evaluate
     train_score = reg.score(X_train, y_train)
@@ -263,29 +362,171 @@ def train_regression_model(X, y):
     y_pred = reg.predict(X_test)
     mae = mean_absolute_error(y_test, y_pred)
 
-    print(f"\nTrain R² Score: {train_score:.3f}")
-    print(f"Test R² Score: {test_score:.3f}")
-    print(f"Mean Absolute Error: {mae:.3f}")
+    log(f"\nTrain R² Score: {train_score:.3f}")
+    log(f"Test R² Score: {test_score:.3f}")
+    log(f"Mean Absolute Error: {mae:.3f}")
 
-    # Cross-validation
-    cv_scores = cross_val_score(reg, X_train, y_train, cv=5, scoring="r2")
-    print(f"Cross-Val R² Score: {cv_scores.mean():.3f} (+/- {cv_scores.std():.3f})")
+    # Cross-validation (folds in parallel)
+    start = time.perf_counter()
+    cv_scores = cross_val_score(make_model("regressor", backend, params), X_train, y_train, cv=5, scoring="r2", n_jobs=n_jobs)
+    timings["regressor cv"] = time.perf_counter() - start
+    log(f"Cross-Val R² Score: {cv_scores.mean():.3f} (+/- {cv_scores.std():.3f})")
 
     # Feature importance
-    feature_importance = pd.DataFrame(
-        {"feature": X.columns, "importance": reg.feature_importances_}
-    ).sort_values("importance", ascending=False)
-
-    print("\nTop 5 Most Important Features:")
-    print(feature_importance.head())
+    print_feature_importance(reg, X.columns, log)
 
     return reg, X_test, y_test
 
 
-def save_models(clf, reg, label_encoders):
+def _share_jobs(n_jobs, parts):
+    """Workers for each of `parts` concurrent jobs out of n_jobs (joblib convention: -1 = all cores)."""
+    cores = os.cpu_count() or 1
+    total = n_jobs if n_jobs > 0 else max(1, cores + 1 + n_jobs)
+    return max(1, total // parts)
+
+
+def train_models(X, y_clf, y_reg, backend="gb", n_jobs=N_JOBS, parallel=True, timings=None, params=None):
+    """Train the classifier and the regressor, concurrently unless parallel=False.
+
+    params: optional {"classifier": {...}, "regressor": {...}} overrides (tuned settings).
+    Returns (clf, reg). Concurrent runs split n_jobs between the two models'
+    CV pools, buffer each model's report and print it in the usual order
+    once both are done.
+    """
+    timings = {} if timings is None else timings
+    params = params or {}
+    jobs = [
+        (train_classification_model, y_clf, params.get("classifier")),
+        (train_regression_model, y_reg, params.get("regressor")),
+    ]
+    if not parallel:
+        return tuple(train(X, y, backend, n_jobs, print, timings, p)[0] for train, y, p in jobs)
+
+    # Threads: the tree builders and the CV worker processes do not hold the GIL
+    reports = [[], []]
+    shared_jobs = _share_jobs(n_jobs, len(jobs))
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = [
+            pool.submit(train, X, y, backend, shared_jobs, report.append, timings, p)
+            for (train, y, p), report in zip(jobs, reports)
+        ]
+        models = [future.result()[0] for future in futures]
+    for report in reports:
+        for line in report:
+            print(line)
+    return tuple(models)
+
+
+def _plain(value):
+    """numpy scalars -> Python values, for JSON."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def tune_model(kind, X, y, backend="gb", n_jobs=N_JOBS, n_candidates=81, factor=3, min_resources=20, log=print):
+    """Successive-halving random search for one model.
+
+    Each round keeps the best 1/factor candidates and gives them `factor`
+    times more boosting iterations. The last round trains the backend's
+    default iteration count (BACKENDS), so tuned models are no bigger than
+    untuned ones; the first round starts at that count / factor ** (rounds - 1),
+    at least min_resources. Trials run in a loky process pool (n_jobs) and
+    read one memory-mapped copy of the training matrix; the 5 folds are
+    computed once and shared by every trial.
+    Returns (best params, leaderboard DataFrame); the params include the
+    settings the search pinned (early_stopping for hist), so the final fit
+    trains exactly what was scored.
+    """
+    from joblib import parallel_config  # joblib >= 1.3
+    from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+    from sklearn.model_selection import HalvingRandomSearchCV, KFold, StratifiedKFold
+
+    # Same hold-out split as training: the test rows never reach the search
+    stratify = y if kind == "classifier" else None
+    X_train, _, y_train, _ = train_test_split(X, y, test_size=0.2, random_state=42, stratify=stratify)
+    X_train = np.ascontiguousarray(X_train.to_numpy(dtype=np.float64))
+    y_train = y_train.to_numpy()
+    splitter = StratifiedKFold if kind == "classifier" else KFold
+    folds = list(splitter(n_splits=5, shuffle=True, random_state=42).split(X_train, y_train))
+
+    resource, space = TUNING_SPACES[backend]
+    pinned = {"early_stopping": False} if backend == "hist" else {}  # the search controls max_iter
+    estimator = make_model(kind, backend, pinned)
+    max_resources = BACKENDS[backend][2][resource]
+    rounds = 1
+    while factor ** rounds <= n_candidates and max_resources // factor ** rounds >= min_resources:
+        rounds += 1
+    first = max_resources // factor ** (rounds - 1)
+    search = HalvingRandomSearchCV(
+        estimator,
+        space,
+        n_candidates=n_candidates,
+        factor=factor,
+        resource=resource,
+        min_resources=first,
+        max_resources=first * factor ** (rounds - 1),
+        cv=folds,
+        scoring=TUNING_SCORING[kind],
+        refit=False,
+        n_jobs=n_jobs,
+        random_state=42,
+    )
+    log(f"\n=== Tuning {kind} ({backend}): {n_candidates} candidates, {rounds} rounds, n_jobs={n_jobs} ===")
+    # max_nbytes=0: memory-map X for the workers whatever its size; one thread per worker
+    with parallel_config(backend="loky", max_nbytes=0, inner_max_num_threads=1):
+        search.fit(X_train, y_train)
+
+    results = pd.DataFrame(search.cv_results_)
+    leaderboard = pd.DataFrame(
+        {
+            "model": kind,
+            "backend": backend,
+            "round": results["iter"],
+            "resource": resource,
+            "n_resources": results["n_resources"],
+            "score": results["mean_test_score"],
+            "score_std": results["std_test_score"],
+            "fit_seconds": results["mean_fit_time"],
+            "params": [json.dumps({k: _plain(v) for k, v in p.items()}) for p in results["params"]],
+        }
+    ).sort_values(["round", "score"], ascending=False, ignore_index=True)
+    for n_round, group in leaderboard.groupby("round"):
+        log(f"Round {n_round}: {len(group)} candidates × {group['n_resources'].iloc[0]} {resource}, best {group['score'].max():.3f}")
+    best = {**pinned, **{k: _plain(v) for k, v in search.best_params_.items()}}
+    log(f"Best {TUNING_SCORING[kind]}: {search.best_score_:.3f} with {best}")
+    return best, leaderboard
+
+
+def load_tuned_params(backend="gb", model_dir=MODEL_DIR):
+    """{"classifier": {...}, "regressor": {...}} saved by --tune for this backend, or {}."""
+    path = os.path.join(model_dir, TUNED_PARAMS_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        saved = json.load(f).get(backend, {})
+    return {kind: entry["params"] for kind, entry in saved.items()}
+
+
+def save_tuning(backend, results, leaderboards, model_dir=MODEL_DIR):
+    """Merge the best settings into best_params.json and write the leaderboard CSV."""
+    os.makedirs(model_dir, exist_ok=True)
+    path = os.path.join(model_dir, TUNED_PARAMS_FILE)
+    saved = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            saved = json.load(f)
+    saved[backend] = results
+    with open(path, "w") as f:
+        json.dump(saved, f, indent=2)
+    print(f"\n✓ Best settings saved to: {path}")
+
+    board_path = os.path.join(model_dir, LEADERBOARD_FILE)
+    pd.concat(leaderboards, ignore_index=True).to_csv(board_path, index=False)
+    print(f"✓ Leaderboard saved to: {board_path}")
+
+
+def save_models(clf, reg, label_encoders, model_dir=MODEL_DIR):
     """Save trained models and encoders"""
 
-    model_dir = os.path.join(os.path.dirname(__file__), "saved_models")
     os.makedirs(model_dir, exist_ok=True)
 
     # Save classifier
@@ -306,33 +547,211 @@ def save_models(clf, reg, label_encoders):
         pickle.dump(label_encoders, f)
     print(f"✓ Label encoders saved to: {le_path}")
 
+    export_models(clf, reg, label_encoders, model_dir)
+
 
-def main():
+def flatten_tree_ensemble(model):
+    """Flat node arrays of a fitted binary classifier or regressor (GradientBoosting* or HistGradientBoosting*).
+
+    All trees are concatenated: node i tests feature[i] <= threshold[i] and goes
+    to left[i] / right[i] (global indices, NaN follows missing_left[i] when
+    allow_nan, i.e. for HistGradientBoosting); leaves
+    point to themselves and carry value[i], already scaled by the learning rate.
+    The prediction is ((init + tree 0) + tree 1) + ..., in the same order as
+    sklearn, with inputs compared in compare_dtype (float32 for GradientBoosting,
+    float64 for HistGradientBoosting), so the evaluator in streamlit/_trees.py
+    reproduces predict() / decision_function() bit for bit.
+    """
+    is_classifier = hasattr(model, "classes_")
+    if is_classifier and (len(model.classes_) != 2 or model.loss != "log_loss"):
+        raise ValueError("Only binary log-loss classifiers can be exported")
+    if not is_classifier and getattr(model, "loss", "squared_error") in ("poisson", "gamma"):
+        raise ValueError(f"Loss {model.loss!r} has a non-identity link and cannot be exported")
+
+    trees = []  # (feature, threshold, left, right, value, missing_left, is_leaf, depth)
+    if hasattr(model, "estimators_"):
+        init = model._raw_predict_init(np.zeros((1, model.n_features_in_), dtype=np.float32))[0, 0]
+        compare_dtype, allow_nan = "float32", False
+        for estimator in model.estimators_[:, 0]:
+            tree = estimator.tree_
+            is_leaf = tree.children_left == -1
+            trees.append(
+                (
+                    tree.feature, tree.threshold, tree.children_left, tree.children_right,
+                    model.learning_rate * tree.value[:, 0, 0], np.zeros(tree.node_count, dtype=bool),
+                    is_leaf, tree.max_depth,
+                )
+            )
+    else:
+        init = np.ravel(model._baseline_prediction)[0]
+        compare_dtype, allow_nan = "float64", True
+        for predictors in model._predictors:
+            nodes = predictors[0].nodes
+            if nodes["is_categorical"].any():
+                raise ValueError("Categorical splits cannot be exported")
+            is_leaf = nodes["is_leaf"].astype(bool)
+            trees.append(
+                (
+                    nodes["feature_idx"], nodes["num_threshold"], nodes["left"], nodes["right"],
+                    nodes["value"], nodes["missing_go_to_left"].astype(bool), is_leaf, int(nodes["depth"].max()),
+                )
+            )
+
+    feature, threshold, left, right, value, missing_left, roots = [], [], [], [], [], [], []
+    offset = 0
+    for tree_feature, tree_threshold, tree_left, tree_right, tree_value, tree_missing, is_leaf, _ in trees:
+        own = np.arange(len(is_leaf)) + offset
+        roots.append(offset)
+        feature.append(np.where(is_leaf, 0, tree_feature))
+        threshold.append(np.where(is_leaf, 0.0, tree_threshold))
+        left.append(np.where(is_leaf, own, np.asarray(tree_left) + offset))
+        right.append(np.where(is_leaf, own, np.asarray(tree_right) + offset))
+        value.append(np.where(is_leaf, tree_value, 0.0))
+        missing_left.append(tree_missing & ~is_leaf)
+        offset += len(is_leaf)
+
+    return {
+        "format_version": np.array(1),
+        "kind": np.array("classifier" if is_classifier else "regressor"),
+        "classes": np.asarray(model.classes_) if is_classifier else np.array([]),
+        "feature_names": np.asarray(getattr(model, "feature_names_in_", []), dtype=str),
+        "compare_dtype": np.array(compare_dtype),
+        "allow_nan": np.array(allow_nan),
+        "init": np.array(init, dtype=np.float64),
+        "depth": np.array(max(t[-1] for t in trees)),
+        "roots": np.array(roots, dtype=np.int32),
+        "feature": np.concatenate(feature).astype(np.int32),
+        "threshold": np.concatenate(threshold).astype(np.float64),
+        "left": np.concatenate(left).astype(np.int32),
+        "right": np.concatenate(right).astype(np.int32),
+        "value": np.concatenate(value).astype(np.float64),
+        "missing_left": np.concatenate(missing_left),
+    }
+
+
+def export_models(clf, reg, label_encoders, model_dir=MODEL_DIR):
+    """Write the .npz / .json files served by streamlit/_scoring.py without sklearn."""
+    for name, model in (("promo_classifier", clf), ("promo_regressor", reg)):
+        path = os.path.join(model_dir, f"{name}.npz")
+        np.savez(path, **flatten_tree_ensemble(model))
+        print(f"✓ Exported {name} to: {path}")
+
+    path = os.path.join(model_dir, "label_encoders.json")
+    with open(path, "w") as f:
+        json.dump({column: [str(c) for c in le.classes_] for column, le in label_encoders.items()}, f, indent=2)
+    print(f"✓ Exported label encoders to: {path}")
+
+
+def export_saved_models(model_dir=MODEL_DIR):
+    """Export the models already pickled in model_dir (no training)."""
+    loaded = []
+    for name in ("promo_classifier", "promo_regressor", "label_encoders"):
+        with open(os.path.join(model_dir, f"{name}.pkl"), "rb") as f:
+            loaded.append(pickle.load(f))
+    export_models(*loaded, model_dir)
+
+
+STAGES = ["load", "prepare", "classifier tuning", "regressor tuning", "classifier fit", "classifier cv", "regressor fit", "regressor cv"]
+
+
+def print_timings(timings):
+    # The two models finish in any order when trained concurrently
+    order = [s for s in STAGES if s in timings] + [s for s in timings if s not in STAGES]
+    print("\nStage timings:")
+    for stage in order:
+        seconds = timings[stage]
+        print(f"   {stage:<16} {seconds:8.2f}s")
+
+
+def main(argv=None):
     """Main training pipeline"""
 
+    parser = argparse.ArgumentParser(description="Train the promo success / sales lift models")
+    parser.add_argument(
+        "--backend", choices=sorted(BACKENDS), default="gb",
+        help="gb = GradientBoosting* (default), hist = HistGradientBoosting* with early stopping",
+    )
+    parser.add_argument("--n-jobs", type=int, default=N_JOBS, help="workers for the CV folds (-1 = all cores)")
+    parser.add_argument("--sequential", action="store_true", help="train the two models one after the other")
+    parser.add_argument("--model-dir", default=MODEL_DIR, help="where to write the .pkl files")
+    parser.add_argument(
+        "--tune", action="store_true",
+        help=f"successive-halving search first; the best settings go to {TUNED_PARAMS_FILE} and are used from then on",
+    )
+    parser.add_argument("--candidates", type=int, default=81, help="configurations sampled by --tune (default 81)")
+    parser.add_argument("--defaults", action="store_true", help=f"ignore {TUNED_PARAMS_FILE}")
+    parser.add_argument(
+        "--export-only", action="store_true",
+        help="only convert the saved .pkl models to the .npz files used for serving",
+    )
+    args = parser.parse_args(argv)
+
+    if args.export_only:
+        export_saved_models(args.model_dir)
+        return
+
     print("=" * 70)
     print("PROMO ROI OPTIMIZER - MODEL TRAINING")
     print("=" * 70)
+    timings = {}
+    total = time.perf_counter()
 
     # Load data
     print("\n1. Loading training data from Snowflake...")
+    start = time.perf_counter()
     df = load_training_data()
+    timings["load"] = time.perf_counter() - start
 
     # Prepare features
     print("\n2. Preparing features...")
+    start = time.perf_counter()
     X, y_clf, y_reg, label_encoders = prepare_features(df)
-
-    # Train classification model
-    print("\n3. Training classification model...")
-    clf, X_test_clf, y_test_clf = train_classification_model(X, y_clf)
-
-    # Train regression model
-    print("\n4. Training regression model...")
-    reg, X_test_reg, y_test_reg = train_regression_model(X, y_reg)
+    timings["prepare"] = time.perf_counter() - start
+
+    step = 3
+    params = {} if args.defaults else load_tuned_params(args.backend, args.model_dir)
+    if args.tune:
+        # Tune (one model at a time, each using the whole process pool)
+        print(f"\n{step}. Tuning hyperparameters (successive halving)...")
+        step += 1
+        results, leaderboards = {}, []
+        for kind, y in (("classifier", y_clf), ("regressor", y_reg)):
+            start = time.perf_counter()
+            best, leaderboard = tune_model(kind, X, y, args.backend, args.n_jobs, args.candidates)
+            timings[f"{kind} tuning"] = time.perf_counter() - start
+            final = leaderboard[leaderboard["round"] == leaderboard["round"].max()]
+            results[kind] = {
+                "params": best,
+                "score": float(final["score"].max()),
+                "scoring": TUNING_SCORING[kind],
+                "candidates": args.candidates,
+                "seconds": round(timings[f"{kind} tuning"], 2),
+                "tuned_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            leaderboards.append(leaderboard)
+            params[kind] = best
+        save_tuning(args.backend, results, leaderboards, args.model_dir)
+    if params:
+        print(f"\nUsing tuned settings: {params}")
+
+    # Train both models
+    mode = "one after the other" if args.sequential else "concurrently"
+    print(f"\n{step}. Training classification and regression models {mode} ({args.backend}, n_jobs={args.n_jobs})...")
+    step += 1
+    start = time.perf_counter()
+    clf, reg = train_models(
+        X, y_clf, y_reg, backend=args.backend, n_jobs=args.n_jobs, parallel=not args.sequential,
+        timings=timings, params=params,
+    )
+    timings["training (wall)"] = time.perf_counter() - start
 
     # Save models
-    print("\n5. Saving models...")
-    save_models(clf, reg, label_encoders)
+    print(f"\n{step}. Saving models...")
+    start = time.perf_counter()
+    save_models(clf, reg, label_encoders, args.model_dir)
+    timings["save"] = time.perf_counter() - start
+    timings["total"] = time.perf_counter() - total
+    print_timings(timings)
 
     print("\n" + "=" * 70)
     print("TRAINING COMPLETE!")
@@ -0,0 +1,3 @@
+from _dashboards import render_page
+
+render_page("planner")
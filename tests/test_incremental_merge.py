@@ -0,0 +1,139 @@
+"""
+Incremental SILVER refresh vs full rebuild
+Replays delta sequences through sql/phase_1/7_incremental_merge.sql and
+checks that SILVER ends up as 5_clean_data.sql would build it from the whole
+BRONZE history. Runs on DuckDB through the local engine's translation; a
+BRONZE stream is emulated by a table holding the rows of one delta.
+"""
+
+import pytest
+
+duckdb = pytest.importorskip("duckdb")
+
+from pipeline.incremental import FULL_BUILD_SCRIPT, load_merges  # noqa: E402
+from pipeline.local_engine import _SKIPPED, translate  # noqa: E402
+from pipeline.sql_script import read_statements  # noqa: E402
+
+CREATE_SCRIPT = FULL_BUILD_SCRIPT.replace("5_clean_data.sql", "2_create_tables.sql")
+
+
+def _run(con, path):
+    for sql in read_statements(path):
+        if _SKIPPED.match(sql) or sql.upper().startswith("USE"):
+            continue
+        con.execute(translate(sql))
+
+
+def _bronze(con, table, rows):
+    placeholders = ", ".join(["?"] * len(rows[0]))
+    con.executemany(f"INSERT INTO BRONZE.{table} VALUES ({placeholders})", rows)
+
+
+def _merge(con, table, rows):
+    """Append rows to BRONZE.table and MERGE them, as a stream would deliver them."""
+    _, merges = load_merges()
+    [(_, stream, statements)] = [m for m in merges if m[1] == f"BRONZE.{table}_STREAM"]
+    _bronze(con, table, rows)
+    con.execute(f"CREATE TABLE {stream} AS SELECT * FROM BRONZE.{table} LIMIT 0")
+    _bronze(con, f"{table}_STREAM", rows)
+    for sql in statements:
+        con.execute(translate(sql))
+    con.execute(f"DROP TABLE {stream}")
+
+
+def _silver(con, table):
+    return con.execute(f"SELECT * FROM SILVER.{table} ORDER BY ALL").fetchall()
+
+
+def _incremental_vs_full(table, silver, history, deltas):
+    """SILVER after full build + MERGEs of each delta, and after one full build of everything."""
+    results = []
+    for incremental in (True, False):
+        con = duckdb.connect()
+        for schema in ("BRONZE", "SILVER"):
+            con.execute(f"CREATE SCHEMA {schema}")
+        _run(con, CREATE_SCRIPT)
+        _bronze(con, table, history)
+        if incremental:
+            _run(con, FULL_BUILD_SCRIPT)
+            for rows in deltas:
+                _merge(con, table, rows)
+        else:
+            for rows in deltas:
+                _bronze(con, table, rows)
+            _run(con, FULL_BUILD_SCRIPT)
+        results.append(_silver(con, silver))
+        con.close()
+    return results
+
+
+def _txn(transaction_id, day, amount):
+    return (transaction_id, f"2024-01-{day:02d}", "Sale", amount, "Card", "Shop", "Europe", "4000")
+
+
+TRANSACTION_SEQUENCES = {
+    "new keys": (
+        [_txn("T1", 1, 10), _txn("T2", 2, 20)],
+        [[_txn("T3", 3, 30)], [_txn("T4", 4, 40), _txn("T5", 5, -1)]],
+    ),
+    "newer row replaces": (
+        [_txn("T1", 1, 10), _txn("T2", 2, 20)],
+        [[_txn("T1", 5, 15)], [_txn("T2", 6, 25), _txn("T2", 7, 26)]],
+    ),
+    "older row is ignored": (
+        [_txn("T1", 5, 10)],
+        [[_txn("T1", 1, 99)], [_txn("T1", 3, 98), _txn("T2", 2, 20)]],
+    ),
+    "newer failing row deletes the key": (
+        [_txn("T1", 1, 10), _txn("T2", 2, 20)],
+        [[_txn("T1", 5, 0)], [_txn("T2", 6, -3), _txn("T3", 6, 30)]],
+    ),
+    "rejected key comes back newer": (
+        [_txn("T1", 1, 10)],
+        [[_txn("T1", 5, -1)], [_txn("T1", 9, 12)]],
+    ),
+    "older row after a rejected winner": (
+        [_txn("T1", 5, -1)],
+        [[_txn("T1", 1, 10)], [_txn("T1", 3, 11), _txn("T1", 7, 0)], [_txn("T1", 6, 12)]],
+    ),
+}
+
+
+@pytest.mark.parametrize("history, deltas", TRANSACTION_SEQUENCES.values(), ids=TRANSACTION_SEQUENCES.keys())
+def test_transactions_merge_matches_full_build(history, deltas):
+    incremental, full = _incremental_vs_full("FINANCIAL_TRANSACTIONS", "FINANCIAL_TRANSACTIONS_CLEAN", history, deltas)
+    assert incremental == full
+
+
+def _promo(promotion_id, day, discount):
+    return (promotion_id, "Snacks", "Flash Sale", discount, f"2024-02-{day:02d}", f"2024-02-{day + 5:02d}", "Europe")
+
+
+def test_promotions_merge_matches_full_build():
+    history = [_promo("P1", 1, 0.1), _promo("P2", 2, 0.2)]
+    deltas = [
+        [_promo("P1", 4, 0.15), _promo("P3", 3, 0.3)],
+        [_promo("P2", 1, 0.25), _promo("P4", 4, 1.5)],  # older row, then an invalid discount
+    ]
+    incremental, full = _incremental_vs_full("PROMOTIONS_DATA", "PROMOTIONS_CLEAN", history, deltas)
+    assert incremental == full
+
+
+def _campaign(budget, reach):
+    return ("C1", "Spring", "Email", "Snacks", "Families", "2024-03-01", "2024-03-31", "Europe", budget, reach, 0.1)
+
+
+@pytest.mark.parametrize("deltas", [[[_campaign(50, 10)]], [[_campaign(50, 10)], [_campaign(200, 5)]]])
+def test_campaigns_merge_matches_full_build(deltas):
+    # Winner rejected for its reach, then a smaller budget (loses) and a larger one (wins)
+    history = [_campaign(100, -1)]
+    incremental, full = _incremental_vs_full("MARKETING_CAMPAIGNS", "MARKETING_CAMPAIGNS_CLEAN", history, deltas)
+    assert incremental == full
+
+
+def test_rejected_null_budget_loses_to_any_budget():
+    history = [_campaign(None, 10)]
+    deltas = [[_campaign(10, 10)]]
+    incremental, full = _incremental_vs_full("MARKETING_CAMPAIGNS", "MARKETING_CAMPAIGNS_CLEAN", history, deltas)
+    assert incremental == full
+    assert len(full) == 1